@@ -1,9 +1,14 @@
+import asyncio
 import hashlib
 import uuid
+import weakref
+from dataclasses import dataclass
 
 import redis
+import redis.asyncio as redis_async
 
 from app.core.config import settings
+from app.metrics import InstrumentedAsyncRedis, InstrumentedRedis
 
 REDIS_HOST = settings.redis_cache_host
 REDIS_PORT = settings.redis_cache_port_value
@@ -13,18 +18,68 @@ EVENTS_REDIS_PORT = settings.redis_events_port_value
 DEBATE_CACHE_ENABLED = settings.enable_debate_cache
 DEBATE_CACHE_TTL_SECONDS = settings.debate_cache_entry_ttl_seconds
 DEBATE_LOCK_TTL_SECONDS = settings.debate_generation_lock_ttl_seconds
+SHARED_DEBATE_CACHE_ENABLED = settings.enable_shared_debate_cache
+SHARED_DEBATE_CACHE_TTL_SECONDS = settings.shared_debate_cache_ttl_seconds
+SHARED_DEBATE_CACHE_MAX_ENTRIES = settings.shared_debate_cache_max_entries
 
-redis_client = redis.Redis(
+redis_client = InstrumentedRedis(
     host=REDIS_HOST,
     port=REDIS_PORT,
     decode_responses=True,
+    metrics_client="cache",
 )
-events_redis_client = redis.Redis(
+events_redis_client = InstrumentedRedis(
     host=EVENTS_REDIS_HOST,
     port=EVENTS_REDIS_PORT,
     decode_responses=True,
+    metrics_client="events",
 )
 
+ASYNC_POOL_MAX_CONNECTIONS = settings.redis_async_pool_max_connections
+ASYNC_POOL_TIMEOUT_SECONDS = settings.redis_async_pool_timeout_seconds
+
+# redis.asyncio connections are bound to the loop that opened them, so async
+# clients are created lazily per running loop rather than at import time.
+_async_redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, redis_async.Redis]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_events_redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, redis_async.Redis]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_redis_client() -> redis_async.Redis:
+    """Cache/lock client backed by one bounded pool per event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_redis_clients.get(loop)
+    if client is None:
+        pool = redis_async.BlockingConnectionPool(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            max_connections=ASYNC_POOL_MAX_CONNECTIONS,
+            timeout=ASYNC_POOL_TIMEOUT_SECONDS,
+            decode_responses=True,
+        )
+        client = InstrumentedAsyncRedis(connection_pool=pool, metrics_client="cache")
+        _async_redis_clients[loop] = client
+    return client
+
+
+def get_async_events_redis_client() -> redis_async.Redis:
+    """Event stream client; kept off the cache pool because SSE readers hold
+    a connection for the whole blocking XREAD."""
+    loop = asyncio.get_running_loop()
+    client = _async_events_redis_clients.get(loop)
+    if client is None:
+        client = InstrumentedAsyncRedis(
+            host=EVENTS_REDIS_HOST,
+            port=EVENTS_REDIS_PORT,
+            decode_responses=True,
+            metrics_client="events",
+        )
+        _async_events_redis_clients[loop] = client
+    return client
+
 
 def _normalize_cache_input(value: str) -> str:
     if value is None:
@@ -33,6 +88,17 @@ def _normalize_cache_input(value: str) -> str:
     return collapsed.lower()
 
 
+def _debate_digest(topic: str, debater_1: str, debater_2: str) -> str:
+    normalized = "|".join(
+        [
+            _normalize_cache_input(topic),
+            _normalize_cache_input(debater_1),
+            _normalize_cache_input(debater_2),
+        ]
+    )
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
 def build_cache_key(
     topic: str,
     debater_1: str,
@@ -41,15 +107,12 @@ def build_cache_key(
     session_id: str,
 ) -> str:
     scope = f"user:{user_id}" if user_id else f"session:{session_id}"
-    normalized = "|".join(
-        [
-            _normalize_cache_input(topic),
-            _normalize_cache_input(debater_1),
-            _normalize_cache_input(debater_2),
-        ]
-    )
-    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
-    return f"debate:cache:{scope}:{digest}"
+    return f"debate:cache:{scope}:{_debate_digest(topic, debater_1, debater_2)}"
+
+
+def build_shared_cache_key(topic: str, debater_1: str, debater_2: str) -> str:
+    """Owner-independent key for the shared tier; maps to a completed debate id."""
+    return f"debate:shared:{_debate_digest(topic, debater_1, debater_2)}"
 
 
 def build_lock_key(cache_key: str) -> str:
@@ -74,21 +137,148 @@ def acquire_generation_lock(lock_key: str, ttl_seconds: int) -> str | None:
     return token if acquired else None
 
 
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+else
+    return 0
+end
+"""
+
+
 def release_generation_lock(lock_key: str, token: str) -> bool:
-    script = """
-    if redis.call("GET", KEYS[1]) == ARGV[1] then
-        return redis.call("DEL", KEYS[1])
-    else
-        return 0
-    end
-    """
     try:
-        result = redis_client.eval(script, 1, lock_key, token)
+        result = redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
         return result == 1
     except redis.RedisError:
         return False
 
 
+CLAIM_CACHED = "cached"
+CLAIM_INFLIGHT = "inflight"
+CLAIM_ACQUIRED = "claimed"
+CLAIM_BUSY = "busy"
+
+# One round trip that either joins existing work or claims it. The claimant
+# publishes the inflight key itself once the debate row is committed, so a
+# caller that sees the lock without an inflight id is told to retry.
+_CLAIM_OR_JOIN_SCRIPT = """
+local cached = redis.call("GET", KEYS[1])
+if cached then
+    return {"cached", cached}
+end
+local inflight = redis.call("GET", KEYS[3])
+if inflight then
+    return {"inflight", inflight}
+end
+if redis.call("SET", KEYS[2], ARGV[1], "NX", "EX", ARGV[3]) then
+    return {"claimed", ARGV[2]}
+end
+return {"busy", ""}
+"""
+_CLAIM_OR_JOIN_SHA = hashlib.sha1(_CLAIM_OR_JOIN_SCRIPT.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class GenerationClaim:
+    outcome: str
+    debate_id: str | None
+    lock_token: str | None = None
+
+
+def _claim_from_reply(reply: list, token: str) -> GenerationClaim:
+    outcome, debate_id = reply[0], reply[1] or None
+    return GenerationClaim(
+        outcome=outcome,
+        debate_id=debate_id,
+        lock_token=token if outcome == CLAIM_ACQUIRED else None,
+    )
+
+
+def claim_or_join_generation(
+    cache_key: str,
+    lock_key: str,
+    inflight_key: str,
+    debate_id: str,
+    ttl_seconds: int,
+) -> GenerationClaim:
+    token = uuid.uuid4().hex
+    keys_and_args = (cache_key, lock_key, inflight_key, token, debate_id, ttl_seconds)
+    try:
+        reply = redis_client.evalsha(_CLAIM_OR_JOIN_SHA, 3, *keys_and_args)
+    except redis.exceptions.NoScriptError:
+        reply = redis_client.eval(_CLAIM_OR_JOIN_SCRIPT, 3, *keys_and_args)
+    return _claim_from_reply(reply, token)
+
+
+# Shared tier: one completed debate per normalized topic and debater pair,
+# reused by every owner. Entries expire after their own TTL and are also
+# ranked by last use in a sorted set so the tier stays bounded; hits, misses,
+# stores and evictions are counted in a hash.
+SHARED_CACHE_LRU_KEY = "debate:shared-index:lru"
+SHARED_CACHE_STATS_KEY = "debate:shared-index:stats"
+
+_SHARED_LOOKUP_SCRIPT = """
+local debate_id = redis.call("GET", KEYS[1])
+if debate_id then
+    local clock = redis.call("TIME")
+    local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+    redis.call("ZADD", KEYS[2], now, KEYS[1])
+    redis.call("HINCRBY", KEYS[3], "hits", 1)
+    return debate_id
+end
+redis.call("ZREM", KEYS[2], KEYS[1])
+redis.call("HINCRBY", KEYS[3], "misses", 1)
+return false
+"""
+
+# Evicted entry keys are not declared in KEYS; fine on a single Redis node,
+# which is how the cache is deployed.
+_SHARED_STORE_SCRIPT = """
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local ttl = tonumber(ARGV[2])
+local max_entries = tonumber(ARGV[3])
+redis.call("SET", KEYS[1], ARGV[1], "EX", ttl)
+redis.call("ZADD", KEYS[2], now, KEYS[1])
+redis.call("HINCRBY", KEYS[3], "stores", 1)
+-- Members not used for a whole TTL have certainly expired already.
+redis.call("ZREMRANGEBYSCORE", KEYS[2], "-inf", now - ttl * 1000)
+local excess = redis.call("ZCARD", KEYS[2]) - max_entries
+if excess > 0 then
+    local victims = redis.call("ZRANGE", KEYS[2], 0, excess - 1)
+    for _, key in ipairs(victims) do
+        redis.call("DEL", key)
+    end
+    redis.call("ZREMRANGEBYRANK", KEYS[2], 0, excess - 1)
+    redis.call("HINCRBY", KEYS[3], "evictions", #victims)
+end
+return excess > 0 and excess or 0
+"""
+
+
+def _shared_keys(shared_key: str) -> tuple[str, str, str]:
+    return shared_key, SHARED_CACHE_LRU_KEY, SHARED_CACHE_STATS_KEY
+
+
+def get_shared_cache_stats() -> dict:
+    stats = redis_client.hgetall(SHARED_CACHE_STATS_KEY)
+    hits = int(stats.get("hits", 0))
+    misses = int(stats.get("misses", 0))
+    lookups = hits + misses
+    return {
+        "enabled": SHARED_DEBATE_CACHE_ENABLED,
+        "entries": redis_client.zcard(SHARED_CACHE_LRU_KEY),
+        "max_entries": SHARED_DEBATE_CACHE_MAX_ENTRIES,
+        "ttl_seconds": SHARED_DEBATE_CACHE_TTL_SECONDS,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups else 0.0,
+        "stores": int(stats.get("stores", 0)),
+        "evictions": int(stats.get("evictions", 0)),
+    }
+
+
 def set_inflight_debate_id(inflight_key: str, debate_id: str, ttl_seconds: int) -> None:
     redis_client.setex(inflight_key, ttl_seconds, debate_id)
 
@@ -99,3 +289,85 @@ def get_inflight_debate_id(inflight_key: str) -> str | None:
 
 def delete_inflight_debate_id(inflight_key: str) -> None:
     redis_client.delete(inflight_key)
+
+
+# Async counterparts for the API process and the async flow steps. The sync
+# helpers above remain for Celery-only code paths.
+
+
+async def get_cached_debate_id_async(cache_key: str) -> str | None:
+    return await get_async_redis_client().get(cache_key)
+
+
+async def set_cached_debate_id_async(cache_key: str, debate_id: str, ttl_seconds: int) -> None:
+    await get_async_redis_client().setex(cache_key, ttl_seconds, debate_id)
+
+
+async def acquire_generation_lock_async(lock_key: str, ttl_seconds: int) -> str | None:
+    token = uuid.uuid4().hex
+    acquired = await get_async_redis_client().set(lock_key, token, nx=True, ex=ttl_seconds)
+    return token if acquired else None
+
+
+async def release_generation_lock_async(lock_key: str, token: str) -> bool:
+    try:
+        result = await get_async_redis_client().eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        return result == 1
+    except redis.RedisError:
+        return False
+
+
+async def set_inflight_debate_id_async(inflight_key: str, debate_id: str, ttl_seconds: int) -> None:
+    await get_async_redis_client().setex(inflight_key, ttl_seconds, debate_id)
+
+
+async def get_inflight_debate_id_async(inflight_key: str) -> str | None:
+    return await get_async_redis_client().get(inflight_key)
+
+
+async def delete_inflight_debate_id_async(inflight_key: str) -> None:
+    await get_async_redis_client().delete(inflight_key)
+
+
+async def claim_or_join_generation_async(
+    cache_key: str,
+    lock_key: str,
+    inflight_key: str,
+    debate_id: str,
+    ttl_seconds: int,
+) -> GenerationClaim:
+    client = get_async_redis_client()
+    token = uuid.uuid4().hex
+    keys_and_args = (cache_key, lock_key, inflight_key, token, debate_id, ttl_seconds)
+    try:
+        reply = await client.evalsha(_CLAIM_OR_JOIN_SHA, 3, *keys_and_args)
+    except redis.exceptions.NoScriptError:
+        reply = await client.eval(_CLAIM_OR_JOIN_SCRIPT, 3, *keys_and_args)
+    return _claim_from_reply(reply, token)
+
+
+async def get_shared_debate_id_async(shared_key: str) -> str | None:
+    return await get_async_redis_client().eval(_SHARED_LOOKUP_SCRIPT, 3, *_shared_keys(shared_key))
+
+
+async def set_shared_debate_id_async(
+    shared_key: str,
+    debate_id: str,
+    ttl_seconds: int = SHARED_DEBATE_CACHE_TTL_SECONDS,
+    max_entries: int = SHARED_DEBATE_CACHE_MAX_ENTRIES,
+) -> int:
+    """Publish a completed debate to the shared tier; returns entries evicted."""
+    return await get_async_redis_client().eval(
+        _SHARED_STORE_SCRIPT,
+        3,
+        *_shared_keys(shared_key),
+        debate_id,
+        ttl_seconds,
+        max_entries,
+    )
+
+
+async def delete_shared_debate_id_async(shared_key: str) -> None:
+    client = get_async_redis_client()
+    await client.delete(shared_key)
+    await client.zrem(SHARED_CACHE_LRU_KEY, shared_key)
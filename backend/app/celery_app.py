@@ -21,7 +21,7 @@ celery_app = Celery(
     "debate",
     broker=_broker_url,
     backend=_build_result_backend_url(_broker_url),
-    include=["app.tasks.debate_tasks"],
+    include=["app.tasks.debate_tasks", "app.tasks.maintenance_tasks"],
 )
 
 celery_app.conf.update(
@@ -30,4 +30,15 @@ celery_app.conf.update(
     result_serializer="json",
     task_track_started=True,
     worker_prefetch_multiplier=1,
+    # Debates are I/O bound on LLM calls, so one process runs several of them
+    # on a shared event loop (see app.tasks.debate_tasks).
+    worker_pool="threads",
+    worker_concurrency=settings.worker_debate_concurrency,
 )
+
+celery_app.conf.beat_schedule = {
+    "debate-retention-cleanup": {
+        "task": "debate.cleanup_retention",
+        "schedule": settings.retention_cleanup_interval_seconds,
+    },
+}
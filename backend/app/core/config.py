@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,6 +29,25 @@ class Settings(BaseSettings):
         default=None,
         description="Optional full database URL; if unset, SQLite is used.",
     )
+    database_read_url_override: str | None = Field(
+        default=None,
+        description="Optional read replica URL used by the debate list and analytics queries.",
+    )
+    db_pool_size: int = Field(
+        default=10,
+        ge=1,
+        description="Connection pool size for server databases.",
+    )
+    db_max_overflow: int = Field(
+        default=20,
+        ge=0,
+        description="Extra connections allowed above db_pool_size for server databases.",
+    )
+    db_pool_recycle_seconds: int = Field(
+        default=1800,
+        ge=-1,
+        description="Recycle server database connections older than this (-1 disables).",
+    )
 
     # SQLite Settings
     sqlite_database_path: Path = Field(
@@ -49,6 +69,37 @@ class Settings(BaseSettings):
         ge=0,
         description="SQLite busy timeout (ms).",
     )
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = Field(
+        default="WAL",
+        description="SQLite journal mode applied to every connection.",
+    )
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL",
+        description="SQLite synchronous level; NORMAL is durable enough with WAL.",
+    )
+    sqlite_mmap_size_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="Bytes of the SQLite file to memory-map for reads (0 disables).",
+    )
+    sqlite_cache_size_kib: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="SQLite page cache per connection (KiB).",
+    )
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = Field(
+        default="MEMORY",
+        description="Where SQLite keeps temporary tables and indices.",
+    )
+    sqlite_pool_size: int = Field(
+        default=5,
+        ge=1,
+        description="Connections per SQLite engine (the write and read engines each get a pool).",
+    )
+    sqlite_read_engine_enabled: bool = Field(
+        default=True,
+        description="Serve list/analytics queries from a separate read-only SQLite engine.",
+    )
 
     session_expiration_seconds: int = Field(
         default=24 * 60 * 60,
@@ -58,6 +109,26 @@ class Settings(BaseSettings):
         default=7 * 24 * 60 * 60,
         description="How long debate records are kept before cleanup.",
     )
+    retention_cleanup_interval_seconds: int = Field(
+        default=60 * 60,
+        ge=1,
+        description="How often celery-beat schedules the session/debate retention cleanup.",
+    )
+    retention_cleanup_batch_size: int = Field(
+        default=500,
+        ge=1,
+        description="Rows deleted per transaction by the retention cleanup.",
+    )
+    debates_page_size_default: int = Field(
+        default=50,
+        ge=1,
+        description="Debates returned per page by /debates and /debates/overview when no limit is given.",
+    )
+    debates_page_size_max: int = Field(
+        default=200,
+        ge=1,
+        description="Largest limit accepted by /debates and /debates/overview.",
+    )
 
     # Shared Redis fallback (legacy)
     redis_hostname: str = Field(
@@ -87,6 +158,16 @@ class Settings(BaseSettings):
         le=65535,
         description="Redis port for debate event streams.",
     )
+    redis_async_pool_max_connections: int = Field(
+        default=64,
+        ge=1,
+        description="Max connections in each process's async Redis cache/lock pool.",
+    )
+    redis_async_pool_timeout_seconds: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="How long an async Redis call waits for a free pooled connection.",
+    )
     celery_broker_url: str | None = Field(
         default=None,
         description="Optional Celery broker URL; defaults to Redis host/port.",
@@ -96,6 +177,76 @@ class Settings(BaseSettings):
         description="Optional Celery result backend URL; defaults to broker URL.",
     )
 
+    # Personas
+    personas_dir: str = Field(
+        default="personas",
+        description="Directory of debater persona YAML files.",
+    )
+    persona_reload_interval_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description="Minimum seconds between checks of the persona directory for changed files.",
+    )
+
+    # Web search
+    web_search_backend: Literal["duckduckgo", "fixture", "fake"] = Field(
+        default="duckduckgo",
+        description="Search backend for the web_search tool; fixture reads WEB_SEARCH_FIXTURE_PATH, fake generates results.",
+    )
+    fake_search_latency_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Simulated latency of each fake web search.",
+    )
+    web_search_fixture_path: str | None = Field(
+        default=None,
+        description="JSON file mapping queries to result text, used by the fixture backend.",
+    )
+    web_search_timeout_seconds: float = Field(
+        default=8.0,
+        gt=0,
+        description="Give up on a single web search after this long.",
+    )
+    web_search_cache_enabled: bool = Field(
+        default=True,
+        description="Cache web search results in process and in Redis.",
+    )
+    web_search_cache_ttl_seconds: int = Field(
+        default=6 * 60 * 60,
+        ge=1,
+        description="TTL for cached web search results.",
+    )
+    web_search_cache_error_ttl_seconds: int = Field(
+        default=60,
+        ge=1,
+        description="TTL for cached web search failures.",
+    )
+    web_search_cache_local_max_entries: int = Field(
+        default=512,
+        ge=1,
+        description="Web search results kept in each process's LRU.",
+    )
+    web_search_cache_stats_flush_seconds: float = Field(
+        default=10.0,
+        ge=0,
+        description="Longest time a process holds search cache lookup counts before adding them to the shared stats.",
+    )
+    search_prefetch_enabled: bool = Field(
+        default=True,
+        description="Prefetch topic-derived web searches while the presenter introduction is generated.",
+    )
+    search_prefetch_max_queries: int = Field(
+        default=4,
+        ge=1,
+        description="Topic-derived queries searched concurrently at debate start.",
+    )
+    search_prefetch_match_threshold: float = Field(
+        default=0.6,
+        gt=0,
+        le=1,
+        description="Words a tool query must share with a prefetched query, as a share of the longer one, to be served from the prefetch.",
+    )
+
     # Redis Cache Settings
     enable_debate_cache: bool = Field(
         default=True,
@@ -106,37 +257,64 @@ class Settings(BaseSettings):
         ge=1,
         description="TTL for cached debate entries.",
     )
+    enable_shared_debate_cache: bool = Field(
+        default=False,
+        description="Reuse completed debates across owners for the same topic and debater pair.",
+    )
+    shared_debate_cache_ttl_seconds: int = Field(
+        default=24 * 60 * 60,
+        ge=1,
+        description="How long a completed debate can be reused by other owners.",
+    )
+    shared_debate_cache_max_entries: int = Field(
+        default=10_000,
+        ge=1,
+        description="Shared debate cache size; least recently used entries are evicted first.",
+    )
     debate_generation_lock_ttl_seconds: int = Field(
         default=240,
         ge=1,
         description="TTL for debate generation lock keys.",
     )
 
-    cache_lock_poll_attempts: int = Field(
-        default=2,
-        ge=1,
-        description="How many times to poll for cache lock release.",
-    )
-    cache_lock_poll_interval_seconds: float = Field(
-        default=0.3,
-        ge=0.0,
-        description="Delay between cache lock polling attempts.",
-    )
     stream_idle_poll_interval_seconds: float = Field(
         default=0.0,
         ge=0.0,
         description="Sleep interval when SSE stream is idle.",
     )
     redis_stream_read_batch_size: int = Field(
-        default=1,
+        default=32,
         ge=1,
-        description="Max Redis stream entries read per poll.",
+        description="Redis stream entries read per poll; the SSE reader starts here and adapts.",
+    )
+    redis_stream_read_batch_max: int = Field(
+        default=512,
+        ge=1,
+        description="Upper bound for the adaptive Redis stream read batch.",
     )
     redis_stream_block_timeout_ms: int = Field(
         default=10000,
         ge=1,
         description="Redis stream blocking read timeout (ms).",
     )
+    sse_subscriber_queue_size: int = Field(
+        default=256,
+        ge=1,
+        description="Max buffered events per SSE subscriber before the slow-consumer policy applies.",
+    )
+    sse_slow_consumer_policy: Literal["drop", "disconnect"] = Field(
+        default="drop",
+        description="What to do when an SSE subscriber queue is full: drop its oldest event or disconnect it.",
+    )
+    event_archive_enabled: bool = Field(
+        default=True,
+        description="Archive finished debate streams to compressed files and serve replays from them.",
+    )
+    archived_stream_ttl_seconds: int = Field(
+        default=300,
+        ge=1,
+        description="How long a finished debate's Redis stream is kept after it has been archived.",
+    )
 
 
     # LLM Models Settings 
@@ -160,15 +338,50 @@ class Settings(BaseSettings):
         default="groq/openai/gpt-oss-120b",
         description="Model for summaries.",
     )
+    llm_provider: Literal["litellm", "fake"] = Field(
+        default="litellm",
+        description="litellm calls the configured models; fake answers locally for offline tests and benchmarks.",
+    )
+    fake_llm_latency_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Simulated latency of each fake LLM call.",
+    )
+    fake_llm_prompt_tokens: int | None = Field(
+        default=None,
+        ge=0,
+        description="Prompt tokens reported per fake LLM call; estimated from the prompt when unset.",
+    )
+    fake_llm_completion_tokens: int | None = Field(
+        default=None,
+        ge=0,
+        description="Completion tokens reported per fake LLM call; estimated from the response when unset.",
+    )
+    fake_llm_failure_rate: float = Field(
+        default=0.0,
+        ge=0,
+        le=1,
+        description="Share of fake LLM calls that fail with a transient 503.",
+    )
+    fake_llm_rate_limit_rate: float = Field(
+        default=0.0,
+        ge=0,
+        le=1,
+        description="Share of fake LLM calls that fail with a 429 rate limit error.",
+    )
+    fake_llm_seed: int = Field(
+        default=0,
+        description="Seed for fake LLM output and failure injection.",
+    )
 
-    # Delay settings in the debate to avoid rate limits
+    # Optional pacing delays; provider limits are handled by the rate limiter below
     intro_delay_seconds: float = Field(
-        default=10.0,
+        default=0.0,
         ge=0.0,
         description="Delay before the intro phase.",
     )
     turn_delay_seconds: float = Field(
-        default=18.0,
+        default=0.0,
         ge=0.0,
         description="Delay between debate turns.",
     )
@@ -182,11 +395,67 @@ class Settings(BaseSettings):
         ge=0.0,
         description="Delay before judge output.",
     )
+    rate_limit_enabled: bool = Field(
+        default=True,
+        description="Gate every LLM call on the shared per-model Redis token buckets.",
+    )
+    rate_limits_json: str | None = Field(
+        default=None,
+        description="Per-model limits as JSON, {model: {requests_per_minute, tokens_per_minute}}; overrides the built-in ones.",
+    )
+    rate_limit_default_requests_per_minute: int = Field(
+        default=30,
+        ge=1,
+        description="Requests/min bucket for models without an entry in RATE_LIMITS_JSON.",
+    )
+    rate_limit_default_tokens_per_minute: int = Field(
+        default=6000,
+        ge=1,
+        description="Tokens/min bucket for models without an entry in RATE_LIMITS_JSON.",
+    )
+    rate_limit_output_token_estimate: int = Field(
+        default=512,
+        ge=0,
+        description="Completion tokens reserved per LLM call on top of the estimated prompt size.",
+    )
+    rate_limit_cooldown_seconds: float = Field(
+        default=10.0,
+        ge=0.0,
+        description="How long a model's buckets stay closed after the provider returns a rate-limit error.",
+    )
+    turn_streaming_enabled: bool = Field(
+        default=True,
+        description="Stream debater tokens to viewers as turn_delta events while a turn is generated.",
+    )
+    turn_delta_flush_interval_ms: int = Field(
+        default=100,
+        ge=0,
+        description="Max time streamed debater text is buffered before a turn_delta event is published.",
+    )
+    turn_delta_flush_chars: int = Field(
+        default=64,
+        ge=1,
+        description="Buffered characters that force a turn_delta event before the flush interval.",
+    )
+    judge_parallel_enabled: bool = Field(
+        default=True,
+        description="Run the three judges concurrently instead of as one sequential crew.",
+    )
     debate_max_rounds: int = Field(
         default=3,
         ge=1,
         description="Maximum number of rounds to run for each debate.",
     )
+    debate_history_token_budget: int = Field(
+        default=1200,
+        ge=0,
+        description="Target token size of the debate history in debater, conclusion and summary prompts; 0 sends the full transcript.",
+    )
+    debate_history_recent_turns: int = Field(
+        default=2,
+        ge=0,
+        description="Most recent turns always kept verbatim in budgeted history; older turns are condensed.",
+    )
     debate_retry_max_attempts: int = Field(
         default=4,
         ge=1,
@@ -202,6 +471,43 @@ class Settings(BaseSettings):
         ge=0.0,
         description="Maximum backoff delay for debate retries.",
     )
+    debate_write_flush_interval_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        description="Minimum time between buffered debate DB writes; 0 writes once per flow step.",
+    )
+    turn_log_fsync_every: int = Field(
+        default=8,
+        ge=1,
+        description="Turn log appends between fsyncs; logs are always fsynced when a debate ends.",
+    )
+    worker_debate_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Debates each Celery worker process runs at once on its shared event loop.",
+    )
+    client_pool_max_idle: int = Field(
+        default=4,
+        ge=1,
+        description="Idle LLM clients and crews each worker keeps per model or crew kind for reuse.",
+    )
+    llm_executor_max_workers: int = Field(
+        default=16,
+        ge=1,
+        description="Threads per process for blocking LLM and crew calls made by running debates.",
+    )
+
+    # Metrics
+    metrics_enabled: bool = Field(
+        default=True,
+        description="Serve Prometheus metrics at /metrics (API) and from the worker exporter.",
+    )
+    metrics_worker_port: int = Field(
+        default=9808,
+        ge=0,
+        le=65535,
+        description="Port of the Celery worker's Prometheus exporter; 0 disables it.",
+    )
 
     @field_validator("cors_allowed_origins", mode="before")
     @classmethod
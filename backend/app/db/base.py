@@ -1,7 +1,8 @@
 from sqlalchemy import inspect
 
 import app.db.session as db_session
-from app.db.models import Base
+from app.db.models import Base, OwnerAnalytics
+from app.db.owner_analytics import rebuild_owner_analytics
 
 
 def _migrate_legacy_tables() -> None:
@@ -18,6 +19,8 @@ def _migrate_legacy_tables() -> None:
         missing_columns.append("ALTER TABLE debates ADD COLUMN error_message TEXT NULL")
     if "summary" not in existing_columns:
         missing_columns.append("ALTER TABLE debates ADD COLUMN summary TEXT NULL")
+    if "shared_from_debate_id" not in existing_columns:
+        missing_columns.append("ALTER TABLE debates ADD COLUMN shared_from_debate_id TEXT NULL")
 
     if not missing_columns:
         return
@@ -27,7 +30,31 @@ def _migrate_legacy_tables() -> None:
             conn.exec_driver_sql(statement)
 
 
+def _create_missing_indexes() -> None:
+    # create_all() only builds indexes together with new tables, so indexes
+    # added to existing models are backfilled here.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db_session.engine, checkfirst=True)
+
+
+# Indexes replaced by wider ones in the models; they only add write cost.
+SUPERSEDED_INDEXES = ("idx_debates_session_id", "idx_debates_user_id")
+
+
+def _drop_superseded_indexes() -> None:
+    with db_session.engine.begin() as conn:
+        for index_name in SUPERSEDED_INDEXES:
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+
+
 def init_db() -> None:
+    needs_owner_backfill = not inspect(db_session.engine).has_table(OwnerAnalytics.__tablename__)
     Base.metadata.create_all(bind=db_session.engine)
     _migrate_legacy_tables()
+    _create_missing_indexes()
+    _drop_superseded_indexes()
+    if needs_owner_backfill:
+        # Databases created before the rollup existed get it filled in once.
+        rebuild_owner_analytics()
 
@@ -8,6 +8,7 @@ class Base(DeclarativeBase):
 
 class SessionRecord(Base):
     __tablename__ = "sessions"
+    __table_args__ = (Index("idx_sessions_expires_at", "expires_at"),)
 
     session_id: Mapped[str] = mapped_column(String, primary_key=True)
     user_id: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -19,9 +20,11 @@ class SessionRecord(Base):
 class DebateRecord(Base):
     __tablename__ = "debates"
     __table_args__ = (
-        Index("idx_debates_session_id", "session_id"),
-        Index("idx_debates_user_id", "user_id"),
+        # Owner filter plus the list sort order, so a page is an index range scan.
+        Index("idx_debates_user_created", "user_id", "created_at"),
+        Index("idx_debates_session_user_created", "session_id", "user_id", "created_at"),
         Index("idx_debates_created_at", "created_at"),
+        Index("idx_debates_shared_from", "shared_from_debate_id"),
     )
 
     debate_id: Mapped[str] = mapped_column(String, primary_key=True)
@@ -35,6 +38,9 @@ class DebateRecord(Base):
     completed_at: Mapped[int | None] = mapped_column(Integer, nullable=True)
     error_message: Mapped[str | None] = mapped_column(String, nullable=True)
     summary: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Set on owned copies served from the shared cache: the debate whose
+    # transcript, verdicts and event stream this record reuses.
+    shared_from_debate_id: Mapped[str | None] = mapped_column(String, nullable=True)
 
 
 class DebateUsageCall(Base):
@@ -59,3 +65,16 @@ class DebateMetric(Base):
     duration_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
     updated_at: Mapped[int] = mapped_column(Integer, nullable=False)
 
+
+
+class OwnerAnalytics(Base):
+    """Running totals per debate owner, kept in step with debates and metrics."""
+
+    __tablename__ = "owner_analytics"
+
+    owner_key: Mapped[str] = mapped_column(String, primary_key=True)
+    debate_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_cost_usd: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    total_duration_seconds: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -0,0 +1,182 @@
+"""Per-owner analytics rollup (``owner_analytics``).
+
+An owner is a user when the debate has a ``user_id`` and otherwise the
+anonymous session, matching how the debate list endpoints filter. Every write
+that changes a debate's count, tokens, cost or duration applies the same
+delta to its owner's row in the same transaction, so reading the analytics is
+a primary-key lookup. ``rebuild_owner_analytics`` recomputes every row from
+the source tables and is used to backfill.
+
+Usage (from the backend directory):
+
+    python -m app.db.owner_analytics
+"""
+
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.logger import logger
+from app.db.models import DebateMetric, DebateRecord, OwnerAnalytics
+from app.db.session import session_scope
+
+_UPSERT_DIALECTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+@dataclass
+class OwnerTotals:
+    debate_count: int = 0
+    total_tokens: int = 0
+    total_cost_usd: float = 0.0
+    total_duration_seconds: int = 0
+
+
+def owner_key(session_id: str, user_id: str | None) -> str:
+    return f"user:{user_id}" if user_id else f"session:{session_id}"
+
+
+def apply_owner_analytics_delta(
+    db: Session,
+    key: str,
+    debate_count: int = 0,
+    total_tokens: int = 0,
+    total_cost_usd: float = 0.0,
+    total_duration_seconds: int = 0,
+) -> None:
+    if not (debate_count or total_tokens or total_cost_usd or total_duration_seconds):
+        return
+    now = int(time.time())
+    insert = _UPSERT_DIALECTS.get(db.get_bind().dialect.name)
+    if insert is None:
+        _apply_owner_delta_orm(
+            db, key, debate_count, total_tokens, total_cost_usd, total_duration_seconds, now
+        )
+        return
+
+    table = OwnerAnalytics.__table__
+    stmt = insert(table).values(
+        owner_key=key,
+        debate_count=debate_count,
+        total_tokens=total_tokens,
+        total_cost_usd=total_cost_usd,
+        total_duration_seconds=total_duration_seconds,
+        updated_at=now,
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.owner_key],
+            set_={
+                "debate_count": table.c.debate_count + debate_count,
+                "total_tokens": table.c.total_tokens + total_tokens,
+                "total_cost_usd": table.c.total_cost_usd + total_cost_usd,
+                "total_duration_seconds": table.c.total_duration_seconds + total_duration_seconds,
+                "updated_at": now,
+            },
+        )
+    )
+
+
+def _apply_owner_delta_orm(
+    db: Session,
+    key: str,
+    debate_count: int,
+    total_tokens: int,
+    total_cost_usd: float,
+    total_duration_seconds: int,
+    now: int,
+) -> None:
+    row = db.get(OwnerAnalytics, key)
+    if row is None:
+        row = OwnerAnalytics(
+            owner_key=key,
+            debate_count=0,
+            total_tokens=0,
+            total_cost_usd=0.0,
+            total_duration_seconds=0,
+            updated_at=now,
+        )
+        db.add(row)
+    row.debate_count += debate_count
+    row.total_tokens += total_tokens
+    row.total_cost_usd += total_cost_usd
+    row.total_duration_seconds += total_duration_seconds
+    row.updated_at = now
+    db.flush()
+
+
+def owner_totals(db: Session, debate_ids: Iterable[str] | None = None) -> dict[str, OwnerTotals]:
+    """Aggregate debates (all, or only ``debate_ids``) into per-owner totals."""
+    stmt = (
+        select(
+            DebateRecord.session_id,
+            DebateRecord.user_id,
+            func.count(DebateRecord.debate_id),
+            func.coalesce(func.sum(func.coalesce(DebateMetric.total_tokens, 0)), 0),
+            func.coalesce(func.sum(func.coalesce(DebateMetric.total_cost_usd, 0.0)), 0.0),
+            func.coalesce(func.sum(func.coalesce(DebateMetric.duration_seconds, 0)), 0),
+        )
+        .outerjoin(DebateMetric, DebateMetric.debate_id == DebateRecord.debate_id)
+        .group_by(DebateRecord.session_id, DebateRecord.user_id)
+    )
+    if debate_ids is not None:
+        stmt = stmt.where(DebateRecord.debate_id.in_(list(debate_ids)))
+
+    totals: dict[str, OwnerTotals] = {}
+    for session_id, user_id, count, tokens, cost, duration in db.execute(stmt):
+        entry = totals.setdefault(owner_key(session_id, user_id), OwnerTotals())
+        entry.debate_count += int(count)
+        entry.total_tokens += int(tokens)
+        entry.total_cost_usd += float(cost)
+        entry.total_duration_seconds += int(duration)
+    return totals
+
+
+def subtract_debates_from_owner_analytics(db: Session, debate_ids: list[str]) -> None:
+    """Remove debates about to be deleted from their owners' totals."""
+    for key, totals in owner_totals(db, debate_ids).items():
+        apply_owner_analytics_delta(
+            db,
+            key,
+            debate_count=-totals.debate_count,
+            total_tokens=-totals.total_tokens,
+            total_cost_usd=-totals.total_cost_usd,
+            total_duration_seconds=-totals.total_duration_seconds,
+        )
+
+
+def rebuild_owner_analytics() -> int:
+    """Recompute every owner's totals from debates and metrics; returns owner count."""
+    now = int(time.time())
+    with session_scope() as db:
+        totals = owner_totals(db)
+        db.execute(delete(OwnerAnalytics))
+        db.add_all(
+            OwnerAnalytics(
+                owner_key=key,
+                debate_count=entry.debate_count,
+                total_tokens=entry.total_tokens,
+                total_cost_usd=entry.total_cost_usd,
+                total_duration_seconds=entry.total_duration_seconds,
+                updated_at=now,
+            )
+            for key, entry in totals.items()
+        )
+    return len(totals)
+
+
+def main() -> None:
+    from app.db.base import init_db
+
+    init_db()
+    logger.info("owner_analytics_rebuilt owners=%s", rebuild_owner_analytics())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,136 @@
+from collections.abc import Callable
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import URL, make_url
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.metrics import instrument_engine
 
 _database_url: str = settings.sqlalchemy_database_url
 
 
-def _build_engine(database_url: str):
-    connect_args: dict[str, object] = {}
+@dataclass(frozen=True)
+class EngineProfile:
+    """Connection, pool and per-connection PRAGMA settings for one engine."""
+
+    connect_args: dict[str, Any] = field(default_factory=dict)
+    engine_kwargs: dict[str, Any] = field(default_factory=dict)
+    pragmas: tuple[tuple[str, str | int], ...] = ()
+
+
+EngineProfileFactory = Callable[[str, bool], EngineProfile]
+
+
+def sqlite_pragmas(read_only: bool = False) -> tuple[tuple[str, str | int], ...]:
+    pragmas: list[tuple[str, str | int]] = [
+        # WAL lets API readers proceed while a Celery worker holds the write lock.
+        ("journal_mode", settings.sqlite_journal_mode),
+        ("synchronous", settings.sqlite_synchronous),
+        ("busy_timeout", settings.sqlite_busy_timeout_ms),
+        ("mmap_size", settings.sqlite_mmap_size_bytes),
+        # Negative values are KiB rather than pages.
+        ("cache_size", -settings.sqlite_cache_size_kib),
+        ("temp_store", settings.sqlite_temp_store),
+        ("foreign_keys", "ON"),
+    ]
+    if read_only:
+        pragmas.append(("query_only", "ON"))
+    return tuple(pragmas)
+
+
+def sqlite_engine_profile(database_url: str, read_only: bool = False) -> EngineProfile:
+    in_memory = make_url(database_url).database in (None, "", ":memory:")
+    engine_kwargs: dict[str, Any] = {}
+    if not in_memory:
+        # SQLite allows one writer at a time, so a large write pool only adds
+        # lock waits; readers get their own engine instead.
+        engine_kwargs = {
+            "pool_size": settings.sqlite_pool_size,
+            "max_overflow": 0,
+            "pool_timeout": settings.sqlite_connection_timeout_seconds,
+        }
+    return EngineProfile(
+        connect_args={
+            "check_same_thread": False,
+            "timeout": settings.sqlite_connection_timeout_seconds,
+        },
+        engine_kwargs=engine_kwargs,
+        pragmas=sqlite_pragmas(read_only=read_only),
+    )
+
+
+def server_engine_profile(database_url: str, read_only: bool = False) -> EngineProfile:
+    return EngineProfile(
+        engine_kwargs={
+            "pool_pre_ping": True,
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_recycle": settings.db_pool_recycle_seconds,
+        },
+    )
+
+
+def default_engine_profile(database_url: str, read_only: bool = False) -> EngineProfile:
     if database_url.startswith("sqlite"):
-        connect_args["check_same_thread"] = False
-    return create_engine(
+        return sqlite_engine_profile(database_url, read_only)
+    return server_engine_profile(database_url, read_only)
+
+
+_profile_factory: EngineProfileFactory = default_engine_profile
+
+
+def _apply_pragmas(engine: Engine, pragmas: tuple[tuple[str, str | int], ...]) -> None:
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def _build_engine(database_url: str, read_only: bool = False) -> Engine:
+    profile = _profile_factory(database_url, read_only)
+    engine = create_engine(
         database_url,
         echo=settings.sqlalchemy_echo_sql,
-        pool_pre_ping=True,
-        connect_args=connect_args,
+        connect_args=profile.connect_args,
+        **profile.engine_kwargs,
     )
+    _apply_pragmas(engine, profile.pragmas)
+    instrument_engine(engine, "read" if read_only else "write")
+    return engine
+
+
+def _resolve_read_database_url(database_url: str, read_database_url: str | None) -> str | None:
+    if read_database_url and read_database_url.strip():
+        return read_database_url
+    if database_url.startswith("sqlite") and settings.sqlite_read_engine_enabled:
+        if make_url(database_url).database not in (None, "", ":memory:"):
+            return database_url
+    return None
+
+
+def _build_read_engine(database_url: str, read_database_url: str | None) -> Engine:
+    resolved = _resolve_read_database_url(database_url, read_database_url)
+    if resolved is None:
+        return engine
+    return _build_engine(resolved, read_only=True)
 
 
 engine = _build_engine(_database_url)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=Session)
+read_engine = _build_read_engine(_database_url, settings.database_read_url_override)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine, class_=Session)
 
 
 def get_database_url() -> str:
@@ -40,13 +146,27 @@ def get_sqlite_database_path() -> Path | None:
     return Path(url.database).resolve()
 
 
-def reconfigure_database(database_url: str) -> None:
-    global _database_url, engine, SessionLocal
+def reconfigure_database(
+    database_url: str,
+    read_database_url: str | None = None,
+    profile_factory: EngineProfileFactory | None = None,
+) -> None:
+    global _database_url, _profile_factory, engine, SessionLocal, read_engine, ReadSessionLocal
 
     _database_url = database_url
+    _profile_factory = profile_factory or default_engine_profile
+    if read_engine is not engine:
+        read_engine.dispose()
     engine.dispose()
     engine = _build_engine(_database_url)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=Session)
+    read_engine = _build_read_engine(_database_url, read_database_url)
+    ReadSessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=read_engine,
+        class_=Session,
+    )
 
 
 @contextmanager
@@ -62,6 +182,16 @@ def session_scope() -> Generator[Session, None, None]:
         db.close()
 
 
+@contextmanager
+def read_session_scope() -> Generator[Session, None, None]:
+    """Session on the read engine for list and analytics queries; never commits."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
@@ -1,29 +1,42 @@
 import asyncio
-import json
 import logging
-import re
 import uuid
 
 from fastapi import HTTPException
 
 from app.core.config import settings
-from app.helpers import debate_helpers
+from app.event_hub import (
+    TERMINAL_EVENTS,
+    SubscriptionClosed,
+    event_hub,
+    format_stream_event,
+    parse_stream_id,
+)
 from app.schemas.debate import DebateRequest
 from app.services import debate_service
 from app.cache import (
     DEBATE_CACHE_ENABLED as _DEFAULT_DEBATE_CACHE_ENABLED,
+    DEBATE_CACHE_TTL_SECONDS,
     DEBATE_LOCK_TTL_SECONDS as _DEFAULT_DEBATE_LOCK_TTL_SECONDS,
-    acquire_generation_lock,
+    SHARED_DEBATE_CACHE_ENABLED,
+    CLAIM_BUSY,
+    CLAIM_CACHED,
+    CLAIM_INFLIGHT,
     build_cache_key,
     build_inflight_key,
     build_lock_key,
-    delete_inflight_debate_id,
-    get_cached_debate_id,
-    get_inflight_debate_id,
+    build_shared_cache_key,
+    claim_or_join_generation_async,
+    delete_inflight_debate_id_async,
+    delete_shared_debate_id_async,
     events_redis_client as _DEFAULT_EVENTS_REDIS_CLIENT,
-    release_generation_lock,
-    set_inflight_debate_id,
+    get_async_events_redis_client,
+    get_shared_debate_id_async,
+    release_generation_lock_async,
+    set_cached_debate_id_async,
+    set_inflight_debate_id_async,
 )
+from src.event_archive import EVENT_ARCHIVE_ENABLED, load_archived_events
 
 LOG = logging.getLogger("debate_api")
 
@@ -31,10 +44,7 @@ LOG = logging.getLogger("debate_api")
 DEBATE_CACHE_ENABLED = _DEFAULT_DEBATE_CACHE_ENABLED
 DEBATE_LOCK_TTL_SECONDS = _DEFAULT_DEBATE_LOCK_TTL_SECONDS
 redis_client = _DEFAULT_EVENTS_REDIS_CLIENT
-LOCK_CHECK_ATTEMPTS = settings.cache_lock_poll_attempts
-LOCK_CHECK_SLEEP_SECONDS = settings.cache_lock_poll_interval_seconds
 STREAM_IDLE_SLEEP_SECONDS = settings.stream_idle_poll_interval_seconds
-REDIS_STREAM_READ_COUNT = settings.redis_stream_read_batch_size
 REDIS_STREAM_BLOCK_MS = settings.redis_stream_block_timeout_ms
 
 
@@ -64,13 +74,6 @@ def _get_lock_ttl_seconds() -> int:
     return int(DEBATE_LOCK_TTL_SECONDS)
 
 
-def _get_redis_client():
-    api_module = _maybe_get_api_module()
-    if api_module is not None and hasattr(api_module, "redis_client"):
-        return getattr(api_module, "redis_client")
-    return redis_client
-
-
 def _get_task_dispatcher():
     api_module = _maybe_get_api_module()
     if api_module is not None and hasattr(api_module, "enqueue_debate_task"):
@@ -112,8 +115,6 @@ async def start_debate(req: DebateRequest) -> dict:
     lock_ttl_seconds = _get_lock_ttl_seconds()
 
     debate_service.upsert_session(req.session_id, req.user_id)
-    debate_helpers.cleanup_expired_sessions()
-    debate_helpers.cleanup_old_debates()
 
     cache_key = build_cache_key(
         topic=req.topic,
@@ -125,99 +126,108 @@ async def start_debate(req: DebateRequest) -> dict:
     lock_key = build_lock_key(cache_key)
     inflight_key = build_inflight_key(cache_key)
 
+    debate_id = str(uuid.uuid4())
+    lock_token = None
     if cache_enabled:
-        cached_id = get_cached_debate_id(cache_key)
-        if cached_id:
+        claim = await claim_or_join_generation_async(
+            cache_key,
+            lock_key,
+            inflight_key,
+            debate_id,
+            lock_ttl_seconds,
+        )
+        if claim.outcome == CLAIM_CACHED:
             LOG.info(
                 "cache_hit",
                 extra={
-                    "debate_id": cached_id,
+                    "debate_id": claim.debate_id,
                     "session_id": req.session_id,
                     "user_id": req.user_id,
                     "cache_key": cache_key,
                 },
             )
-            return {"debate_id": cached_id, "cached": True}
+            return {"debate_id": claim.debate_id, "cached": True}
 
-        LOG.info(
-            "cache_miss",
-            extra={
-                "session_id": req.session_id,
-                "user_id": req.user_id,
-                "cache_key": cache_key,
-            },
-        )
+        if claim.outcome == CLAIM_INFLIGHT:
+            LOG.info(
+                "cache_lock_busy_inflight",
+                extra={
+                    "debate_id": claim.debate_id,
+                    "session_id": req.session_id,
+                    "user_id": req.user_id,
+                    "cache_key": cache_key,
+                },
+            )
+            return {"debate_id": claim.debate_id, "cached": False, "inflight": True}
 
-        lock_token = acquire_generation_lock(lock_key, lock_ttl_seconds)
-        if not lock_token:
-            inflight_id = get_inflight_debate_id(inflight_key)
-            if inflight_id:
-                LOG.info(
-                    "cache_lock_busy_inflight",
-                    extra={
-                        "debate_id": inflight_id,
-                        "session_id": req.session_id,
-                        "user_id": req.user_id,
-                        "cache_key": cache_key,
-                    },
-                )
-                return {"debate_id": inflight_id, "cached": False, "inflight": True}
-
-            for _ in range(LOCK_CHECK_ATTEMPTS):
-                await asyncio.sleep(LOCK_CHECK_SLEEP_SECONDS)
-                cached_id = get_cached_debate_id(cache_key)
-                if cached_id:
-                    LOG.info(
-                        "cache_hit_after_wait",
-                        extra={
-                            "debate_id": cached_id,
-                            "session_id": req.session_id,
-                            "user_id": req.user_id,
-                            "cache_key": cache_key,
-                        },
-                    )
-                    return {"debate_id": cached_id, "cached": True}
-
-                inflight_id = get_inflight_debate_id(inflight_key)
-                if inflight_id:
-                    LOG.info(
-                        "cache_lock_busy_inflight_after_wait",
-                        extra={
-                            "debate_id": inflight_id,
-                            "session_id": req.session_id,
-                            "user_id": req.user_id,
-                            "cache_key": cache_key,
-                        },
-                    )
-                    return {"debate_id": inflight_id, "cached": False, "inflight": True}
-
-            lock_token = acquire_generation_lock(lock_key, lock_ttl_seconds)
-            if not lock_token:
-                LOG.warning(
-                    "cache_lock_busy_no_inflight",
-                    extra={
-                        "session_id": req.session_id,
-                        "user_id": req.user_id,
-                        "cache_key": cache_key,
-                    },
-                )
-                raise HTTPException(
-                    status_code=409,
-                    detail="debate generation in progress, retry shortly",
+        if claim.outcome == CLAIM_BUSY:
+            LOG.warning(
+                "cache_lock_busy_no_inflight",
+                extra={
+                    "session_id": req.session_id,
+                    "user_id": req.user_id,
+                    "cache_key": cache_key,
+                },
+            )
+            raise HTTPException(
+                status_code=409,
+                detail="debate generation in progress, retry shortly",
+            )
+
+        lock_token = claim.lock_token
+        try:
+            if SHARED_DEBATE_CACHE_ENABLED:
+                shared = await _serve_from_shared_cache(
+                    req,
+                    debate_id,
+                    cache_key,
+                    lock_key,
+                    lock_token,
                 )
-        else:
+                if shared is not None:
+                    return shared
+
             LOG.info(
                 "cache_lock_acquired",
                 extra={
+                    "debate_id": debate_id,
                     "session_id": req.session_id,
                     "user_id": req.user_id,
                     "cache_key": cache_key,
                 },
             )
+            _create_debate_row(req, debate_id)
+            # Published only once the row is committed, so a request joining
+            # this debate can open its event stream straight away.
+            await set_inflight_debate_id_async(inflight_key, debate_id, lock_ttl_seconds)
+        except Exception:
+            await _release_generation_claim(inflight_key, lock_key, lock_token)
+            raise
     else:
-        lock_token = None
+        _create_debate_row(req, debate_id)
 
-    debate_id = str(uuid.uuid4())
+    task_dispatcher = _get_task_dispatcher()
+    try:
+        task_dispatcher(
+            debate_id,
+            req.topic,
+            req.debater_1,
+            req.debater_2,
+            cache_key=cache_key if cache_enabled else None,
+            inflight_key=inflight_key if cache_enabled else None,
+            lock_key=lock_key if cache_enabled else None,
+            lock_token=lock_token if cache_enabled else None,
+        )
+    except Exception as exc:
+        if cache_enabled:
+            await _release_generation_claim(inflight_key, lock_key, lock_token)
+        debate_service.update_debate_status(debate_id, "failed", error_message=str(exc))
+        raise HTTPException(status_code=503, detail="failed to queue debate") from exc
+
+    return {"debate_id": debate_id, "cached": False}
+
+
+def _create_debate_row(req: DebateRequest, debate_id: str) -> None:
     debate_service.create_debate(
         debate_id=debate_id,
         session_id=req.session_id,
@@ -227,9 +237,6 @@ async def start_debate(req: DebateRequest) -> dict:
         debater_2=req.debater_2,
     )
 
-    if cache_enabled:
-        set_inflight_debate_id(inflight_key, debate_id, lock_ttl_seconds)
-
     LOG.info(
         "Debate created",
         extra={
@@ -239,30 +246,67 @@ async def start_debate(req: DebateRequest) -> dict:
         },
     )
 
-    task_dispatcher = _get_task_dispatcher()
-    try:
-        task_dispatcher(
-            debate_id,
-            req.topic,
-            req.debater_1,
-            req.debater_2,
-            cache_key=cache_key if cache_enabled else None,
-            inflight_key=inflight_key if cache_enabled else None,
-            lock_key=lock_key if cache_enabled else None,
-            lock_token=lock_token if cache_enabled else None,
-        )
-    except Exception as exc:
-        if cache_enabled and inflight_key:
-            delete_inflight_debate_id(inflight_key)
-        if cache_enabled and lock_key and lock_token:
-            release_generation_lock(lock_key, lock_token)
-        debate_service.update_debate_status(debate_id, "failed", error_message=str(exc))
-        raise HTTPException(status_code=503, detail="failed to queue debate") from exc
 
-    return {"debate_id": debate_id, "cached": False}
+async def _release_generation_claim(
+    inflight_key: str,
+    lock_key: str,
+    lock_token: str | None,
+) -> None:
+    await delete_inflight_debate_id_async(inflight_key)
+    if lock_token:
+        await release_generation_lock_async(lock_key, lock_token)
+
 
+async def _serve_from_shared_cache(
+    req: DebateRequest,
+    debate_id: str,
+    cache_key: str,
+    lock_key: str,
+    lock_token: str | None,
+) -> dict | None:
+    """Answer a per-owner cache miss with an owned copy of a shared debate.
+
+    Runs while the owner's generation claim is held; on a hit the copy is
+    cached for the owner and the claim released, otherwise ``None`` is
+    returned and the caller goes on to generate.
+    """
+    shared_key = build_shared_cache_key(req.topic, req.debater_1, req.debater_2)
+    source_debate_id = await get_shared_debate_id_async(shared_key)
+    if not source_debate_id:
+        return None
+
+    copied = debate_service.create_shared_debate_copy(
+        debate_id=debate_id,
+        session_id=req.session_id,
+        user_id=req.user_id,
+        topic=req.topic,
+        debater_1=req.debater_1,
+        debater_2=req.debater_2,
+        source_debate_id=source_debate_id,
+    )
+    if not copied:
+        # The source was purged or never completed; drop the stale entry.
+        await delete_shared_debate_id_async(shared_key)
+        return None
 
-def validate_stream_access(debate_id: str, session_id: str, user_id: str | None) -> None:
+    await set_cached_debate_id_async(cache_key, debate_id, DEBATE_CACHE_TTL_SECONDS)
+    if lock_token:
+        await release_generation_lock_async(lock_key, lock_token)
+    LOG.info(
+        "shared_cache_hit",
+        extra={
+            "debate_id": debate_id,
+            "source_debate_id": source_debate_id,
+            "session_id": req.session_id,
+            "user_id": req.user_id,
+        },
+    )
+    return {"debate_id": debate_id, "cached": True, "shared": True}
+
+
+def validate_stream_access(debate_id: str, session_id: str, user_id: str | None) -> str:
+    """Check the caller owns ``debate_id``; returns the debate whose event
+    stream serves it (the shared source for copies from the shared cache)."""
     if not session_id or not session_id.strip():
         raise HTTPException(status_code=400, detail="session_id is required")
 
@@ -292,44 +336,77 @@ def validate_stream_access(debate_id: str, session_id: str, user_id: str | None)
         )
         raise HTTPException(status_code=403, detail="not authorized")
 
+    return owner.get("shared_from_debate_id") or debate_id
+
+
+def _is_after(event: dict, resume_after: tuple[int, int] | None) -> bool:
+    if resume_after is None:
+        return True
+    event_key = parse_stream_id(event.get("id"))
+    return event_key is None or event_key > resume_after
+
+
+async def _last_stream_entry(debate_id: str) -> tuple[str, dict] | None:
+    if EVENT_ARCHIVE_ENABLED:
+        archived = await asyncio.to_thread(load_archived_events, debate_id)
+        if archived:
+            return archived[-1]["id"], archived[-1]
+    entries = await get_async_events_redis_client().xrevrange(f"debate:{debate_id}", count=1)
+    return entries[0] if entries else None
+
+
+async def has_unsent_events(debate_id: str, last_event_id: str | None) -> bool:
+    """False when a reconnecting client has already received the debate's
+    final event, so the endpoint can answer 204 and stop EventSource retries."""
+    resume_after = parse_stream_id(last_event_id)
+    if resume_after is None:
+        return True
+    last_entry = await _last_stream_entry(debate_id)
+    if last_entry is None:
+        return True
+    entry_id, fields = last_entry
+    return fields.get("event") not in TERMINAL_EVENTS or parse_stream_id(entry_id) > resume_after
+
+
+async def stream_debate_events(debate_id: str, last_event_id: str | None = None):
+    """SSE events for a debate, resuming after ``last_event_id`` when given.
+
+    The stream ends right after ``debate_completed`` or ``debate_failed``.
+    """
+    resume_after = parse_stream_id(last_event_id)
+    if EVENT_ARCHIVE_ENABLED:
+        # Finished debates replay from their archive in one burst, without
+        # touching Redis or the fan-out hub.
+        archived = await asyncio.to_thread(load_archived_events, debate_id)
+        if archived is not None:
+            for fields in archived:
+                event = format_stream_event(fields, fields["id"])
+                if _is_after(event, resume_after):
+                    yield event
+            return
+
+    subscription = event_hub.subscribe(debate_id)
+    idle_timeout_seconds = REDIS_STREAM_BLOCK_MS / 1000
 
-async def stream_debate_events(debate_id: str):
-    stream = f"debate:{debate_id}"
-    last_id = "0-0"
-    redis = _get_redis_client()
-
-    while True:
-        events = redis.xread(
-            {stream: last_id},
-            count=REDIS_STREAM_READ_COUNT,
-            block=REDIS_STREAM_BLOCK_MS,
-        )
-        if not events:
-            yield {"event": "ping", "data": "{}"}
-
-        for _, messages in events:
-            for msg_id, fields in messages:
-                last_id = msg_id
-
-                raw_data = json.loads(fields["data"])
-                agent = raw_data["agent"].strip()
-                output = raw_data["output"]
-
-                try:
-                    output_json = json.loads(output)
-                except json.JSONDecodeError:
-                    json_match = re.search(r"(\{.*\})", output, re.DOTALL)
-                    if json_match:
-                        try:
-                            output_json = json.loads(json_match.group(1))
-                        except json.JSONDecodeError:
-                            output_json = {"text": output}
-                    else:
-                        output_json = {"text": output}
-
-                yield {
-                    "event": fields["event"],
-                    "data": json.dumps({"agent": agent, **output_json}),
-                }
-
-        await asyncio.sleep(STREAM_IDLE_SLEEP_SECONDS)
+    try:
+        for event in subscription.backlog:
+            if _is_after(event, resume_after):
+                yield event
+            if event["event"] in TERMINAL_EVENTS:
+                return
+
+        while True:
+            try:
+                event = await subscription.next_event(idle_timeout_seconds)
+            except SubscriptionClosed:
+                return
+            if event is None:
+                yield {"event": "ping", "data": "{}"}
+                await asyncio.sleep(STREAM_IDLE_SLEEP_SECONDS)
+                continue
+            if _is_after(event, resume_after):
+                yield event
+            if event["event"] in TERMINAL_EVENTS:
+                return
+    finally:
+        event_hub.unsubscribe(subscription)
@@ -1,35 +1,106 @@
+import base64
+import binascii
+import json
+
 from fastapi import HTTPException
 
+from app.core.config import settings
 from app.services import debate_service
+from src.persona_registry import persona_registry
 
+DEBATES_PAGE_SIZE_DEFAULT = settings.debates_page_size_default
+DEBATES_PAGE_SIZE_MAX = settings.debates_page_size_max
+
+DEBATE_FIELDS = (
+    "debate_id",
+    "topic",
+    "debater_1",
+    "debater_2",
+    "status",
+    "created_at",
+    "completed_at",
+    "error_message",
+    "summary",
+    "total_tokens",
+    "total_cost_usd",
+    "cost_breakdown",
+    "duration_seconds",
+)
+
+
+def encode_cursor(created_at: int, debate_id: str) -> str:
+    raw = json.dumps([created_at, debate_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, debate_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+    if not isinstance(created_at, int) or not isinstance(debate_id, str):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return created_at, debate_id
 
-def _build_debate_item(row: dict, cost_breakdown_by_debate: dict[str, list[dict]]) -> dict:
-    return {
-        "debate_id": row["debate_id"],
-        "topic": row["topic"],
-        "debater_1": row["debater_1"],
-        "debater_2": row["debater_2"],
-        "status": row["status"],
-        "created_at": row["created_at"],
-        "completed_at": row["completed_at"],
-        "error_message": row["error_message"],
-        "summary": row["summary"],
-        "total_tokens": row["total_tokens"],
-        "total_cost_usd": row["total_cost_usd"],
-        "cost_breakdown": cost_breakdown_by_debate.get(row["debate_id"], []),
-        "duration_seconds": row["duration_seconds"],
-    }
 
+def _parse_fields(fields: str | None) -> tuple[str, ...]:
+    if fields is None or not fields.strip():
+        return DEBATE_FIELDS
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested.difference(DEBATE_FIELDS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return tuple(name for name in DEBATE_FIELDS if name in requested)
 
-def get_debates(session_id: str, user_id: str | None) -> dict:
+
+def _build_debate_item(
+    row: dict,
+    cost_breakdown_by_debate: dict[str, list[dict]],
+    fields: tuple[str, ...] = DEBATE_FIELDS,
+) -> dict:
+    item = {}
+    for name in fields:
+        if name == "cost_breakdown":
+            item[name] = cost_breakdown_by_debate.get(row["debate_id"], [])
+        else:
+            item[name] = row[name]
+    return item
+
+
+def get_debates(
+    session_id: str,
+    user_id: str | None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: str | None = None,
+) -> dict:
     if not session_id or not session_id.strip():
         raise HTTPException(status_code=400, detail="session_id is required")
 
-    rows = debate_service.list_debates_with_metrics(session_id, user_id)
-    debate_ids = [row["debate_id"] for row in rows]
-    cost_breakdown_by_debate = debate_service.get_cost_breakdown_for_debates(debate_ids)
-    debates = [_build_debate_item(row, cost_breakdown_by_debate) for row in rows]
-    return {"debates": debates}
+    page_size = min(limit or DEBATES_PAGE_SIZE_DEFAULT, DEBATES_PAGE_SIZE_MAX)
+    selected_fields = _parse_fields(fields)
+    after = decode_cursor(cursor) if cursor else None
+
+    # One extra row tells us whether another page exists without a COUNT(*).
+    rows = debate_service.list_debates_with_metrics(
+        session_id,
+        user_id,
+        limit=page_size + 1,
+        after=after,
+        columns=[name for name in selected_fields if name != "cost_breakdown"],
+    )
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["debate_id"])
+
+    cost_breakdown_by_debate: dict[str, list[dict]] = {}
+    if "cost_breakdown" in selected_fields:
+        debate_ids = [row["debate_id"] for row in rows]
+        cost_breakdown_by_debate = debate_service.get_cost_breakdown_for_debates(debate_ids)
+    debates = [_build_debate_item(row, cost_breakdown_by_debate, selected_fields) for row in rows]
+    return {"debates": debates, "next_cursor": next_cursor}
 
 
 def get_debates_analytics(session_id: str, user_id: str | None) -> dict:
@@ -53,7 +124,28 @@ def get_debates_analytics(session_id: str, user_id: str | None) -> dict:
     }
 
 
-def get_debates_overview(session_id: str, user_id: str | None) -> dict:
-    debates = get_debates(session_id, user_id)["debates"]
+def get_debates_overview(
+    session_id: str,
+    user_id: str | None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: str | None = None,
+) -> dict:
+    page = get_debates(session_id, user_id, limit=limit, cursor=cursor, fields=fields)
     analytics = get_debates_analytics(session_id, user_id)
-    return {"analytics": analytics, "debates": debates}
+    return {"analytics": analytics, "debates": page["debates"], "next_cursor": page["next_cursor"]}
+
+
+def get_debaters() -> dict:
+    return {
+        "debaters": [
+            {
+                "id": persona.key,
+                "name": persona.name,
+                "description": persona.description,
+                "aliases": list(persona.aliases),
+                "prompt_tokens": persona.prompt_tokens,
+            }
+            for persona in persona_registry.all()
+        ]
+    }
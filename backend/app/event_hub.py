@@ -0,0 +1,324 @@
+"""In-process fan-out of debate event streams to SSE subscribers.
+
+Each ``debate:{id}`` Redis stream, together with its ``turn_delta`` stream, is
+read by exactly one asyncio task per API process, no matter how many browsers
+are watching it. Parsed events are
+multicast to bounded per-subscriber queues so a slow client can never stall
+the reader or the other viewers.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from collections.abc import Callable
+
+import redis
+import redis.asyncio as redis_async
+
+from app.cache import get_async_events_redis_client
+from app.core.config import settings
+from app.metrics import SSE_STREAMS, SSE_SUBSCRIBERS
+
+LOG = logging.getLogger("debate_api")
+
+TERMINAL_EVENTS = frozenset({"debate_completed", "debate_failed"})
+
+SLOW_CONSUMER_DROP = "drop"
+SLOW_CONSUMER_DISCONNECT = "disconnect"
+
+# Publishers trim streams to roughly this many entries, so the replay buffer
+# kept for late subscribers never needs to be larger.
+STREAM_HISTORY_MAXLEN = 1000
+READ_ERROR_BACKOFF_SECONDS = 1.0
+
+_CLOSED = object()
+
+
+class SubscriptionClosed(Exception):
+    """Raised when a subscriber was disconnected by the hub."""
+
+
+# Stream entries written with this format already carry the SSE ``data``
+# string; entries without it predate publish-time normalization.
+STREAM_ENTRY_FORMAT = "sse"
+
+
+def _parse_output(output: str) -> dict:
+    try:
+        parsed = json.loads(output)
+    except json.JSONDecodeError:
+        parsed = None
+    if isinstance(parsed, dict):
+        return parsed
+
+    # Agents often wrap their JSON in prose or code fences; take the span from
+    # the first "{" to the last "}".
+    start = output.find("{")
+    end = output.rfind("}")
+    if 0 <= start < end:
+        try:
+            parsed = json.loads(output[start : end + 1])
+        except json.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, dict):
+            return parsed
+    return {"text": output}
+
+
+def normalize_event_data(data: dict) -> str:
+    """SSE ``data`` string for a published event: the agent plus the output's
+    fields, or ``{"text": output}`` when the output is not a JSON object."""
+    output = data.get("output", "")
+    if not isinstance(output, dict):
+        output = _parse_output(output if isinstance(output, str) else str(output))
+    return json.dumps({"agent": str(data.get("agent", "")).strip(), **output})
+
+
+def turn_delta_stream(debate_id: str) -> str:
+    """Stream of a debate's ``turn_delta`` events. They are kept apart from
+    ``debate:{id}`` so their volume never trims the structured events away."""
+    return f"debate:{debate_id}:deltas"
+
+
+def format_stream_event(fields: dict, entry_id: str | None = None) -> dict:
+    """SSE event for a stream entry; ``entry_id`` becomes the SSE ``id`` that
+    clients send back as ``Last-Event-ID`` when they reconnect."""
+    if fields.get("format") == STREAM_ENTRY_FORMAT:
+        event = {"event": fields["event"], "data": fields["data"]}
+    else:
+        # Entries (and archives) written before publish-time normalization.
+        event = {
+            "event": fields["event"],
+            "data": normalize_event_data(json.loads(fields["data"])),
+        }
+    if entry_id is not None:
+        event["id"] = entry_id
+    return event
+
+
+def parse_stream_id(entry_id: str | None) -> tuple[int, int] | None:
+    """Orderable form of a Redis stream id, or ``None`` if it is not one."""
+    if not entry_id:
+        return None
+    milliseconds, _, sequence = entry_id.strip().partition("-")
+    try:
+        return int(milliseconds), int(sequence or 0)
+    except ValueError:
+        return None
+
+
+class Subscription:
+    def __init__(self, debate_id: str, backlog: list[dict], queue_size: int):
+        self.debate_id = debate_id
+        self.backlog = backlog
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped_events = 0
+        self.closed = False
+
+    async def next_event(self, timeout_seconds: float) -> dict | None:
+        """Wait for the next live event; ``None`` means the wait timed out."""
+        try:
+            event = await asyncio.wait_for(self.queue.get(), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            return None
+        if event is _CLOSED:
+            raise SubscriptionClosed(self.debate_id)
+        return event
+
+
+class _StreamFanout:
+    def __init__(self, debate_id: str):
+        self.debate_id = debate_id
+        self.stream = f"debate:{debate_id}"
+        self.last_id = "0-0"
+        self.history: deque[dict] = deque(maxlen=STREAM_HISTORY_MAXLEN)
+        # Deltas carry no SSE id, since Last-Event-ID resumes the main stream;
+        # only those of the turn in progress are kept for late subscribers.
+        self.delta_stream = turn_delta_stream(debate_id)
+        self.delta_last_id = "0-0"
+        self.deltas: deque[dict] = deque(maxlen=STREAM_HISTORY_MAXLEN)
+        self.subscribers: set[Subscription] = set()
+        self.task: asyncio.Task | None = None
+
+
+class DebateEventHub:
+    def __init__(
+        self,
+        client_factory: Callable[[], redis_async.Redis] = get_async_events_redis_client,
+        queue_size: int = settings.sse_subscriber_queue_size,
+        slow_consumer_policy: str = settings.sse_slow_consumer_policy,
+        read_count: int = settings.redis_stream_read_batch_size,
+        max_read_count: int = settings.redis_stream_read_batch_max,
+        block_ms: int = settings.redis_stream_block_timeout_ms,
+    ):
+        if slow_consumer_policy not in (SLOW_CONSUMER_DROP, SLOW_CONSUMER_DISCONNECT):
+            raise ValueError(f"unknown slow consumer policy: {slow_consumer_policy}")
+        self._client_factory = client_factory
+        self._queue_size = queue_size
+        self._slow_consumer_policy = slow_consumer_policy
+        self._read_count = read_count
+        self._max_read_count = max(read_count, max_read_count)
+        self._block_ms = block_ms
+        self._streams: dict[str, _StreamFanout] = {}
+        self._dropped_events_total = 0
+        self._disconnected_total = 0
+
+    def subscribe(self, debate_id: str) -> Subscription:
+        fanout = self._streams.get(debate_id)
+        if fanout is None:
+            fanout = _StreamFanout(debate_id)
+            self._streams[debate_id] = fanout
+
+        backlog = [*fanout.history, *fanout.deltas]
+        subscription = Subscription(debate_id, backlog, self._queue_size)
+        fanout.subscribers.add(subscription)
+        if fanout.task is None or fanout.task.done():
+            fanout.task = asyncio.create_task(self._read_stream(fanout))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        fanout = self._streams.get(subscription.debate_id)
+        if fanout is None:
+            return
+        fanout.subscribers.discard(subscription)
+        if fanout.subscribers:
+            return
+
+        # Last viewer left: stop reading and forget the replay buffer.
+        del self._streams[subscription.debate_id]
+        if fanout.task is not None:
+            fanout.task.cancel()
+
+    def subscriber_count(self) -> int:
+        return sum(len(fanout.subscribers) for fanout in self._streams.values())
+
+    def stream_count(self) -> int:
+        return len(self._streams)
+
+    def metrics(self) -> dict:
+        queue_depths = [
+            subscription.queue.qsize()
+            for fanout in self._streams.values()
+            for subscription in fanout.subscribers
+        ]
+        return {
+            "streams": len(self._streams),
+            "subscribers": len(queue_depths),
+            "queue_depth_total": sum(queue_depths),
+            "queue_depth_max": max(queue_depths, default=0),
+            "dropped_events_total": self._dropped_events_total,
+            "disconnected_subscribers_total": self._disconnected_total,
+            "slow_consumer_policy": self._slow_consumer_policy,
+        }
+
+    async def close(self) -> None:
+        fanouts = list(self._streams.values())
+        self._streams.clear()
+        for fanout in fanouts:
+            for subscription in fanout.subscribers:
+                self._close_subscription(subscription)
+            # The reader also stops on its own once it has no subscribers, in
+            # case the redis client swallows the cancellation mid-read.
+            fanout.subscribers.clear()
+            if fanout.task is not None:
+                fanout.task.cancel()
+        for fanout in fanouts:
+            if fanout.task is not None:
+                try:
+                    await fanout.task
+                except asyncio.CancelledError:
+                    pass
+
+    async def _read_stream(self, fanout: _StreamFanout) -> None:
+        client = self._client_factory()
+        count = self._read_count
+        while fanout.subscribers:
+            try:
+                response = await client.xread(
+                    {fanout.stream: fanout.last_id, fanout.delta_stream: fanout.delta_last_id},
+                    count=count,
+                    block=self._block_ms,
+                )
+            except redis.RedisError as exc:
+                LOG.warning(
+                    "event_hub_read_failed",
+                    extra={"debate_id": fanout.debate_id, "error": str(exc)},
+                )
+                await asyncio.sleep(READ_ERROR_BACKOFF_SECONDS)
+                continue
+
+            # A full batch means the reader is behind (a new stream being
+            # replayed from the start, or a burst of deltas): grow the batch
+            # to catch up in fewer round trips, and shrink it once caught up.
+            received = sum(len(messages) for _, messages in response or [])
+            if received >= count:
+                count = min(count * 2, self._max_read_count)
+            else:
+                count = max(count // 2, self._read_count)
+
+            for stream, messages in response or []:
+                is_delta = stream == fanout.delta_stream
+                for msg_id, fields in messages:
+                    if is_delta:
+                        fanout.delta_last_id = msg_id
+                    else:
+                        fanout.last_id = msg_id
+                    try:
+                        event = format_stream_event(fields, None if is_delta else msg_id)
+                    except Exception as exc:
+                        # One bad entry must not stop the reader every viewer shares.
+                        LOG.warning(
+                            "event_hub_malformed_entry",
+                            extra={
+                                "debate_id": fanout.debate_id,
+                                "msg_id": msg_id,
+                                "error": str(exc),
+                            },
+                        )
+                        continue
+                    if is_delta:
+                        fanout.deltas.append(event)
+                    else:
+                        fanout.history.append(event)
+                        if event["event"] == "turn_done":
+                            fanout.deltas.clear()
+                    for subscription in list(fanout.subscribers):
+                        self._deliver(fanout, subscription, event)
+
+    def _deliver(self, fanout: _StreamFanout, subscription: Subscription, event: dict) -> None:
+        try:
+            subscription.queue.put_nowait(event)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self._slow_consumer_policy == SLOW_CONSUMER_DISCONNECT:
+            LOG.warning(
+                "event_hub_slow_consumer_disconnected",
+                extra={"debate_id": fanout.debate_id},
+            )
+            fanout.subscribers.discard(subscription)
+            self._disconnected_total += 1
+            self._close_subscription(subscription)
+            return
+
+        subscription.queue.get_nowait()
+        subscription.queue.put_nowait(event)
+        subscription.dropped_events += 1
+        self._dropped_events_total += 1
+
+    @staticmethod
+    def _close_subscription(subscription: Subscription) -> None:
+        if subscription.closed:
+            return
+        subscription.closed = True
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(_CLOSED)
+
+
+event_hub = DebateEventHub()
+# Read at scrape time; /metrics runs on the event loop that owns the hub.
+SSE_SUBSCRIBERS.set_function(event_hub.subscriber_count)
+SSE_STREAMS.set_function(event_hub.stream_count)
@@ -1,11 +1,15 @@
 import time
 
-from sqlalchemy import delete
+from sqlalchemy import delete, select
+from sqlalchemy.orm import aliased
 
 from app.core.config import settings
-from app.db.models import DebateRecord, DebateUsageCall, SessionRecord
+from app.db.models import DebateMetric, DebateRecord, DebateUsageCall, SessionRecord
+from app.db.owner_analytics import subtract_debates_from_owner_analytics
 from app.db.session import session_scope
 from app.services import debate_service
+from src.event_archive import delete_event_archive, purge_stale_event_archives
+from src.helpers import delete_turn_log, purge_stale_turn_logs
 
 
 def is_authorized(debate_id: str, session_id: str, user_id: str | None) -> bool:
@@ -18,23 +22,147 @@ def is_authorized(debate_id: str, session_id: str, user_id: str | None) -> bool:
     return owner.get("session_id") == session_id
 
 
-def cleanup_expired_sessions() -> int:
+def _retention_batch_size(batch_size: int | None) -> int:
+    return max(1, batch_size if batch_size is not None else settings.retention_cleanup_batch_size)
+
+
+def cleanup_expired_sessions(batch_size: int | None = None) -> int:
     now = int(time.time())
-    with session_scope() as db:
-        result = db.execute(delete(SessionRecord).where(SessionRecord.expires_at < now))
-        return int(result.rowcount or 0)
+    size = _retention_batch_size(batch_size)
+    total = 0
+    while True:
+        with session_scope() as db:
+            session_ids = db.scalars(
+                select(SessionRecord.session_id)
+                .where(SessionRecord.expires_at < now)
+                .order_by(SessionRecord.expires_at)
+                .limit(size)
+            ).all()
+            if session_ids:
+                db.execute(delete(SessionRecord).where(SessionRecord.session_id.in_(session_ids)))
+        total += len(session_ids)
+        if len(session_ids) < size:
+            return total
 
 
-def cleanup_old_debates(max_age_seconds: int | None = None) -> int:
+def purge_old_debates(
+    max_age_seconds: int | None = None,
+    batch_size: int | None = None,
+) -> dict[str, int]:
+    """Delete expired debates with their usage rows, metrics, turn logs and event archives."""
     age = (
         max_age_seconds
         if max_age_seconds is not None
         else settings.debate_retention_window_seconds
     )
     threshold = int(time.time()) - age
-    with session_scope() as db:
-        result = db.execute(delete(DebateRecord).where(DebateRecord.created_at < threshold))
-        return int(result.rowcount or 0)
+    size = _retention_batch_size(batch_size)
+    reclaimed = {
+        "debates": 0,
+        "usage_calls": 0,
+        "metrics": 0,
+        "turn_files": 0,
+        "event_archives": 0,
+    }
+    shared_copy = aliased(DebateRecord)
+
+    while True:
+        with session_scope() as db:
+            debate_ids = db.scalars(
+                select(DebateRecord.debate_id)
+                .where(DebateRecord.created_at < threshold)
+                # A debate stays while an unexpired shared-cache copy still
+                # serves its transcript and event stream.
+                .where(
+                    ~select(shared_copy.debate_id)
+                    .where(
+                        shared_copy.shared_from_debate_id == DebateRecord.debate_id,
+                        shared_copy.created_at >= threshold,
+                    )
+                    .exists()
+                )
+                .order_by(DebateRecord.created_at)
+                .limit(size)
+            ).all()
+            if debate_ids:
+                subtract_debates_from_owner_analytics(db, debate_ids)
+                reclaimed["usage_calls"] += _rowcount(
+                    db.execute(delete(DebateUsageCall).where(DebateUsageCall.debate_id.in_(debate_ids)))
+                )
+                reclaimed["metrics"] += _rowcount(
+                    db.execute(delete(DebateMetric).where(DebateMetric.debate_id.in_(debate_ids)))
+                )
+                reclaimed["debates"] += _rowcount(
+                    db.execute(delete(DebateRecord).where(DebateRecord.debate_id.in_(debate_ids)))
+                )
+
+        reclaimed["turn_files"] += sum(1 for debate_id in debate_ids if delete_turn_log(debate_id))
+        reclaimed["event_archives"] += sum(
+            1 for debate_id in debate_ids if delete_event_archive(debate_id)
+        )
+        if len(debate_ids) < size:
+            return reclaimed
+
+
+def purge_orphaned_debate_data(batch_size: int | None = None) -> dict[str, int]:
+    """Delete usage rows and metrics left behind by debates removed earlier."""
+    size = _retention_batch_size(batch_size)
+    reclaimed = {"usage_calls": 0, "metrics": 0}
+    debate_exists = select(DebateRecord.debate_id)
+
+    while True:
+        with session_scope() as db:
+            usage_ids = db.scalars(
+                select(DebateUsageCall.id)
+                .where(DebateUsageCall.debate_id.not_in(debate_exists))
+                .limit(size)
+            ).all()
+            if usage_ids:
+                reclaimed["usage_calls"] += _rowcount(
+                    db.execute(delete(DebateUsageCall).where(DebateUsageCall.id.in_(usage_ids)))
+                )
+        if len(usage_ids) < size:
+            break
+
+    while True:
+        with session_scope() as db:
+            metric_ids = db.scalars(
+                select(DebateMetric.debate_id)
+                .where(DebateMetric.debate_id.not_in(debate_exists))
+                .limit(size)
+            ).all()
+            if metric_ids:
+                reclaimed["metrics"] += _rowcount(
+                    db.execute(delete(DebateMetric).where(DebateMetric.debate_id.in_(metric_ids)))
+                )
+        if len(metric_ids) < size:
+            return reclaimed
+
+
+def cleanup_old_debates(max_age_seconds: int | None = None) -> int:
+    return purge_old_debates(max_age_seconds=max_age_seconds)["debates"]
+
+
+def run_retention_cleanup(batch_size: int | None = None) -> dict[str, int]:
+    expired = purge_old_debates(batch_size=batch_size)
+    orphaned = purge_orphaned_debate_data(batch_size=batch_size)
+    # A turn log untouched for the whole retention window belongs to a debate
+    # that is already past retention, whether or not its row still exists.
+    stale_before = time.time() - settings.debate_retention_window_seconds
+    stale_turn_files = purge_stale_turn_logs(older_than=stale_before)
+    stale_event_archives = purge_stale_event_archives(older_than=stale_before)
+    return {
+        "sessions": cleanup_expired_sessions(batch_size=batch_size),
+        "debates": expired["debates"],
+        "usage_calls": expired["usage_calls"] + orphaned["usage_calls"],
+        "metrics": expired["metrics"] + orphaned["metrics"],
+        "turn_files": expired["turn_files"] + stale_turn_files,
+        "event_archives": expired["event_archives"] + stale_event_archives,
+    }
+
+
+def _rowcount(result) -> int:
+    return int(result.rowcount or 0)
 
 
 def record_llm_call(
@@ -1,16 +1,28 @@
 import time
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.routers.debates import router as debates_router
 from app.routers.health import router as health_router
+from app.routers.metrics import router as metrics_router
 
 from app.core.config import settings
+from app.event_hub import event_hub
+from app.metrics import HTTP_REQUEST_SECONDS, METRICS_ENABLED
 from app.services.debate_service import init_db
+from src.persona_registry import persona_registry
 
 
-app = FastAPI(title=settings.api_title)
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    persona_registry.refresh(force=True)
+    yield
+    await event_hub.close()
+
+
+app = FastAPI(title=settings.api_title, lifespan=lifespan)
 init_db()
 
 app.add_middleware(
@@ -28,9 +40,18 @@ async def add_process_time_header(request: Request, call_next):
     response = await call_next(request)
     process_time = time.time() - start_time
     response.headers["X-Process-Time"] = str(process_time)
+    # Route templates, not raw paths, keep the label set bounded.
+    route = request.scope.get("route")
+    HTTP_REQUEST_SECONDS.labels(
+        method=request.method,
+        route=getattr(route, "path", "unmatched"),
+        status=str(response.status_code),
+    ).observe(process_time)
     return response
 
 
 app.include_router(health_router)
 app.include_router(debates_router)
+if METRICS_ENABLED:
+    app.include_router(metrics_router)
 
@@ -0,0 +1,241 @@
+"""Prometheus metrics for the API and the Celery worker.
+
+Both processes record into the default ``prometheus_client`` registry: the
+API serves it at ``/metrics``, the worker from a small HTTP exporter started
+on ``worker_init`` (``METRICS_WORKER_PORT``). Everything recorded here is a
+counter increment or a histogram observation on a bounded label set (flow
+step, operation, model, command, statement kind), a few microseconds per
+event, so the metrics stay on in production.
+"""
+
+import functools
+import inspect
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import redis
+import redis.asyncio as redis_async
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest, start_http_server
+from redis.client import Pipeline
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+LOG = logging.getLogger("debate_api")
+
+METRICS_ENABLED = settings.metrics_enabled
+METRICS_WORKER_PORT = settings.metrics_worker_port
+
+# Model calls and flow steps take from tens of milliseconds to minutes (with
+# retries); Redis commands and SQL statements from microseconds up.
+SLOW_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 80, 160)
+FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1, 5)
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+
+FLOW_STEP_SECONDS = Histogram(
+    "debate_flow_step_seconds",
+    "Duration of each debate flow step.",
+    ["step", "outcome"],
+    buckets=SLOW_BUCKETS,
+)
+MODEL_CALL_SECONDS = Histogram(
+    "debate_model_call_seconds",
+    "Duration of a model call or crew kickoff, including retries and backoff.",
+    ["operation", "model", "outcome"],
+    buckets=SLOW_BUCKETS,
+)
+MODEL_CALL_RETRIES = Counter(
+    "debate_model_call_retries_total",
+    "Retried model calls, by the kind of error that caused the retry.",
+    ["operation", "reason"],
+)
+MODEL_CALL_BACKOFF_SECONDS = Counter(
+    "debate_model_call_backoff_seconds_total",
+    "Time spent waiting between retries of model calls.",
+    ["operation"],
+)
+WEB_SEARCH_SECONDS = Histogram(
+    "debate_web_search_seconds",
+    "Duration of web searches sent to the search backend (cache misses).",
+    ["outcome"],
+    buckets=SLOW_BUCKETS,
+)
+WEB_SEARCH_LOOKUPS = Counter(
+    "debate_web_search_lookups_total",
+    "Web search lookups by where they were answered from.",
+    ["outcome"],
+)
+DB_FLUSH_SECONDS = Histogram(
+    "debate_db_flush_seconds",
+    "Duration of a debate write-buffer flush (one transaction).",
+    buckets=FAST_BUCKETS,
+)
+SQL_STATEMENT_SECONDS = Histogram(
+    "debate_sql_statement_seconds",
+    "Duration of SQL statements by engine and statement kind.",
+    ["engine", "statement"],
+    buckets=FAST_BUCKETS,
+)
+REDIS_COMMAND_SECONDS = Histogram(
+    "debate_redis_command_seconds",
+    "Duration of Redis commands by client and command; PIPELINE is a whole pipeline.",
+    ["client", "command"],
+    buckets=FAST_BUCKETS,
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "debate_http_request_seconds",
+    "Time to the response start of API requests, by route template.",
+    ["method", "route", "status"],
+    buckets=FAST_BUCKETS,
+)
+SSE_SUBSCRIBERS = Gauge(
+    "debate_sse_subscribers",
+    "SSE subscribers connected to this API process.",
+)
+SSE_STREAMS = Gauge(
+    "debate_sse_streams",
+    "Debate streams this API process is fanning out.",
+)
+
+
+@contextmanager
+def timed(histogram: Histogram, **labels: str) -> Iterator[None]:
+    """Observe the block's duration with ``outcome`` set to ok or error."""
+    started = time.perf_counter()
+    outcome = OUTCOME_ERROR
+    try:
+        yield
+        outcome = OUTCOME_OK
+    finally:
+        histogram.labels(outcome=outcome, **labels).observe(time.perf_counter() - started)
+
+
+def observe_flow_step(method):
+    """Time a flow step method under its own name. Goes below the crewai
+    ``@start``/``@listen``/``@router`` decorator."""
+    step = method.__name__
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_step(*args, **kwargs):
+            with timed(FLOW_STEP_SECONDS, step=step):
+                return await method(*args, **kwargs)
+
+        return async_step
+
+    @functools.wraps(method)
+    def step_wrapper(*args, **kwargs):
+        with timed(FLOW_STEP_SECONDS, step=step):
+            return method(*args, **kwargs)
+
+    return step_wrapper
+
+
+def record_retry(operation: str, reason: str, backoff_seconds: float) -> None:
+    MODEL_CALL_RETRIES.labels(operation=operation, reason=reason).inc()
+    MODEL_CALL_BACKOFF_SECONDS.labels(operation=operation).inc(backoff_seconds)
+
+
+def statement_kind(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    if keyword in ("SELECT", "INSERT", "UPDATE", "DELETE", "PRAGMA"):
+        return keyword.lower()
+    return "other"
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """Time every statement the engine executes, labelled by ``name``."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        SQL_STATEMENT_SECONDS.labels(engine=name, statement=statement_kind(statement)).observe(
+            time.perf_counter() - started
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def _failed(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started"):
+            connection.info["query_started"].pop()
+
+
+def _command_name(args: tuple) -> str:
+    name = args[0] if args else "unknown"
+    return (name.decode() if isinstance(name, bytes) else str(name)).upper()
+
+
+class InstrumentedPipeline(Pipeline):
+    def execute(self, raise_on_error: bool = True):
+        started = time.perf_counter()
+        try:
+            return super().execute(raise_on_error)
+        finally:
+            REDIS_COMMAND_SECONDS.labels(client=self.metrics_client, command="PIPELINE").observe(
+                time.perf_counter() - started
+            )
+
+
+class InstrumentedRedis(redis.Redis):
+    """``redis.Redis`` that times every command under ``metrics_client``."""
+
+    def __init__(self, *args: Any, metrics_client: str, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics_client = metrics_client
+
+    def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_SECONDS.labels(client=self.metrics_client, command=_command_name(args)).observe(
+                time.perf_counter() - started
+            )
+
+    def pipeline(self, transaction: bool = True, shard_hint: Any = None) -> Pipeline:
+        pipe = InstrumentedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+        pipe.metrics_client = self.metrics_client
+        return pipe
+
+
+class InstrumentedAsyncRedis(redis_async.Redis):
+    """``redis.asyncio.Redis`` that times every command under ``metrics_client``."""
+
+    def __init__(self, *args: Any, metrics_client: str, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics_client = metrics_client
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_SECONDS.labels(client=self.metrics_client, command=_command_name(args)).observe(
+                time.perf_counter() - started
+            )
+
+
+def render_metrics() -> tuple[bytes, str]:
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def start_worker_exporter(port: int = METRICS_WORKER_PORT) -> None:
+    if not METRICS_ENABLED or port == 0:
+        return
+    try:
+        start_http_server(port)
+    except OSError as exc:
+        # Another worker on this host already serves the port.
+        LOG.warning("metrics_exporter_unavailable port=%s error=%s", port, exc)
+        return
+    LOG.info("metrics_exporter_started port=%s", port)
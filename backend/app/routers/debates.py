@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query, Response
 from sse_starlette.sse import EventSourceResponse
 
 from app import debate_orchestration
 from app import debate_queries
+from app.core.config import settings
 from app.schemas.debate import DebateRequest
 
 
@@ -19,17 +20,32 @@ async def debate_events(
     debate_id: str,
     session_id: str = Query(...),
     user_id: str | None = Query(default=None),
+    last_event_id: str | None = Query(default=None),
+    last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
 ):
-    debate_orchestration.validate_stream_access(debate_id, session_id, user_id)
-    return EventSourceResponse(debate_orchestration.stream_debate_events(debate_id))
+    stream_debate_id = debate_orchestration.validate_stream_access(debate_id, session_id, user_id)
+    resume_from = last_event_id_header or last_event_id
+    if not await debate_orchestration.has_unsent_events(stream_debate_id, resume_from):
+        return Response(status_code=204)
+    return EventSourceResponse(
+        debate_orchestration.stream_debate_events(stream_debate_id, last_event_id=resume_from)
+    )
+
+
+@router.get("/debaters")
+def list_debaters():
+    return debate_queries.get_debaters()
 
 
 @router.get("/debates")
 def list_debates(
     session_id: str = Query(...),
     user_id: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=settings.debates_page_size_max),
+    cursor: str | None = Query(default=None),
+    fields: str | None = Query(default=None),
 ):
-    return debate_queries.get_debates(session_id, user_id)
+    return debate_queries.get_debates(session_id, user_id, limit=limit, cursor=cursor, fields=fields)
 
 
 @router.get("/debates/analytics")
@@ -44,5 +60,8 @@ def debates_analytics(
 def debates_overview(
     session_id: str = Query(...),
     user_id: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=settings.debates_page_size_max),
+    cursor: str | None = Query(default=None),
+    fields: str | None = Query(default=None),
 ):
-    return debate_queries.get_debates_overview(session_id, user_id)
+    return debate_queries.get_debates_overview(session_id, user_id, limit=limit, cursor=cursor, fields=fields)
@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
-from app.cache import events_redis_client, redis_client
+from app.cache import events_redis_client, get_shared_cache_stats, redis_client
+from app.event_hub import event_hub
+from src.search_cache import get_search_cache_stats
 
 router = APIRouter()
 
@@ -22,3 +24,18 @@ def redis_test():
         "cache_redis": redis_client.get(cache_key),
         "events_redis": events_redis_client.get(events_key),
     }
+
+
+@router.get("/health/streams")
+def get_stream_health():
+    return event_hub.metrics()
+
+
+@router.get("/health/shared-cache")
+def get_shared_cache_health():
+    return get_shared_cache_stats()
+
+
+@router.get("/health/search-cache")
+def get_search_cache_health():
+    return get_search_cache_stats()
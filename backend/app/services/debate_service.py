@@ -1,12 +1,16 @@
+import threading
 import time
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
 
 from app.db.base import init_db as init_database
-from app.db.models import DebateMetric, DebateRecord, DebateUsageCall, SessionRecord
-from app.db.session import session_scope
+from app.db.models import DebateMetric, DebateRecord, DebateUsageCall, OwnerAnalytics, SessionRecord
+from app.db.owner_analytics import apply_owner_analytics_delta, owner_key
+from app.db.session import read_session_scope, session_scope
 
 from app.core.config import settings
+from app.metrics import DB_FLUSH_SECONDS
 
 
 def init_db() -> None:
@@ -62,6 +66,46 @@ def create_debate(
                 summary=None,
             )
         )
+        apply_owner_analytics_delta(db, owner_key(session_id, user_id), debate_count=1)
+
+
+def create_shared_debate_copy(
+    debate_id: str,
+    session_id: str,
+    user_id: str | None,
+    topic: str,
+    debater_1: str,
+    debater_2: str,
+    source_debate_id: str,
+) -> bool:
+    """Give an owner a completed debate that reuses another debate's artifacts.
+
+    Returns False when the source is gone or did not complete, in which case
+    nothing is written and the caller should generate the debate itself.
+    """
+    now = int(time.time())
+    with session_scope() as db:
+        source = db.get(DebateRecord, source_debate_id)
+        if source is None or source.status != "completed":
+            return False
+        db.add(
+            DebateRecord(
+                debate_id=debate_id,
+                session_id=session_id,
+                user_id=user_id,
+                topic=topic,
+                debater_1=debater_1,
+                debater_2=debater_2,
+                created_at=now,
+                status="completed",
+                completed_at=now,
+                error_message=None,
+                summary=source.summary,
+                shared_from_debate_id=source.shared_from_debate_id or source.debate_id,
+            )
+        )
+        apply_owner_analytics_delta(db, owner_key(session_id, user_id), debate_count=1)
+    return True
 
 
 def get_debate_owner(debate_id: str) -> dict[str, str | None] | None:
@@ -71,6 +115,7 @@ def get_debate_owner(debate_id: str) -> dict[str, str | None] | None:
                 DebateRecord.debate_id,
                 DebateRecord.session_id,
                 DebateRecord.user_id,
+                DebateRecord.shared_from_debate_id,
             ).where(DebateRecord.debate_id == debate_id)
         ).one_or_none()
         if row is None:
@@ -78,33 +123,94 @@ def get_debate_owner(debate_id: str) -> dict[str, str | None] | None:
         return dict(row._mapping)
 
 
+def _apply_debate_status(
+    db: Session,
+    debate_id: str,
+    status: str,
+    error_message: str | None,
+    now: int,
+) -> None:
+    debate = db.get(DebateRecord, debate_id)
+    if debate is None:
+        return
+
+    debate.status = status
+    if status == "completed":
+        debate.completed_at = now
+        debate.error_message = None
+    elif status == "failed":
+        debate.completed_at = now
+        debate.error_message = error_message
+
+
 def update_debate_status(
     debate_id: str,
     status: str,
     error_message: str | None = None,
 ) -> None:
-    now = int(time.time())
-
     with session_scope() as db:
-        debate = db.get(DebateRecord, debate_id)
-        if debate is None:
-            return
+        _apply_debate_status(db, debate_id, status, error_message, int(time.time()))
 
-        debate.status = status
-        if status == "completed":
-            debate.completed_at = now
-            debate.error_message = None
-        elif status == "failed":
-            debate.completed_at = now
-            debate.error_message = error_message
+
+def _apply_debate_summary(db: Session, debate_id: str, summary: str) -> None:
+    debate = db.get(DebateRecord, debate_id)
+    if debate is None:
+        return
+    debate.summary = summary
 
 
 def update_debate_summary(debate_id: str, summary: str) -> None:
     with session_scope() as db:
-        debate = db.get(DebateRecord, debate_id)
-        if debate is None:
-            return
-        debate.summary = summary
+        _apply_debate_summary(db, debate_id, summary)
+
+
+def _apply_debate_metrics(
+    db: Session,
+    debate_id: str,
+    tokens_delta: int,
+    cost_delta: float,
+    duration_seconds: int | None,
+    now: int,
+) -> None:
+    existing = db.get(DebateMetric, debate_id)
+    if existing is None:
+        existing = DebateMetric(
+            debate_id=debate_id,
+            total_tokens=0,
+            total_cost_usd=0.0,
+            duration_seconds=None,
+            updated_at=now,
+        )
+        db.add(existing)
+    before = (existing.total_tokens, existing.total_cost_usd, existing.duration_seconds or 0)
+
+    existing.total_tokens = max(0, existing.total_tokens + int(tokens_delta))
+    existing.total_cost_usd = max(0.0, existing.total_cost_usd + float(cost_delta))
+    if duration_seconds is not None:
+        existing.duration_seconds = duration_seconds
+    existing.updated_at = now
+    # Later changes in the same unit of work must see a newly added row.
+    db.flush()
+    _apply_owner_metric_delta(db, debate_id, existing, before)
+
+
+def _apply_owner_metric_delta(
+    db: Session,
+    debate_id: str,
+    metric: DebateMetric,
+    before: tuple[int, float, int],
+) -> None:
+    debate = db.get(DebateRecord, debate_id)
+    if debate is None:
+        return
+    tokens_before, cost_before, duration_before = before
+    apply_owner_analytics_delta(
+        db,
+        owner_key(debate.session_id, debate.user_id),
+        total_tokens=metric.total_tokens - tokens_before,
+        total_cost_usd=metric.total_cost_usd - cost_before,
+        total_duration_seconds=(metric.duration_seconds or 0) - duration_before,
+    )
 
 
 def update_debate_metrics(
@@ -113,75 +219,214 @@ def update_debate_metrics(
     cost_delta: float,
     duration_seconds: int | None = None,
 ) -> None:
-    now = int(time.time())
     with session_scope() as db:
-        existing = db.get(DebateMetric, debate_id)
-        if existing is None:
-            db.add(
-                DebateMetric(
-                    debate_id=debate_id,
-                    total_tokens=max(0, int(tokens_delta)),
-                    total_cost_usd=max(0.0, float(cost_delta)),
-                    duration_seconds=duration_seconds,
-                    updated_at=now,
-                )
-            )
-            return
+        _apply_debate_metrics(
+            db,
+            debate_id,
+            tokens_delta,
+            cost_delta,
+            duration_seconds,
+            int(time.time()),
+        )
+
+
+def _apply_finalize_debate_duration(db: Session, debate_id: str, now: int) -> None:
+    debate = db.get(DebateRecord, debate_id)
+    if debate is None:
+        return
+    if debate.created_at is None or debate.completed_at is None:
+        return
+
+    duration_seconds = max(0, int(debate.completed_at - debate.created_at))
+    existing = db.get(DebateMetric, debate_id)
+    if existing is None:
+        existing = DebateMetric(
+            debate_id=debate_id,
+            total_tokens=0,
+            total_cost_usd=0.0,
+            duration_seconds=None,
+            updated_at=now,
+        )
+        db.add(existing)
+    before = (existing.total_tokens, existing.total_cost_usd, existing.duration_seconds or 0)
 
-        existing.total_tokens = max(0, existing.total_tokens + int(tokens_delta))
-        existing.total_cost_usd = max(0.0, existing.total_cost_usd + float(cost_delta))
-        if duration_seconds is not None:
-            existing.duration_seconds = duration_seconds
-        existing.updated_at = now
+    existing.duration_seconds = duration_seconds
+    existing.updated_at = now
+    db.flush()
+    _apply_owner_metric_delta(db, debate_id, existing, before)
 
 
 def finalize_debate_duration(debate_id: str) -> None:
     with session_scope() as db:
-        debate = db.get(DebateRecord, debate_id)
-        if debate is None:
-            return
-        if debate.created_at is None or debate.completed_at is None:
-            return
+        _apply_finalize_debate_duration(db, debate_id, int(time.time()))
+
+
+class DebateWriteBuffer:
+    """Write-behind unit of work for one running debate.
+
+    Usage rows, metric deltas, the summary and the final status are kept in
+    memory and written together in a single transaction by ``flush``. The flow
+    calls ``flush_if_due`` after each step, which writes at most once per
+    ``flush_interval_seconds``, and calls ``flush`` explicitly when the debate
+    completes or fails.
+    """
+
+    def __init__(
+        self,
+        debate_id: str,
+        flush_interval_seconds: float = settings.debate_write_flush_interval_seconds,
+    ):
+        self.debate_id = debate_id
+        self._flush_interval_seconds = flush_interval_seconds
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._usage_calls: list[DebateUsageCall] = []
+        self._tokens_delta = 0
+        self._cost_delta = 0.0
+        self._has_metrics = False
+        self._summary: str | None = None
+        self._status: tuple[str, str | None, int] | None = None
+        self._finalize_duration = False
+
+    @property
+    def pending(self) -> bool:
+        return bool(
+            self._usage_calls
+            or self._has_metrics
+            or self._summary is not None
+            or self._status is not None
+            or self._finalize_duration
+        )
 
-        duration_seconds = max(0, int(debate.completed_at - debate.created_at))
-        existing = db.get(DebateMetric, debate_id)
-        now = int(time.time())
-        if existing is None:
-            db.add(
-                DebateMetric(
-                    debate_id=debate_id,
-                    total_tokens=0,
-                    total_cost_usd=0.0,
-                    duration_seconds=duration_seconds,
-                    updated_at=now,
+    def record_llm_call(
+        self,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cost_usd: float,
+    ) -> None:
+        with self._lock:
+            self._usage_calls.append(
+                DebateUsageCall(
+                    debate_id=self.debate_id,
+                    model=model,
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    cost_usd=cost_usd,
+                    created_at=int(time.time()),
                 )
             )
-            return
-
-        existing.duration_seconds = duration_seconds
-        existing.updated_at = now
 
+    def update_metrics(self, tokens_delta: int, cost_delta: float) -> None:
+        with self._lock:
+            self._tokens_delta += int(tokens_delta)
+            self._cost_delta += float(cost_delta)
+            self._has_metrics = True
+
+    def update_summary(self, summary: str) -> None:
+        with self._lock:
+            self._summary = summary
+
+    def update_status(self, status: str, error_message: str | None = None) -> None:
+        with self._lock:
+            self._status = (status, error_message, int(time.time()))
+
+    def finalize_duration(self) -> None:
+        with self._lock:
+            self._finalize_duration = True
+
+    def flush_if_due(self) -> None:
+        if time.monotonic() - self._last_flush >= self._flush_interval_seconds:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self.pending:
+                self._last_flush = time.monotonic()
+                return
+            usage_calls = self._usage_calls
+            has_metrics = self._has_metrics
+            tokens_delta = self._tokens_delta
+            cost_delta = self._cost_delta
+            summary = self._summary
+            status = self._status
+            finalize_duration = self._finalize_duration
+            self._reset()
+            self._last_flush = time.monotonic()
 
-def list_debates_with_metrics(session_id: str, user_id: str | None) -> list[dict]:
-    with session_scope() as db:
-        stmt = (
-            select(
-                DebateRecord.debate_id,
-                DebateRecord.topic,
-                DebateRecord.debater_1,
-                DebateRecord.debater_2,
-                DebateRecord.status,
-                DebateRecord.created_at,
-                DebateRecord.completed_at,
-                DebateRecord.error_message,
-                DebateRecord.summary,
-                func.coalesce(DebateMetric.total_tokens, 0).label("total_tokens"),
-                func.coalesce(DebateMetric.total_cost_usd, 0.0).label("total_cost_usd"),
-                func.coalesce(DebateMetric.duration_seconds, 0).label("duration_seconds"),
-            )
-            .outerjoin(DebateMetric, DebateMetric.debate_id == DebateRecord.debate_id)
-            .order_by(DebateRecord.created_at.desc())
-        )
+        now = int(time.time())
+        try:
+            with DB_FLUSH_SECONDS.time(), session_scope() as db:
+                db.add_all(usage_calls)
+                if has_metrics:
+                    _apply_debate_metrics(db, self.debate_id, tokens_delta, cost_delta, None, now)
+                if summary is not None:
+                    _apply_debate_summary(db, self.debate_id, summary)
+                if status is not None:
+                    status_value, error_message, status_at = status
+                    _apply_debate_status(db, self.debate_id, status_value, error_message, status_at)
+                if finalize_duration:
+                    _apply_finalize_debate_duration(db, self.debate_id, now)
+        except Exception:
+            # Put the batch back ahead of anything recorded since the snapshot
+            # so the next flush retries it.
+            with self._lock:
+                self._usage_calls[:0] = usage_calls
+                self._tokens_delta += tokens_delta
+                self._cost_delta += cost_delta
+                self._has_metrics = self._has_metrics or has_metrics
+                if self._summary is None:
+                    self._summary = summary
+                if self._status is None:
+                    self._status = status
+                self._finalize_duration = self._finalize_duration or finalize_duration
+            raise
+
+
+DEBATE_LIST_COLUMNS = {
+    "debate_id": DebateRecord.debate_id,
+    "topic": DebateRecord.topic,
+    "debater_1": DebateRecord.debater_1,
+    "debater_2": DebateRecord.debater_2,
+    "status": DebateRecord.status,
+    "created_at": DebateRecord.created_at,
+    "completed_at": DebateRecord.completed_at,
+    "error_message": DebateRecord.error_message,
+    "summary": DebateRecord.summary,
+    "total_tokens": func.coalesce(DebateMetric.total_tokens, 0).label("total_tokens"),
+    "total_cost_usd": func.coalesce(DebateMetric.total_cost_usd, 0.0).label("total_cost_usd"),
+    "duration_seconds": func.coalesce(DebateMetric.duration_seconds, 0).label("duration_seconds"),
+}
+_METRIC_COLUMNS = {"total_tokens", "total_cost_usd", "duration_seconds"}
+
+
+def list_debates_with_metrics(
+    session_id: str,
+    user_id: str | None,
+    limit: int | None = None,
+    after: tuple[int, str] | None = None,
+    columns: list[str] | None = None,
+) -> list[dict]:
+    """Owner's debates, newest first, as one keyset page.
+
+    ``after`` is the ``(created_at, debate_id)`` of the last row of the previous
+    page. ``columns`` restricts the selected columns; ``debate_id`` and
+    ``created_at`` are always included because they form the cursor.
+    """
+    names = list(DEBATE_LIST_COLUMNS)
+    if columns is not None:
+        names = ["debate_id", "created_at"] + [
+            name for name in columns if name not in ("debate_id", "created_at")
+        ]
+
+    with read_session_scope() as db:
+        stmt = select(*(DEBATE_LIST_COLUMNS[name] for name in names))
+        if _METRIC_COLUMNS.intersection(names):
+            stmt = stmt.outerjoin(DebateMetric, DebateMetric.debate_id == DebateRecord.debate_id)
+        stmt = stmt.order_by(DebateRecord.created_at.desc(), DebateRecord.debate_id.desc())
 
         if user_id:
             stmt = stmt.where(DebateRecord.user_id == user_id)
@@ -191,45 +436,42 @@ def list_debates_with_metrics(session_id: str, user_id: str | None) -> list[dict
                 DebateRecord.user_id.is_(None),
             )
 
+        if after is not None:
+            after_created_at, after_debate_id = after
+            stmt = stmt.where(
+                or_(
+                    DebateRecord.created_at < after_created_at,
+                    and_(
+                        DebateRecord.created_at == after_created_at,
+                        DebateRecord.debate_id < after_debate_id,
+                    ),
+                )
+            )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
         rows = db.execute(stmt).all()
         return [dict(row._mapping) for row in rows]
 
 
 def get_debate_analytics_totals(session_id: str, user_id: str | None) -> dict | None:
-    with session_scope() as db:
-        stmt = select(
-            func.count(DebateRecord.debate_id).label("debate_count"),
-            func.coalesce(func.sum(func.coalesce(DebateMetric.total_tokens, 0)), 0).label(
-                "total_tokens"
-            ),
-            func.coalesce(func.sum(func.coalesce(DebateMetric.total_cost_usd, 0.0)), 0.0).label(
-                "total_cost_usd"
-            ),
-            func.coalesce(
-                func.sum(func.coalesce(DebateMetric.duration_seconds, 0)),
-                0,
-            ).label("total_duration_seconds"),
-        ).outerjoin(DebateMetric, DebateMetric.debate_id == DebateRecord.debate_id)
-
-        if user_id:
-            stmt = stmt.where(DebateRecord.user_id == user_id)
-        else:
-            stmt = stmt.where(
-                DebateRecord.session_id == session_id,
-                DebateRecord.user_id.is_(None),
-            )
-
-        row = db.execute(stmt).one_or_none()
+    with read_session_scope() as db:
+        row = db.get(OwnerAnalytics, owner_key(session_id, user_id))
         if row is None:
             return None
-        return dict(row._mapping)
+        return {
+            "debate_count": row.debate_count,
+            "total_tokens": row.total_tokens,
+            "total_cost_usd": row.total_cost_usd,
+            "total_duration_seconds": row.total_duration_seconds,
+        }
 
 
 def get_cost_breakdown_for_debates(debate_ids: list[str]) -> dict[str, list[dict]]:
     if not debate_ids:
         return {}
 
-    with session_scope() as db:
+    with read_session_scope() as db:
         rows = db.execute(
             select(
                 DebateUsageCall.debate_id,
@@ -1,25 +1,47 @@
 import asyncio
+import threading
+
+from celery.signals import worker_init
 
 from app.celery_app import celery_app
+from app.metrics import start_worker_exporter
 from app.services import debate_service
 from src.flow import run_debate_flow
+from src.persona_registry import persona_registry
+
+# Every debate in this worker process runs on one long-lived event loop; Celery's
+# thread pool (sized by worker_debate_concurrency) only waits on the results.
+# Blocking LLM calls are pushed to src.executor, so the loop can interleave
+# debates while each one waits on its model.
+_debate_loop: asyncio.AbstractEventLoop | None = None
+_debate_loop_lock = threading.Lock()
+
+
+def _get_debate_loop() -> asyncio.AbstractEventLoop:
+    global _debate_loop
+    with _debate_loop_lock:
+        if _debate_loop is None or _debate_loop.is_closed():
+            _debate_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_debate_loop.run_forever,
+                name="debate-loop",
+                daemon=True,
+            ).start()
+        return _debate_loop
+
+
+@worker_init.connect
+def _load_personas(**_kwargs) -> None:
+    persona_registry.refresh(force=True)
+
+
+@worker_init.connect
+def _start_metrics_exporter(**_kwargs) -> None:
+    start_worker_exporter()
 
 
 def _run_async(coro):
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    if loop.is_running():
-        new_loop = asyncio.new_event_loop()
-        try:
-            return new_loop.run_until_complete(coro)
-        finally:
-            new_loop.close()
-
-    return loop.run_until_complete(coro)
+    return asyncio.run_coroutine_threadsafe(coro, _get_debate_loop()).result()
 
 
 @celery_app.task(name="debate.run_debate")
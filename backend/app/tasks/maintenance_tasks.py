@@ -0,0 +1,12 @@
+from app.celery_app import celery_app
+from app.core.logger import logger
+from app.helpers import debate_helpers
+from app.services import debate_service
+
+
+@celery_app.task(name="debate.cleanup_retention")
+def cleanup_retention_task() -> dict[str, int]:
+    debate_service.init_db()
+    reclaimed = debate_helpers.run_retention_cleanup()
+    logger.info("retention_cleanup reclaimed=%s", reclaimed)
+    return reclaimed
@@ -0,0 +1,146 @@
+"""SQLite contention: N writer threads vs M reader threads, per engine profile.
+
+Writers behave like Celery workers flushing a debate step (usage rows plus a
+metrics update in one transaction); readers behave like the API's debate list
+endpoint. The ``baseline`` profile is a plain SQLAlchemy engine in the default
+rollback-journal mode, as before the engine profiles existed; ``tuned`` uses
+the default profiles (WAL, PRAGMAs, separate read-only engine). Each profile
+runs against a fresh database file.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_db_contention --writers 4 --readers 8 --seconds 10
+"""
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from sqlalchemy.exc import OperationalError
+
+import app.db.session as db_session
+from app.db.session import EngineProfile, reconfigure_database
+from app.services import debate_service
+from app.services.debate_service import DebateWriteBuffer
+
+SESSION_ID = "bench-session"
+SEED_DEBATES = 200
+
+
+def _baseline_profile(_database_url: str, _read_only: bool = False) -> EngineProfile:
+    return EngineProfile(connect_args={"check_same_thread": False})
+
+
+PROFILES = {
+    "baseline": _baseline_profile,
+    "tuned": None,
+}
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _seed(debate_ids: list[str]) -> None:
+    for debate_id in debate_ids:
+        debate_service.create_debate(debate_id, SESSION_ID, None, "bench topic", "A", "B")
+
+
+def _run(profile_name: str, writers: int, readers: int, seconds: float) -> dict:
+    db_path = Path(tempfile.mkdtemp()) / f"{profile_name}.db"
+    reconfigure_database(f"sqlite:///{db_path.as_posix()}", profile_factory=PROFILES[profile_name])
+    debate_service.init_db()
+    debate_ids = [str(uuid.uuid4()) for _ in range(SEED_DEBATES)]
+    _seed(debate_ids)
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    write_latencies: list[float] = []
+    read_latencies: list[float] = []
+    errors = {"locked": 0}
+
+    def writer(index: int) -> None:
+        debate_id = debate_ids[index % len(debate_ids)]
+        writes = DebateWriteBuffer(debate_id, flush_interval_seconds=0)
+        while not stop.is_set():
+            writes.record_llm_call("bench/model", input_tokens=100, output_tokens=50, cost_usd=0.001)
+            writes.record_llm_call("bench/model", input_tokens=120, output_tokens=60, cost_usd=0.001)
+            writes.update_metrics(tokens_delta=330, cost_delta=0.002)
+            started = time.perf_counter()
+            try:
+                writes.flush()
+            except OperationalError:
+                with lock:
+                    errors["locked"] += 1
+                continue
+            with lock:
+                write_latencies.append((time.perf_counter() - started) * 1000)
+
+    def reader() -> None:
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                rows = debate_service.list_debates_with_metrics(SESSION_ID, None, limit=51)
+                debate_service.get_cost_breakdown_for_debates([row["debate_id"] for row in rows[:50]])
+            except OperationalError:
+                with lock:
+                    errors["locked"] += 1
+                continue
+            with lock:
+                read_latencies.append((time.perf_counter() - started) * 1000)
+
+    threads = [threading.Thread(target=writer, args=(index,)) for index in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    db_session.engine.dispose()
+    db_session.read_engine.dispose()
+    return {
+        "writes": write_latencies,
+        "reads": read_latencies,
+        "locked_errors": errors["locked"],
+        "seconds": seconds,
+    }
+
+
+def _report(name: str, result: dict) -> None:
+    for kind in ("writes", "reads"):
+        samples = result[kind]
+        if not samples:
+            print(f"{name:>8} {kind:>6}: no successful operations")
+            continue
+        print(
+            f"{name:>8} {kind:>6}: n={len(samples)} "
+            f"throughput={len(samples) / result['seconds']:.1f}/s "
+            f"p50={statistics.median(samples):.2f}ms "
+            f"p95={_percentile(samples, 95):.2f}ms "
+            f"p99={_percentile(samples, 99):.2f}ms"
+        )
+    print(f"{name:>8} 'database is locked' errors: {result['locked_errors']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    args = parser.parse_args()
+
+    for name in args.profiles:
+        _report(name, _run(name, args.writers, args.readers, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""End-to-end debate throughput: POST /debate -> Celery -> SSE, fully offline.
+
+Runs the API under uvicorn and a Celery worker (threads pool) in this
+process, both against the Redis configured in settings, with the fake LLM
+provider and fake search backend (``LLM_PROVIDER=fake``,
+``WEB_SEARCH_BACKEND=fake``), the rate limiter off and a throwaway SQLite
+database. Each debate gets a fresh topic, so every one runs the whole flow.
+Clients post a debate and follow its SSE stream to ``debate_completed``.
+
+Reported:
+
+- debates/min over the wall time of the run;
+- per-step latency, the gap between a step's ``*_done`` event and the
+  previous step's (or the POST response, for the first), taken from Redis
+  stream ids (publish time);
+- SSE delivery lag, receive time minus publish time, per event;
+- DB write time, the duration of each ``DebateWriteBuffer.flush``.
+
+Use a Redis database no real worker consumes from (e.g.
+``CELERY_BROKER_URL=redis://localhost:6379/14``); fake search results are
+written to the search cache like real ones.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_end_to_end --debates 40 --concurrency 8 --llm-latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+import httpx
+
+DEBATERS = ("elon_musk", "greta")
+# Emitted inside a step rather than at its end.
+INTRA_STEP_EVENTS = frozenset({"ping", "turn_delta", "agent_done"})
+
+
+def _configure_environment(args: argparse.Namespace) -> None:
+    # Settings are read at import time, so this runs before any app import.
+    os.environ.update(
+        {
+            "LLM_PROVIDER": "fake",
+            "FAKE_LLM_LATENCY_SECONDS": str(args.llm_latency),
+            "FAKE_LLM_FAILURE_RATE": str(args.failure_rate),
+            "FAKE_LLM_RATE_LIMIT_RATE": str(args.rate_limit_rate),
+            "WEB_SEARCH_BACKEND": "fake",
+            "FAKE_SEARCH_LATENCY_SECONDS": str(args.search_latency),
+            "RATE_LIMIT_ENABLED": "false",
+            "ENABLE_DEBATE_CACHE": "false",
+            "WORKER_DEBATE_CONCURRENCY": str(args.concurrency),
+            "CREWAI_DISABLE_TELEMETRY": "true",
+            "OTEL_SDK_DISABLED": "true",
+        }
+    )
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {}
+    return {f"p{pct}": round(_percentile(samples, pct), 1) for pct in (50, 95, 99)}
+
+
+def _summary(samples: list[float]) -> str:
+    if not samples:
+        return "n=0"
+    return (
+        f"n={len(samples)} "
+        f"p50={_percentile(samples, 50):.1f}ms "
+        f"p95={_percentile(samples, 95):.1f}ms "
+        f"p99={_percentile(samples, 99):.1f}ms "
+        f"max={max(samples):.1f}ms"
+    )
+
+
+def _stream_id_ms(entry_id: str) -> int:
+    return int(entry_id.split("-", 1)[0])
+
+
+def _time_db_flushes(samples: list[float]) -> None:
+    from app.services.debate_service import DebateWriteBuffer
+
+    flush = DebateWriteBuffer.flush
+    lock = threading.Lock()
+
+    def timed_flush(self) -> None:
+        started = time.perf_counter()
+        try:
+            flush(self)
+        finally:
+            with lock:
+                samples.append((time.perf_counter() - started) * 1000)
+
+    DebateWriteBuffer.flush = timed_flush
+
+
+def _start_api(port: int):
+    import uvicorn
+
+    from app.main import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, name="bench-api", daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("API server failed to start")
+        time.sleep(0.05)
+    return server, thread
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _run_debate(client: httpx.AsyncClient, results: dict) -> None:
+    session_id = f"bench-{uuid.uuid4().hex}"
+    response = await client.post(
+        "/debate",
+        json={
+            "topic": f"Should cities ban cars from downtown? bench {uuid.uuid4().hex[:8]}",
+            "debater_1": DEBATERS[0],
+            "debater_2": DEBATERS[1],
+            "session_id": session_id,
+        },
+    )
+    response.raise_for_status()
+    debate_id = response.json()["debate_id"]
+
+    previous_ms = time.time() * 1000
+    event_name, outcome = None, "debate_unfinished"
+    async with client.stream(
+        "GET", f"/debate/{debate_id}/events", params={"session_id": session_id}
+    ) as stream:
+        entry_id = None
+        async for line in stream.aiter_lines():
+            if line.startswith("event:"):
+                event_name = line.split(":", 1)[1].strip()
+            elif line.startswith("id:"):
+                entry_id = line.split(":", 1)[1].strip()
+            elif line == "" and event_name is not None:
+                if entry_id:
+                    published_ms = _stream_id_ms(entry_id)
+                    results["lag"].append(time.time() * 1000 - published_ms)
+                    if event_name not in INTRA_STEP_EVENTS:
+                        results["steps"][event_name].append(published_ms - previous_ms)
+                        previous_ms = published_ms
+                if event_name in ("debate_completed", "debate_failed"):
+                    outcome = event_name
+                    break
+                event_name, entry_id = None, None
+    results[outcome] += 1
+
+
+async def _drive(base_url: str, debates: int, concurrency: int, results: dict) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    timeout = httpx.Timeout(10.0, read=120.0)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
+
+        async def one() -> None:
+            async with semaphore:
+                try:
+                    await _run_debate(client, results)
+                except httpx.HTTPError as exc:
+                    results["client_errors"] += 1
+                    logging.getLogger("bench").warning("debate_request_failed error=%s", exc)
+
+        await asyncio.gather(*(one() for _ in range(debates)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debates", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=8, help="debates in flight and worker threads")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="seconds per fake LLM call")
+    parser.add_argument("--search-latency", type=float, default=0.02, help="seconds per fake search")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+    _configure_environment(args)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    from celery.contrib.testing.worker import start_worker
+
+    from app.celery_app import celery_app
+    from app.db.session import reconfigure_database
+    from app.services import debate_service
+    from app.tasks import debate_tasks  # noqa: F401  registers debate.run_debate
+    from src.persona_registry import persona_registry
+
+    db_path = Path(tempfile.mkdtemp()) / "bench.db"
+    reconfigure_database(f"sqlite:///{db_path.as_posix()}")
+    debate_service.init_db()
+    persona_registry.refresh(force=True)
+
+    flush_samples: list[float] = []
+    _time_db_flushes(flush_samples)
+    results: dict = defaultdict(int, lag=[], steps=defaultdict(list))
+
+    port = _free_port()
+    server, server_thread = _start_api(port)
+    with start_worker(
+        celery_app,
+        pool="threads",
+        concurrency=args.concurrency,
+        perform_ping_check=False,
+        shutdown_timeout=30.0,
+    ):
+        started = time.perf_counter()
+        asyncio.run(_drive(f"http://127.0.0.1:{port}", args.debates, args.concurrency, results))
+        wall_seconds = time.perf_counter() - started
+    server.should_exit = True
+    server_thread.join(timeout=10)
+
+    report = {
+        "debates": args.debates,
+        "completed": results["debate_completed"],
+        "failed": results["debate_failed"] + results["client_errors"] + results["debate_unfinished"],
+        "wall_seconds": round(wall_seconds, 2),
+        "debates_per_min": round(results["debate_completed"] / wall_seconds * 60, 1),
+        "steps_ms": {name: _percentiles(samples) for name, samples in results["steps"].items()},
+        "sse_lag_ms": _percentiles(results["lag"]),
+        "db_flush_ms": _percentiles(flush_samples),
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(
+        f"debates: {report['completed']}/{args.debates} completed, {report['failed']} failed "
+        f"in {wall_seconds:.1f}s -> {report['debates_per_min']} debates/min"
+    )
+    for name, samples in sorted(results["steps"].items()):
+        print(f"  step {name:<28} {_summary(samples)}")
+    print(f"  sse delivery lag{'':<19} {_summary(results['lag'])}")
+    print(f"  db write (flush){'':<19} {_summary(flush_samples)}")
+    if statistics.fmean(results["lag"] or [0]) < 0:
+        print("  note: negative lag means the Redis host clock is ahead of this one")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""POST /debate latency under concurrent load: async vs blocking Redis helpers.
+
+Drives the FastAPI app in-process through httpx's ASGI transport against the
+Redis configured in settings, with Celery dispatch disabled. Each request uses
+a fresh topic so it takes the full cache-miss path (the claim-or-join script
+that checks the cache and takes the lock, then the inflight key write). The ``sync`` run rebinds the orchestration helpers to the
+blocking ``redis.Redis`` functions, which is how the API behaved before the
+async client layer.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_start_debate --requests 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+
+import api as api_module
+from app import cache, debate_orchestration
+from app.db.session import reconfigure_database
+from app.services import debate_service
+
+HANDSHAKE_HELPERS = (
+    "claim_or_join_generation",
+    "delete_inflight_debate_id",
+    "release_generation_lock",
+    "set_inflight_debate_id",
+)
+
+
+def _blocking(sync_fn):
+    async def wrapper(*args, **kwargs):
+        return sync_fn(*args, **kwargs)
+
+    return wrapper
+
+
+def _use_implementation(name: str) -> None:
+    for helper in HANDSHAKE_HELPERS:
+        async_name = f"{helper}_async"
+        if name == "sync":
+            implementation = _blocking(getattr(cache, helper))
+        else:
+            implementation = getattr(cache, async_name)
+        setattr(debate_orchestration, async_name, implementation)
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _run(total_requests: int, concurrency: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=api_module.app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one_request() -> None:
+            payload = {
+                "topic": f"bench topic {uuid.uuid4().hex}",
+                "debater_1": "elon_musk",
+                "debater_2": "greta",
+                "session_id": "bench-session",
+                "user_id": "bench-user",
+            }
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post("/debate", json=payload)
+                latencies.append((time.perf_counter() - started) * 1000)
+            response.raise_for_status()
+
+        await asyncio.gather(*(one_request() for _ in range(total_requests)))
+
+    return latencies
+
+
+def _report(name: str, latencies: list[float], wall_seconds: float) -> None:
+    print(
+        f"{name:>5}: n={len(latencies)} "
+        f"p50={statistics.median(latencies):.2f}ms "
+        f"p95={_percentile(latencies, 95):.2f}ms "
+        f"p99={_percentile(latencies, 99):.2f}ms "
+        f"max={max(latencies):.2f}ms "
+        f"throughput={len(latencies) / wall_seconds:.1f} req/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--implementations", nargs="+", default=["sync", "async"])
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    db_path = Path(tempfile.mkdtemp()) / "bench.db"
+    reconfigure_database(f"sqlite:///{db_path.as_posix()}")
+    debate_service.init_db()
+
+    api_module.DEBATE_CACHE_ENABLED = True
+    api_module.enqueue_debate_task = lambda *_args, **_kwargs: "bench-task"
+
+    for name in args.implementations:
+        _use_implementation(name)
+        started = time.perf_counter()
+        latencies = asyncio.run(_run(args.requests, args.concurrency))
+        _report(name, latencies, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
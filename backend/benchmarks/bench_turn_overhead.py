@@ -0,0 +1,79 @@
+"""Per-turn setup overhead: crews and LLM clients built per step vs pooled.
+
+Measures everything a debate step does before the model call: obtaining the
+debater crew, interpolating the turn inputs into its agent and task templates,
+and obtaining a presenter LLM client. No model is called, so the numbers are
+pure client-side overhead. ``fresh`` builds ``Debate().debater_1_crew()`` and
+``LLM(...)`` every time, as the flow did before the client pools; ``pooled``
+leases them from ``src.client_pool``.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_turn_overhead --turns 200
+"""
+
+import argparse
+import statistics
+import time
+
+from crewai import LLM
+
+from src.client_pool import lease_llm
+from src.crew import PRESENTER_MODEL, Debate, lease_crew
+
+TURN_INPUTS = {
+    "topic": "Should AI be regulated like nuclear power?",
+    "debater_1": "Elon Musk",
+    "debater_2": "Greta Thunberg",
+    "debater_1_persona": "Persona profile for Elon Musk",
+    "debater_2_persona": "Persona profile for Greta Thunberg",
+    "history": "No prior debate history.",
+}
+
+
+def _fresh_turn() -> None:
+    crew = Debate().debater_1_crew()
+    crew._interpolate_inputs(TURN_INPUTS)
+    LLM(model=PRESENTER_MODEL)
+
+
+def _pooled_turn() -> None:
+    with lease_crew("debater_1_crew") as crew:
+        crew._interpolate_inputs(TURN_INPUTS)
+    with lease_llm(PRESENTER_MODEL):
+        pass
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _measure(turn, turns: int) -> list[float]:
+    turn()  # warm-up: imports, YAML parsing caches, first pool fill
+    samples = []
+    for _ in range(turns):
+        started = time.perf_counter()
+        turn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    for name, turn in (("fresh", _fresh_turn), ("pooled", _pooled_turn)):
+        samples = _measure(turn, args.turns)
+        print(
+            f"{name:>6}: mean={statistics.mean(samples):.3f}ms "
+            f"p50={_percentile(samples, 50):.3f}ms "
+            f"p95={_percentile(samples, 95):.3f}ms "
+            f"p99={_percentile(samples, 99):.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
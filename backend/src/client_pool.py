@@ -0,0 +1,106 @@
+"""Per-worker pools of LLM clients and debate crews.
+
+Building a crew means loading the agent/task YAML, constructing agents,
+their LLM clients and tools, which is paid on every turn if crews are built
+on demand. Pools keep idle instances per key and lend each one to a single
+debate step at a time, because crewai objects are not safe to share between
+concurrent calls: kickoff re-interpolates agent and task templates in place,
+and an LLM accumulates token usage across calls. Usage counters are zeroed
+on every checkout, so ``get_token_usage_summary()`` and
+``CrewOutput.token_usage`` still describe only the leased step, and each
+agent's executor starts the step with an empty conversation.
+
+litellm already caches its HTTP clients per provider, so reusing LLM objects
+also keeps their keep-alive connections.
+"""
+
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Generic, Hashable, Iterator, TypeVar
+
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM
+
+from app.core.config import settings
+
+CLIENT_POOL_MAX_IDLE = settings.client_pool_max_idle
+LLM_PROVIDER = settings.llm_provider
+
+T = TypeVar("T")
+
+
+def reset_llm_usage(llm: Any) -> None:
+    usage = getattr(llm, "_token_usage", None)
+    if isinstance(usage, dict):
+        for key in usage:
+            usage[key] = 0
+
+
+def reset_crew_state(crew: Any) -> None:
+    for agent in crew.agents:
+        reset_llm_usage(agent.llm)
+        # crewai reuses an agent's executor across kickoffs without clearing
+        # its conversation or iteration count.
+        executor = getattr(agent, "agent_executor", None)
+        if executor is not None:
+            executor.messages = []
+            executor.iterations = 0
+
+
+def build_llm(model: str, **options: Any) -> BaseLLM:
+    """LLM client for ``model`` from the configured ``LLM_PROVIDER``."""
+    if LLM_PROVIDER == "fake":
+        from .fake_llm import FakeLLM
+
+        return FakeLLM(model=model, **options)
+    return LLM(model=model, **options)
+
+
+class ClientPool(Generic[T]):
+    def __init__(self, reset: Callable[[T], None], max_idle: int = CLIENT_POOL_MAX_IDLE):
+        self._reset = reset
+        self._max_idle = max_idle
+        self._idle: dict[Hashable, list[T]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    @contextmanager
+    def lease(self, key: Hashable, factory: Callable[[], T]) -> Iterator[T]:
+        """Lend an idle instance for ``key``, building one with ``factory`` if
+        none is idle. It is returned to the pool only if the block succeeds."""
+        with self._lock:
+            idle = self._idle[key]
+            item = idle.pop() if idle else None
+            if item is None:
+                self.created += 1
+            else:
+                self.reused += 1
+        if item is None:
+            item = factory()
+        self._reset(item)
+        try:
+            yield item
+        except BaseException:
+            # Discarded: an instance that raised mid-call may hold partial state.
+            raise
+        with self._lock:
+            idle = self._idle[key]
+            if len(idle) < self._max_idle:
+                idle.append(item)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._idle.clear()
+
+
+llm_pool: ClientPool[BaseLLM] = ClientPool(reset_llm_usage)
+crew_pool: ClientPool[Any] = ClientPool(reset_crew_state)
+
+
+@contextmanager
+def lease_llm(model: str, **options: Any) -> Iterator[BaseLLM]:
+    key = (model, tuple(sorted(options.items())))
+    with llm_pool.lease(key, lambda: build_llm(model, **options)) as llm:
+        yield llm
@@ -1,7 +1,11 @@
 
+from contextlib import contextmanager
+from typing import Iterator
+
+from .client_pool import build_llm, crew_pool
 from .tools.search_tool import WebSearchTool
 from .schemas import DebateTurn, LogicalAnalystVerdict, DebateStrategistVerdict, PersuasionVerdict
-from crewai import Agent, Crew, Task, LLM
+from crewai import Agent, Crew, Task
 from crewai.project import CrewBase, agent, crew, task
 
 from app.core.config import settings
@@ -11,6 +15,7 @@ DEBATER_2_MODEL = settings.debater_two_llm_model
 JUDGE_MODEL = settings.judge_llm_model
 PRESENTER_MODEL = settings.presenter_llm_model
 SUMMARY_MODEL = settings.summary_llm_model
+TURN_STREAMING_ENABLED = settings.turn_streaming_enabled
 
 
 @CrewBase
@@ -24,14 +29,14 @@ class Debate():
     def debater_1(self) -> Agent:
         return Agent(
             config=self.agents_config['debater_1'],
-            llm=LLM(model=DEBATER_1_MODEL)
+            llm=build_llm(DEBATER_1_MODEL, stream=TURN_STREAMING_ENABLED)
         )
 
     @agent
     def debater_2(self) -> Agent:
         return Agent(
             config=self.agents_config['debater_2'],
-            llm=LLM(model=DEBATER_2_MODEL)
+            llm=build_llm(DEBATER_2_MODEL, stream=TURN_STREAMING_ENABLED)
         )
 
     @agent
@@ -39,7 +44,7 @@ class Debate():
         return Agent(
             config=self.agents_config['logical_analyst_judge'],
             verbose=True,
-            llm=LLM(model=JUDGE_MODEL)
+            llm=build_llm(JUDGE_MODEL)
         )
 
     @agent
@@ -47,7 +52,7 @@ class Debate():
         return Agent(
             config=self.agents_config['debate_strategist_judge'],
             verbose=True,
-            llm=LLM(model=JUDGE_MODEL)
+            llm=build_llm(JUDGE_MODEL)
         )
 
     @agent
@@ -55,7 +60,7 @@ class Debate():
         return Agent(
             config=self.agents_config['persuasion_judge'],
             verbose=True,
-            llm=LLM(model=JUDGE_MODEL)
+            llm=build_llm(JUDGE_MODEL)
         )
 
     @task
@@ -126,3 +131,39 @@ class Debate():
             tasks=[self.logical_analyst_verdict(), self.debate_strategist_verdict(), self.persuasion_verdict()],
             verbose=True,
         )
+
+    @crew
+    def logical_analyst_crew(self) -> Crew:
+        return Crew(
+            agents=[self.logical_analyst_judge()],
+            tasks=[self.logical_analyst_verdict()],
+            verbose=True,
+        )
+
+    @crew
+    def debate_strategist_crew(self) -> Crew:
+        return Crew(
+            agents=[self.debate_strategist_judge()],
+            tasks=[self.debate_strategist_verdict()],
+            verbose=True,
+        )
+
+    @crew
+    def persuasion_crew(self) -> Crew:
+        return Crew(
+            agents=[self.persuasion_judge()],
+            tasks=[self.persuasion_verdict()],
+            verbose=True,
+        )
+
+
+@contextmanager
+def lease_crew(name: str) -> Iterator[Crew]:
+    """Pooled crew built by ``Debate().<name>()``, e.g. ``debater_1_crew``.
+
+    Each pooled crew comes from its own ``Debate`` instance, because agents
+    and tasks are memoized per instance and must not be shared by crews that
+    run concurrently.
+    """
+    with crew_pool.lease(name, lambda: getattr(Debate(), name)()) as crew:
+        yield crew
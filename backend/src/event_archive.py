@@ -0,0 +1,90 @@
+"""Compressed archive of a finished debate's event stream.
+
+While a debate runs its events live in the ``debate:{id}`` Redis stream. Once
+it completes or fails the stream is copied into a gzipped JSON Lines file,
+one ``{"id", "event", "data"}`` object per stream entry, and the Redis key is
+given a TTL so viewers already connected can finish reading it. Later viewers
+are served straight from the file. ``turn_delta`` events are not archived:
+every streamed turn also has its ``turn_done`` event.
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+import redis
+
+from app.cache import events_redis_client
+from app.core.config import settings
+from app.event_hub import turn_delta_stream
+
+ARCHIVE_DIR = Path("data") / "debate_events"
+ARCHIVE_SUFFIX = ".jsonl.gz"
+EVENT_ARCHIVE_ENABLED = settings.event_archive_enabled
+ARCHIVED_STREAM_TTL_SECONDS = settings.archived_stream_ttl_seconds
+
+
+def archive_path(debate_id: str) -> Path:
+    return ARCHIVE_DIR / f"{debate_id}{ARCHIVE_SUFFIX}"
+
+
+def archive_debate_events(
+    debate_id: str,
+    client: redis.Redis | None = None,
+    ttl_seconds: int = ARCHIVED_STREAM_TTL_SECONDS,
+) -> int:
+    """Write the debate's stream to its archive and expire the Redis key.
+
+    Returns the number of archived events. The file is written to a temporary
+    name and renamed, so readers never see a partial archive.
+    """
+    client = client if client is not None else events_redis_client
+    stream = f"debate:{debate_id}"
+    entries = client.xrange(stream)
+    if not entries:
+        return 0
+
+    path = archive_path(debate_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.tmp")
+    with gzip.open(temp_path, "wt", encoding="utf-8") as archive:
+        for entry_id, fields in entries:
+            archive.write(json.dumps({"id": entry_id, **fields}, separators=(",", ":")))
+            archive.write("\n")
+    os.replace(temp_path, path)
+    client.expire(stream, ttl_seconds)
+    client.delete(turn_delta_stream(debate_id))
+    return len(entries)
+
+
+def load_archived_events(debate_id: str) -> list[dict] | None:
+    """Archived stream entries in order, or ``None`` if the debate has no archive."""
+    try:
+        with gzip.open(archive_path(debate_id), "rt", encoding="utf-8") as archive:
+            return [json.loads(line) for line in archive if line.strip()]
+    except FileNotFoundError:
+        return None
+
+
+def delete_event_archive(debate_id: str) -> bool:
+    try:
+        archive_path(debate_id).unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def purge_stale_event_archives(older_than: float) -> int:
+    """Delete archives written before ``older_than`` (epoch seconds)."""
+    if not ARCHIVE_DIR.exists():
+        return 0
+    removed = 0
+    for path in ARCHIVE_DIR.glob(f"*{ARCHIVE_SUFFIX}"):
+        try:
+            if path.stat().st_mtime < older_than:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
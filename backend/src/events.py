@@ -1,33 +1,250 @@
 import json
-from crewai.events import BaseEventListener, AgentExecutionCompletedEvent
+import re
+import time
+from contextvars import ContextVar
+
+from crewai.events import BaseEventListener, AgentExecutionCompletedEvent, LLMStreamChunkEvent
+from crewai.hooks import register_before_llm_call_hook
+
+from app.cache import events_redis_client, get_async_events_redis_client
+from app.event_hub import STREAM_ENTRY_FORMAT, normalize_event_data, turn_delta_stream
+from app.core.config import settings
+
+STREAM_MAXLEN = 1000
+# Deltas live in their own stream so they never push a debate's structured
+# events out of the trimmed history; only the turn in progress matters.
+TURN_DELTA_STREAM_MAXLEN = 200
+
+# Several debates share one worker process, so agent events are routed by the
+# debate running in the current context instead of one listener per debate.
+current_debate_id: ContextVar[str | None] = ContextVar("current_debate_id", default=None)
+
+TURN_DELTA_FLUSH_INTERVAL_SECONDS = settings.turn_delta_flush_interval_ms / 1000
+TURN_DELTA_FLUSH_CHARS = settings.turn_delta_flush_chars
+
+
+def _stream_entry(event: str, data: dict) -> dict:
+    # Normalized once here so every SSE viewer gets a zero-parse passthrough.
+    return {
+        "event": event,
+        "data": normalize_event_data(data),
+        "format": STREAM_ENTRY_FORMAT,
+    }
 
-from app.cache import events_redis_client
 
 def publish(debate_id: str, event: str, data: dict):
+    """Append an event to the debate's stream.
+
+    ``data`` holds the ``agent`` and its ``output``: a dict, or a string that
+    is parsed as JSON where possible.
+    """
     events_redis_client.xadd(
         f"debate:{debate_id}",
-        {
-            "event": event,
-            "data": json.dumps(data),
-        },
-        maxlen=1000,
+        _stream_entry(event, data),
+        maxlen=STREAM_MAXLEN,
         approximate=True,
     )
 
-class DebateEventListener(BaseEventListener):
-    def __init__(self, debate_id: str):
-        super().__init__()
+
+async def publish_async(debate_id: str, event: str, data: dict):
+    await get_async_events_redis_client().xadd(
+        f"debate:{debate_id}",
+        _stream_entry(event, data),
+        maxlen=STREAM_MAXLEN,
+        approximate=True,
+    )
+
+
+_FINAL_ANSWER_MARKER = "Final Answer:"
+_JSON_TEXT_FIELD = re.compile(r'"text"\s*:\s*"')
+
+
+class FinalAnswerText:
+    """Picks the argument text out of one streamed debater response.
+
+    Debater agents answer in the ReAct format: thoughts and tool calls come
+    before ``Final Answer:`` and the answer itself is ``DebateTurn`` JSON. Only
+    the unescaped JSON ``text`` string is passed on; an answer that is not JSON
+    is passed on as it arrives. Use one instance per LLM call.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._state = "preamble"
+
+    def feed(self, chunk: str) -> str:
+        self._buffer += chunk
+        if self._state == "preamble":
+            if self._buffer.lstrip().startswith(("{", "```")):
+                self._state = "answer"
+            else:
+                marker = self._buffer.find(_FINAL_ANSWER_MARKER)
+                if marker < 0:
+                    return ""
+                self._buffer = self._buffer[marker + len(_FINAL_ANSWER_MARKER) :]
+                self._state = "answer"
+
+        if self._state == "answer":
+            answer = self._buffer.lstrip()
+            if not answer:
+                return ""
+            if answer.startswith(("{", "`")):
+                match = _JSON_TEXT_FIELD.search(self._buffer)
+                if match is None:
+                    return ""
+                self._buffer = self._buffer[match.end() :]
+                self._state = "text"
+            else:
+                self._buffer = answer
+                self._state = "plain"
+
+        if self._state == "plain":
+            text, self._buffer = self._buffer, ""
+            return text
+        if self._state == "text":
+            return self._take_string()
+        return ""
+
+    def _take_string(self) -> str:
+        """Decode the JSON string read so far, keeping an escape that is cut
+        off at the end of the chunk for the next one."""
+        buffer = self._buffer
+        out: list[str] = []
+        index = 0
+        while index < len(buffer):
+            char = buffer[index]
+            if char == '"':
+                self._state = "done"
+                self._buffer = ""
+                return "".join(out)
+            if char != "\\":
+                out.append(char)
+                index += 1
+                continue
+            # \uXXXX, or a surrogate pair written as two of them.
+            length = 2
+            if buffer[index + 1 : index + 2] == "u":
+                length = 12 if buffer[index + 2 : index + 4].lower() in ("d8", "d9", "da", "db") else 6
+            if index + length > len(buffer):
+                break
+            try:
+                out.append(json.loads(f'"{buffer[index : index + length]}"'))
+            except json.JSONDecodeError:
+                pass
+            index += length
+        self._buffer = buffer[index:]
+        return "".join(out)
+
+
+class TurnDeltaPublisher:
+    """Coalesces the streamed answer of one debater turn into ``turn_delta`` events.
+
+    Chunks go through ``FinalAnswerText``, so viewers only see the argument
+    text. The first piece of text is published immediately so viewers see it as
+    soon as the model starts answering; after that text is buffered until the
+    flush interval passes or enough characters pile up. ``seq`` restarts at 0
+    whenever the text starts over (a retried attempt, or another LLM call in
+    the same turn), so a client should reset the turn text when it sees seq 0.
+    """
+
+    def __init__(
+        self,
+        debate_id: str,
+        agent: str,
+        turn_id: str,
+        flush_interval_seconds: float = TURN_DELTA_FLUSH_INTERVAL_SECONDS,
+        flush_chars: int = TURN_DELTA_FLUSH_CHARS,
+    ):
         self.debate_id = debate_id
+        self.agent = agent
+        self.turn_id = turn_id
+        self.seq = 0
+        self._flush_interval_seconds = flush_interval_seconds
+        self._flush_chars = flush_chars
+        self._answer = FinalAnswerText()
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._last_flush = 0.0
+
+    def start_call(self) -> None:
+        self.flush()
+        self._answer = FinalAnswerText()
+        self.seq = 0
+
+    def add(self, chunk: str) -> None:
+        text = self._answer.feed(chunk) if chunk else ""
+        if not text:
+            return
+        self._pending.append(text)
+        self._pending_chars += len(text)
+        if (
+            self.seq == 0
+            or self._pending_chars >= self._flush_chars
+            or time.monotonic() - self._last_flush >= self._flush_interval_seconds
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        delta = "".join(self._pending)
+        self._pending.clear()
+        self._pending_chars = 0
+        self._last_flush = time.monotonic()
+        events_redis_client.xadd(
+            turn_delta_stream(self.debate_id),
+            _stream_entry(
+                "turn_delta",
+                {
+                    "agent": self.agent,
+                    "output": {"turn_id": self.turn_id, "seq": self.seq, "delta": delta},
+                },
+            ),
+            maxlen=TURN_DELTA_STREAM_MAXLEN,
+            approximate=True,
+        )
+        self.seq += 1
+
+
+# Set by the flow around a debater turn; crewai emits stream chunks on the
+# thread making the LLM call, so the handler sees this context directly.
+current_turn_stream: ContextVar[TurnDeltaPublisher | None] = ContextVar(
+    "current_turn_stream", default=None
+)
+
+
+def _on_llm_call_start(context) -> None:
+    # Hooks run on the thread making the call, right before its chunks arrive.
+    turn_stream = current_turn_stream.get()
+    if turn_stream is not None:
+        turn_stream.start_call()
+    return None
 
+
+class DebateEventListener(BaseEventListener):
     def setup_listeners(self, crewai_event_bus):
+        register_before_llm_call_hook(_on_llm_call_start)
 
         @crewai_event_bus.on(AgentExecutionCompletedEvent)
         def on_agent_done(_, event):
+            debate_id = current_debate_id.get()
+            if debate_id is None:
+                return
             publish(
-                self.debate_id,
+                debate_id,
                 "agent_done",
                 {
                     "agent": event.agent.role,
                     "output": event.output,
                 },
             )
+
+        @crewai_event_bus.on(LLMStreamChunkEvent)
+        def on_stream_chunk(_, event):
+            turn_stream = current_turn_stream.get()
+            if turn_stream is None or event.tool_call is not None:
+                return
+            turn_stream.add(event.chunk)
+
+
+debate_event_listener = DebateEventListener()
@@ -0,0 +1,25 @@
+import asyncio
+import contextvars
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+# Blocking crewai/litellm calls run here so the debate event loop stays free to
+# drive other debates in the same worker process.
+LLM_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.llm_executor_max_workers,
+    thread_name_prefix="debate-llm",
+)
+
+
+async def run_blocking(operation: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call on the bounded LLM executor, keeping contextvars."""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, operation, *args, **kwargs)
+    return await loop.run_in_executor(LLM_EXECUTOR, call)
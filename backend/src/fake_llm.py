@@ -0,0 +1,203 @@
+"""Offline stand-in for the LLM provider (``LLM_PROVIDER=fake``).
+
+``FakeLLM`` answers every call locally after ``FAKE_LLM_LATENCY_SECONDS``:
+direct presenter/summary calls get a short line of text, debater tasks first
+call ``web_search`` once (as their task rules require) and then return a
+``DebateTurn``, and judge tasks return a verdict valid for their
+``output_pydantic`` schema. Token usage is reported like a real provider's,
+and a share of calls can be made to fail with a transient error or a 429 so
+retries and rate-limit backoff can be exercised. Output is deterministic for
+a given ``FAKE_LLM_SEED``.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import typing
+from typing import Any
+
+from crewai.events.types.llm_events import LLMCallType
+from crewai.llms.base_llm import BaseLLM
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+from .schemas import DebateTurn
+from .tokens import estimate_tokens
+
+FAKE_LLM_LATENCY_SECONDS = settings.fake_llm_latency_seconds
+FAKE_LLM_PROMPT_TOKENS = settings.fake_llm_prompt_tokens
+FAKE_LLM_COMPLETION_TOKENS = settings.fake_llm_completion_tokens
+FAKE_LLM_FAILURE_RATE = settings.fake_llm_failure_rate
+FAKE_LLM_RATE_LIMIT_RATE = settings.fake_llm_rate_limit_rate
+FAKE_LLM_SEED = settings.fake_llm_seed
+
+STREAM_CHUNK_CHARS = 24
+
+_TOPIC_RE = re.compile(r'debate on "([^"]+)"')
+_DEBATERS_RE = re.compile(r"The debaters are (.+?) and (.+?)\.")
+_TOOL_NAME_RE = re.compile(r"^Tool Name: (\S+)", re.MULTILINE)
+
+
+class FakeProviderError(RuntimeError):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _message_text(messages: list[dict]) -> str:
+    return "\n".join(str(message.get("content", "")) for message in messages)
+
+
+def _last_user_content(messages: list[dict]) -> str:
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            return str(message.get("content", ""))
+    return ""
+
+
+def _literal_default(annotation: Any) -> str | None:
+    args = typing.get_args(annotation)
+    return str(args[0]) if typing.get_origin(annotation) is typing.Literal and args else None
+
+
+def _fake_rubric(rubric: type[BaseModel], rng: random.Random) -> dict:
+    return {
+        name: (
+            [rng.randint(0, 2), rng.randint(0, 2)]
+            if name.endswith("_penalty")
+            else [rng.randint(5, 9), rng.randint(5, 9)]
+        )
+        for name in rubric.model_fields
+    }
+
+
+def fake_verdict(verdict: type[BaseModel], debaters: tuple[str, str], rng: random.Random) -> dict:
+    rubric = verdict.model_fields["rubric_score"].annotation
+    winner = rng.choice(debaters)
+    return {
+        "judge": _literal_default(verdict.model_fields["judge"].annotation) or "Judge",
+        "winner": winner,
+        "reasoning": f"{winner} engaged the opposing case more directly. The other side left its central claim unsupported.",
+        "rubric_score": _fake_rubric(rubric, rng),
+        "winner_weakness": f"{winner} relied on assertion where evidence was available.",
+    }
+
+
+def fake_turn(topic: str, rng: random.Random) -> dict:
+    return {
+        "turn_id": "",
+        "debater": "",
+        "argument": {
+            "type": rng.choice(["attack", "defense", "counter", "framing"]),
+            "text": (
+                f"The case on {topic} collapses once you follow the incentives. "
+                "Those who set the rules profit from the delay. "
+                "Name who pays the cost and the answer becomes obvious."
+            ),
+            "confidence": rng.randint(55, 95),
+        },
+    }
+
+
+class FakeLLM(BaseLLM):
+    def __init__(
+        self,
+        model: str,
+        stream: bool = False,
+        latency_seconds: float = FAKE_LLM_LATENCY_SECONDS,
+        prompt_tokens: int | None = FAKE_LLM_PROMPT_TOKENS,
+        completion_tokens: int | None = FAKE_LLM_COMPLETION_TOKENS,
+        failure_rate: float = FAKE_LLM_FAILURE_RATE,
+        rate_limit_rate: float = FAKE_LLM_RATE_LIMIT_RATE,
+        seed: int = FAKE_LLM_SEED,
+        **kwargs: Any,
+    ):
+        super().__init__(model=model, provider="fake", **kwargs)
+        self.stream = stream
+        self.latency_seconds = latency_seconds
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.failure_rate = failure_rate
+        self.rate_limit_rate = rate_limit_rate
+        self._rng = random.Random(f"{seed}:{model}")
+        self._rng_lock = threading.Lock()
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None,
+    ) -> str:
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        # Agent executors run the before-call hooks (rate limiter) themselves.
+        if not self._invoke_before_llm_call_hooks(messages, from_agent):
+            raise ValueError("LLM call blocked by hook")
+        with self._rng_lock:
+            roll = self._rng.random()
+            rng = random.Random(self._rng.random())
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+        if roll < self.rate_limit_rate:
+            self._fail("Rate limit reached for model (429 Too Many Requests)", 429, from_task, from_agent)
+        if roll < self.rate_limit_rate + self.failure_rate:
+            self._fail("Service unavailable (503), try again", 503, from_task, from_agent)
+
+        response = self._respond(messages, from_task, response_model, rng)
+        if self.stream and from_task is not None:
+            for start in range(0, len(response), STREAM_CHUNK_CHARS):
+                self._emit_stream_chunk_event(
+                    chunk=response[start : start + STREAM_CHUNK_CHARS],
+                    from_task=from_task,
+                    from_agent=from_agent,
+                    call_type=LLMCallType.LLM_CALL,
+                )
+        self._track_token_usage_internal(
+            {
+                "prompt_tokens": self.prompt_tokens or estimate_tokens(_message_text(messages)),
+                "completion_tokens": self.completion_tokens or estimate_tokens(response),
+            }
+        )
+        return response
+
+    def _fail(self, message: str, status_code: int, from_task, from_agent) -> None:
+        self._emit_call_failed_event(error=message, from_task=from_task, from_agent=from_agent)
+        raise FakeProviderError(message, status_code)
+
+    def _respond(self, messages, from_task, response_model, rng: random.Random) -> str:
+        text = _message_text(messages)
+        output_model = response_model or getattr(from_task, "output_pydantic", None)
+        if output_model is None:
+            # Converter retries send the agent's answer back for reformatting.
+            content = _last_user_content(messages).strip()
+            if content.startswith("{"):
+                return content
+            return "What a clash of worldviews. Let's see which argument survives the judges."
+
+        if output_model is DebateTurn:
+            topic_match = _TOPIC_RE.search(text)
+            topic = topic_match.group(1) if topic_match else "this topic"
+            tool_names = _TOOL_NAME_RE.findall(text)
+            # The executor appends the tool round-trip as an assistant message.
+            if tool_names and not any(message.get("role") == "assistant" for message in messages):
+                return (
+                    "Thought: I need one concrete fact before arguing.\n"
+                    f"Action: {tool_names[0]}\n"
+                    f"Action Input: {json.dumps({'query': topic})}"
+                )
+            answer = fake_turn(topic, rng)
+        else:
+            debaters_match = _DEBATERS_RE.search(text)
+            debaters = debaters_match.groups() if debaters_match else ("debater_1", "debater_2")
+            answer = fake_verdict(output_model, debaters, rng)
+        return f"Thought: I now know the final answer\nFinal Answer: {json.dumps(answer)}"
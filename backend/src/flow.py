@@ -6,35 +6,54 @@ from app.core.logger import logger
 from app.cache import (
     DEBATE_CACHE_ENABLED,
     DEBATE_CACHE_TTL_SECONDS,
-    delete_inflight_debate_id,
-    release_generation_lock,
-    set_cached_debate_id,
+    SHARED_DEBATE_CACHE_ENABLED,
+    build_shared_cache_key,
+    delete_inflight_debate_id_async,
+    release_generation_lock_async,
+    set_cached_debate_id_async,
+    set_shared_debate_id_async,
 )
 
-from .helpers import history_as_text,  append_turn, load_persona
-from .storage import (
-    update_debate_status,
-    finalize_debate_duration,
-    update_debate_summary,
-    update_debate_metrics,
+from .helpers import (
+    append_turn,
+    close_turn_log,
+    load_persona,
+    majority_winner,
+    topic_search_queries,
+)
+from app.services.debate_service import DebateWriteBuffer
+from .pricing import (
+    debate_usage_as_text,
+    prompt_cache_report,
+    record_usage_from_llm,
+    record_usage_from_response,
 )
-from .pricing import debate_usage_as_text, record_usage_from_llm, record_usage_from_response
 from .prompts import (
     presenter_introduction_prompt,
     presenter_conclusion_prompt,
     debate_summary_prompt,
 )
-from .retry_utils import call_with_retry
+from .event_archive import EVENT_ARCHIVE_ENABLED, archive_debate_events
+from .executor import run_blocking
+from .rate_limiter import install_rate_limiter
+from .retry_utils import call_with_retry_async
 from .schemas import DebateState
+from .search_cache import (
+    discard_warm_corpus,
+    is_useful_result,
+    register_warm_corpus,
+    search_web_result,
+)
 from app.core.config import settings
+from app.metrics import MODEL_CALL_SECONDS, observe_flow_step, timed
 
-from crewai import LLM
 from crewai.flow.flow import Flow, listen, start, router, or_
-from src.events import publish
+from src.events import publish_async
 
-from .crew import Debate  # your factory that builds agents & tasks
+from .client_pool import lease_llm
+from .crew import lease_crew
 from .crew import DEBATER_1_MODEL, DEBATER_2_MODEL, JUDGE_MODEL, PRESENTER_MODEL, SUMMARY_MODEL
-from .events import DebateEventListener
+from .events import TurnDeltaPublisher, current_debate_id, current_turn_stream
 
 # -----------------------------------------------------------------------------
 # Environment / warnings / logging
@@ -46,51 +65,56 @@ INTRO_DELAY_SECONDS = settings.intro_delay_seconds
 TURN_DELAY_SECONDS = settings.turn_delay_seconds
 CONCLUSION_DELAY_SECONDS = settings.conclusion_delay_seconds
 JUDGE_DELAY_SECONDS = settings.judge_delay_seconds
+JUDGE_PARALLEL_ENABLED = settings.judge_parallel_enabled
 DEBATE_RETRY_MAX_ATTEMPTS = settings.debate_retry_max_attempts
 DEBATE_RETRY_INITIAL_WAIT_SECONDS = settings.debate_retry_initial_wait_seconds
 DEBATE_RETRY_MAX_WAIT_SECONDS = settings.debate_retry_max_wait_seconds
 DEBATE_MAX_ROUNDS = settings.debate_max_rounds
+DEBATE_HISTORY_TOKEN_BUDGET = settings.debate_history_token_budget
+DEBATE_HISTORY_RECENT_TURNS = settings.debate_history_recent_turns
+SEARCH_PREFETCH_ENABLED = settings.search_prefetch_enabled
+SEARCH_PREFETCH_MAX_QUERIES = settings.search_prefetch_max_queries
+
+install_rate_limiter()
 
 
 class DebateFlow(Flow[DebateState]):
 
-    def __init__(self):
+    def __init__(self, write_buffer: DebateWriteBuffer):
         super().__init__()
-        self.debate = Debate()
+        self._writes = write_buffer
         self._debate_token_usage = {
             "total_tokens": 0,
             "prompt_tokens": 0,
             "cached_prompt_tokens": 0,
             "completion_tokens": 0,
             "successful_requests": 0,
+            "history_tokens_saved": 0,
         }
         self._cost_by_model: dict[str, float] = {}
+        self._usage_by_model: dict[str, dict[str, int]] = {}
+        self._usage_by_judge: dict[str, dict[str, int]] = {}
 
     @start()
+    @observe_flow_step
     async def presenter_introduction(self):
         logger.info(f"Introducing the debate topic: {self.state.topic}")
         topic: str = self.state.topic
-        llm = LLM(model=PRESENTER_MODEL)
-        debate_introduction = call_with_retry(
-            operation=lambda: llm.call(
-                presenter_introduction_prompt(topic, self.state.debater_1, self.state.debater_2)
-            ),
+        introduction = self._call_llm(
+            PRESENTER_MODEL,
+            presenter_introduction_prompt(topic, self.state.debater_1, self.state.debater_2),
             operation_name="presenter_introduction",
-            max_attempts=DEBATE_RETRY_MAX_ATTEMPTS,
-            initial_wait_seconds=DEBATE_RETRY_INITIAL_WAIT_SECONDS,
-            max_wait_seconds=DEBATE_RETRY_MAX_WAIT_SECONDS,
-        )
-        record_usage_from_llm(
-            llm=llm,
-            model=PRESENTER_MODEL,
-            debate_token_usage=self._debate_token_usage,
-            cost_by_model=self._cost_by_model,
-            debate_id=self.state.debate_id,
         )
+        # The topic searches overlap the introduction call, so the debaters'
+        # first web_search calls are usually answered without a network hop.
+        if SEARCH_PREFETCH_ENABLED:
+            debate_introduction, _ = await asyncio.gather(introduction, self._prefetch_search())
+        else:
+            debate_introduction = await introduction
         logger.info(f"Debate Introduction: {debate_introduction}")
         self.state.presenter_introduction = debate_introduction
 
-        publish(
+        await publish_async(
             self.state.debate_id,
             "presenter_intro_done",
             {
@@ -102,52 +126,78 @@ class DebateFlow(Flow[DebateState]):
 
         # Load personas at the start of the debate
         logger.info(f"Loading personas for {self.state.debater_1} and {self.state.debater_2}")
-        self.state.debater_1_persona = load_persona(self.state.debater_1)
-        self.state.debater_2_persona = load_persona(self.state.debater_2)
+        self.state.debater_1_persona, self.state.debater_2_persona = await asyncio.gather(
+            asyncio.to_thread(load_persona, self.state.debater_1),
+            asyncio.to_thread(load_persona, self.state.debater_2),
+        )
+        await self._flush_writes_if_due()
 
         if INTRO_DELAY_SECONDS > 0:
             await asyncio.sleep(INTRO_DELAY_SECONDS)
 
 
+    async def _prefetch_search(self) -> None:
+        # Best effort: a failed prefetch only means the debaters search live.
+        queries = topic_search_queries(
+            self.state.topic,
+            self.state.debater_1,
+            self.state.debater_2,
+            SEARCH_PREFETCH_MAX_QUERIES,
+        )
+        try:
+            results = await asyncio.gather(
+                *(run_blocking(search_web_result, query) for query in queries)
+            )
+        except Exception:
+            logger.exception("search_prefetch_failed", extra={"debate_id": self.state.debate_id})
+            return
+        snippets = {
+            query: result.text for query, result in zip(queries, results) if is_useful_result(result)
+        }
+        self.state.search_snippets = snippets
+        register_warm_corpus(self.state.debate_id, snippets)
+        logger.info(
+            "search_prefetch_done",
+            extra={"debate_id": self.state.debate_id, "queries": len(queries), "results": len(snippets)},
+        )
+
     @listen(or_(presenter_introduction, "next_round"))
+    @observe_flow_step
     async def debater_1_answer(self):
         logger.info(f"Debater_1 Answering - Round {self.state.current_round}")
-        
-        # Inject persona only in the first round
-        p1 = self.state.debater_1_persona if self.state.current_round == 1 else ""
-        p2 = self.state.debater_2_persona if self.state.current_round == 1 else ""
 
-        debater_1_response = call_with_retry(
-            operation=lambda: self.debate.debater_1_crew().kickoff(inputs={
-                "topic": self.state.topic,
-                "debater_1": self.state.debater_1,
-                "debater_2": self.state.debater_2,
-                "debater_1_persona": p1,
-                "debater_2_persona": p2,
-                "history": history_as_text(self.state.turns)
-            }),
+        # Every input except the history is constant for the whole debate, so
+        # each debater's system prompt and task rules form a byte-identical
+        # prefix the provider can serve from its prompt cache; the persona is
+        # sent every round for the same reason.
+        turn_id = str(uuid.uuid4())
+        turn_inputs = {
+            "topic": self.state.topic,
+            "debater_1": self.state.debater_1,
+            "debater_2": self.state.debater_2,
+            "debater_1_persona": self.state.debater_1_persona,
+            "debater_2_persona": self.state.debater_2_persona,
+            "history": self._history_prompt(),
+        }
+        debater_1_response, _ = await self._kickoff_crew(
+            "debater_1_crew",
+            DEBATER_1_MODEL,
+            lambda crew: self._stream_turn(crew, turn_inputs, self.state.debater_1, turn_id),
             operation_name="debater_1_turn",
-            max_attempts=DEBATE_RETRY_MAX_ATTEMPTS,
-            initial_wait_seconds=DEBATE_RETRY_INITIAL_WAIT_SECONDS,
-            max_wait_seconds=DEBATE_RETRY_MAX_WAIT_SECONDS,
-        )
-        record_usage_from_response(
-            response=debater_1_response,
-            model=DEBATER_1_MODEL,
-            debate_token_usage=self._debate_token_usage,
-            cost_by_model=self._cost_by_model,
-            debate_id=self.state.debate_id,
         )
 
         turn = debater_1_response.pydantic 
         turn.debater = self.state.debater_1 
         
-        turn.turn_id = str(uuid.uuid4()) 
+        turn.turn_id = turn_id
         turn_text = turn.argument.text 
         logger.info(f"Turn: {turn_text}") 
         
         self.state.turns.append(turn) 
-        append_turn(turn, self.state.debate_id)
+        self.state.history.append(turn)
+        await asyncio.to_thread(append_turn, turn, self.state.debate_id)
+        await self._publish_turn_done(turn)
+        await self._flush_writes_if_due()
 
         if TURN_DELAY_SECONDS > 0:
             await asyncio.sleep(TURN_DELAY_SECONDS)
@@ -155,49 +205,124 @@ class DebateFlow(Flow[DebateState]):
 
 
     @listen(debater_1_answer)
+    @observe_flow_step
     async def debater_2_answer(self):
         logger.info(f"Debater_2 Answering - Round {self.state.current_round}")
 
-        p1 = self.state.debater_1_persona if self.state.current_round == 1 else ""
-        p2 = self.state.debater_2_persona if self.state.current_round == 1 else ""
-
-        debate_2_response = call_with_retry(
-            operation=lambda: self.debate.debater_2_crew().kickoff(inputs={
-                "topic": self.state.topic,
-                "debater_1": self.state.debater_1,
-                "debater_2": self.state.debater_2,
-                "debater_1_persona": p1,
-                "debater_2_persona": p2,
-                "history": history_as_text(self.state.turns)
-            }),
+        turn_id = str(uuid.uuid4())
+        turn_inputs = {
+            "topic": self.state.topic,
+            "debater_1": self.state.debater_1,
+            "debater_2": self.state.debater_2,
+            "debater_1_persona": self.state.debater_1_persona,
+            "debater_2_persona": self.state.debater_2_persona,
+            "history": self._history_prompt(),
+        }
+        debate_2_response, _ = await self._kickoff_crew(
+            "debater_2_crew",
+            DEBATER_2_MODEL,
+            lambda crew: self._stream_turn(crew, turn_inputs, self.state.debater_2, turn_id),
             operation_name="debater_2_turn",
-            max_attempts=DEBATE_RETRY_MAX_ATTEMPTS,
-            initial_wait_seconds=DEBATE_RETRY_INITIAL_WAIT_SECONDS,
-            max_wait_seconds=DEBATE_RETRY_MAX_WAIT_SECONDS,
-        )
-        record_usage_from_response(
-            response=debate_2_response,
-            model=DEBATER_2_MODEL,
-            debate_token_usage=self._debate_token_usage,
-            cost_by_model=self._cost_by_model,
-            debate_id=self.state.debate_id,
         )
 
         turn = debate_2_response.pydantic  
         turn.debater = self.state.debater_2 
-        turn.turn_id = str(uuid.uuid4()) 
+        turn.turn_id = turn_id
         turn_text = turn.argument.text
         
         logger.info(f"Turn: {turn_text}") 
         
         self.state.turns.append(turn)
-        append_turn(turn, self.state.debate_id)
+        self.state.history.append(turn)
+        await asyncio.to_thread(append_turn, turn, self.state.debate_id)
+        await self._publish_turn_done(turn)
+        await self._flush_writes_if_due()
 
         if TURN_DELAY_SECONDS > 0:
             await asyncio.sleep(TURN_DELAY_SECONDS)
 
 
+    async def _call_llm(self, model: str, prompt: str, operation_name: str) -> str:
+        with lease_llm(model) as llm, timed(MODEL_CALL_SECONDS, operation=operation_name, model=model):
+            response = await call_with_retry_async(
+                operation=lambda: run_blocking(llm.call, prompt),
+                operation_name=operation_name,
+                max_attempts=DEBATE_RETRY_MAX_ATTEMPTS,
+                initial_wait_seconds=DEBATE_RETRY_INITIAL_WAIT_SECONDS,
+                max_wait_seconds=DEBATE_RETRY_MAX_WAIT_SECONDS,
+            )
+            record_usage_from_llm(
+                llm=llm,
+                model=model,
+                debate_token_usage=self._debate_token_usage,
+                cost_by_model=self._cost_by_model,
+                debate_id=self.state.debate_id,
+                write_buffer=self._writes,
+                usage_by_model=self._usage_by_model,
+            )
+        return response
+
+    async def _kickoff_crew(self, crew_name: str, model: str, run, operation_name: str):
+        """Run ``run(crew)`` on a pooled crew; returns the crew output and its usage."""
+
+        async def attempt():
+            # Each attempt leases its own crew: a crew whose kickoff raised is
+            # dropped by the pool instead of retried with its partial conversation.
+            with lease_crew(crew_name) as crew:
+                return await run_blocking(run, crew)
+
+        with timed(MODEL_CALL_SECONDS, operation=operation_name, model=model):
+            response = await call_with_retry_async(
+                operation=attempt,
+                operation_name=operation_name,
+                max_attempts=DEBATE_RETRY_MAX_ATTEMPTS,
+                initial_wait_seconds=DEBATE_RETRY_INITIAL_WAIT_SECONDS,
+                max_wait_seconds=DEBATE_RETRY_MAX_WAIT_SECONDS,
+            )
+        usage = record_usage_from_response(
+            response=response,
+            model=model,
+            debate_token_usage=self._debate_token_usage,
+            cost_by_model=self._cost_by_model,
+            debate_id=self.state.debate_id,
+            write_buffer=self._writes,
+            usage_by_model=self._usage_by_model,
+        )
+        return response, usage
+
+    async def _flush_writes_if_due(self) -> None:
+        # Flushing commits to SQLite; other debates share this event loop.
+        await asyncio.to_thread(self._writes.flush_if_due)
+
+    def _history_prompt(self) -> str:
+        history = self.state.history.render(DEBATE_HISTORY_TOKEN_BUDGET, DEBATE_HISTORY_RECENT_TURNS)
+        self._debate_token_usage["history_tokens_saved"] = self.state.history.tokens_saved
+        return history
+
+    def _stream_turn(self, debater_crew, inputs: dict, debater: str, turn_id: str):
+        # Runs on the LLM executor; every attempt gets a fresh publisher so a
+        # retried turn restarts at seq 0.
+        turn_stream = TurnDeltaPublisher(self.state.debate_id, debater, turn_id)
+        stream_token = current_turn_stream.set(turn_stream)
+        try:
+            return debater_crew.kickoff(inputs=inputs)
+        finally:
+            turn_stream.flush()
+            current_turn_stream.reset(stream_token)
+
+    async def _publish_turn_done(self, turn) -> None:
+        await publish_async(
+            self.state.debate_id,
+            "turn_done",
+            {
+                "agent": turn.debater,
+                "output": turn.model_dump(mode="json"),
+            },
+        )
+
+
     @router(debater_2_answer)
+    @observe_flow_step
     def round_router(self):
         self.state.current_round += 1
 
@@ -208,33 +333,22 @@ class DebateFlow(Flow[DebateState]):
 
 
     @listen("conclude_debate")
+    @observe_flow_step
     async def presenter_conclusion(self):
         logger.info("Presenter Concluding the debate")
-        llm = LLM(model=PRESENTER_MODEL)
-        
-        debate_conclusion = call_with_retry(
-            operation=lambda: llm.call(
-                presenter_conclusion_prompt(
-                    self.state.topic,
-                    self.state.debater_1,
-                    self.state.debater_2,
-                    self.state.turns,
-                )
+
+        debate_conclusion = await self._call_llm(
+            PRESENTER_MODEL,
+            presenter_conclusion_prompt(
+                self.state.topic,
+                self.state.debater_1,
+                self.state.debater_2,
+                self._history_prompt(),
             ),
             operation_name="presenter_conclusion",
-            max_attempts=DEBATE_RETRY_MAX_ATTEMPTS,
-            initial_wait_seconds=DEBATE_RETRY_INITIAL_WAIT_SECONDS,
-            max_wait_seconds=DEBATE_RETRY_MAX_WAIT_SECONDS,
-        )
-        record_usage_from_llm(
-            llm=llm,
-            model=PRESENTER_MODEL,
-            debate_token_usage=self._debate_token_usage,
-            cost_by_model=self._cost_by_model,
-            debate_id=self.state.debate_id,
         )
 
-        publish(
+        await publish_async(
             self.state.debate_id,
             "presenter_conclusion_done",
             {
@@ -243,74 +357,86 @@ class DebateFlow(Flow[DebateState]):
                 "output": debate_conclusion,
             },
         )
+        await self._flush_writes_if_due()
         if CONCLUSION_DELAY_SECONDS > 0:
             await asyncio.sleep(CONCLUSION_DELAY_SECONDS)
 
 
     @listen("presenter_conclusion")
+    @observe_flow_step
     async def judge_debate(self):
         logger.info("Judging the debate")
-        judge_response = call_with_retry(
-            operation=lambda: self.debate.judge_crew().kickoff(inputs={
-                "topic": self.state.topic,
-                "debater_1": self.state.debater_1,
-                "debater_2": self.state.debater_2,
-                "history": history_as_text(self.state.turns)
-            }),
-            operation_name="judge_debate",
-            max_attempts=DEBATE_RETRY_MAX_ATTEMPTS,
-            initial_wait_seconds=DEBATE_RETRY_INITIAL_WAIT_SECONDS,
-            max_wait_seconds=DEBATE_RETRY_MAX_WAIT_SECONDS,
-        )
-        record_usage_from_response(
-            response=judge_response,
-            model=JUDGE_MODEL,
-            debate_token_usage=self._debate_token_usage,
-            cost_by_model=self._cost_by_model,
-            debate_id=self.state.debate_id,
+        judge_inputs = {
+            "topic": self.state.topic,
+            "debater_1": self.state.debater_1,
+            "debater_2": self.state.debater_2,
+            # Judges score the whole exchange, so they get the full transcript.
+            "history": self.state.history.full_text(),
+        }
+        if JUDGE_PARALLEL_ENABLED:
+            verdicts = await asyncio.gather(
+                *(
+                    self._run_judge(judge_name, crew_name, judge_inputs)
+                    for judge_name, crew_name in (
+                        ("logical_analyst", "logical_analyst_crew"),
+                        ("debate_strategist", "debate_strategist_crew"),
+                        ("persuasion", "persuasion_crew"),
+                    )
+                )
+            )
+        else:
+            judge_response, _ = await self._kickoff_crew(
+                "judge_crew",
+                JUDGE_MODEL,
+                lambda crew: crew.kickoff(inputs=judge_inputs),
+                operation_name="judge_debate",
+            )
+            verdicts = [task_output.pydantic for task_output in judge_response.tasks_output]
+
+        self.state.judge_verdicts = "\n".join(
+            verdict.model_dump_json() for verdict in verdicts if verdict is not None
         )
-        usage_text = debate_usage_as_text(self._debate_token_usage)
-        update_debate_metrics(
-            self.state.debate_id,
-            tokens_delta=self._debate_token_usage["total_tokens"],
-            cost_delta=round(sum(self._cost_by_model.values()), 6),
+        self.state.winner = majority_winner(verdicts)
+        logger.info("Debate Winner: %s", self.state.winner or "undetermined")
+        await self._flush_writes_if_due()
+        if JUDGE_DELAY_SECONDS > 0:
+            await asyncio.sleep(JUDGE_DELAY_SECONDS)
+
+    async def _run_judge(self, judge_name: str, crew_name: str, judge_inputs: dict):
+        judge_response, judge_usage = await self._kickoff_crew(
+            crew_name,
+            JUDGE_MODEL,
+            lambda crew: crew.kickoff(inputs=judge_inputs),
+            operation_name=f"judge_{judge_name}",
         )
-        publish(
+        self._usage_by_judge[judge_name] = judge_usage
+
+        verdict = judge_response.pydantic
+        await publish_async(
             self.state.debate_id,
-            "debate_token_usage_done",
+            "judge_verdict_done",
             {
-                "agent": "system",
-                "output": usage_text,
+                "agent": judge_name,
+                "output": {**verdict.model_dump(mode="json"), "usage": judge_usage},
             },
         )
-        logger.info("Debate usage (intro to judgement): %s", usage_text)
-
-        logger.info("Debate Winner: %s", judge_response.pydantic)
-        self.state.judge_verdicts = judge_response.pydantic
-        # self.state.winner = judge_response.pydantic
-        if JUDGE_DELAY_SECONDS > 0:
-            await asyncio.sleep(JUDGE_DELAY_SECONDS)
+        return verdict
 
     @listen("judge_debate")
+    @observe_flow_step
     async def generate_debate_summary(self):
         logger.info("Generating debate summary")
-        debate_turns = self.state.turns
+        debate_history = self._history_prompt()
         judge_verdicts = self.state.judge_verdicts
         winner = self.state.winner
-        
-        llm = LLM(model=SUMMARY_MODEL)
 
-        debate_summary = call_with_retry(
-            operation=lambda: llm.call(
-                debate_summary_prompt(debate_turns, judge_verdicts, winner)
-            ),
+        debate_summary = await self._call_llm(
+            SUMMARY_MODEL,
+            debate_summary_prompt(debate_history, judge_verdicts, winner),
             operation_name="debate_summary",
-            max_attempts=DEBATE_RETRY_MAX_ATTEMPTS,
-            initial_wait_seconds=DEBATE_RETRY_INITIAL_WAIT_SECONDS,
-            max_wait_seconds=DEBATE_RETRY_MAX_WAIT_SECONDS,
         )
 
-        publish(
+        await publish_async(
             self.state.debate_id,
             "debate_summary_done",
             {
@@ -319,9 +445,45 @@ class DebateFlow(Flow[DebateState]):
                 "output": debate_summary,
             },
         )
-        update_debate_summary(self.state.debate_id, debate_summary)
+        self._writes.update_summary(debate_summary)
+        # Last model call of the debate, so the report covers every step.
+        await self._publish_usage_report()
+        await self._flush_writes_if_due()
+
+    async def _publish_usage_report(self) -> None:
+        usage_text = debate_usage_as_text(self._debate_token_usage)
+        cache_report = prompt_cache_report(self._usage_by_model)
+        self._writes.update_metrics(
+            tokens_delta=self._debate_token_usage["total_tokens"],
+            cost_delta=round(sum(self._cost_by_model.values()), 6),
+        )
+        await publish_async(
+            self.state.debate_id,
+            "debate_token_usage_done",
+            {
+                "agent": "system",
+                "output": {
+                    "text": usage_text,
+                    "usage": self._debate_token_usage,
+                    "prompt_cache": cache_report,
+                },
+            },
+        )
+        logger.info("Debate usage (intro to summary): %s", usage_text)
+        logger.info("Prompt cache by model: %s", cache_report)
         
 
+async def _archive_events(debate_id: str) -> None:
+    # The debate result is already persisted; a failed archive only leaves
+    # the Redis stream without a TTL, serving replays as before.
+    try:
+        archived = await run_blocking(archive_debate_events, debate_id)
+    except Exception:
+        logger.exception("event_archive_failed", extra={"debate_id": debate_id})
+        return
+    logger.info("event_archive_written", extra={"debate_id": debate_id, "events": archived})
+
+
 async def run_debate_flow(
     debate_id: str,
     topic: str,
@@ -332,8 +494,11 @@ async def run_debate_flow(
     lock_key: str | None = None,
     lock_token: str | None = None,
 ):
-    listener = DebateEventListener(debate_id)
-    flow = DebateFlow()
+    # Agent events raised inside this debate's steps are routed to its stream by
+    # the process-wide listener in src.events.
+    debate_context_token = current_debate_id.set(debate_id)
+    writes = DebateWriteBuffer(debate_id)
+    flow = DebateFlow(writes)
     inputs = {
         "debate_id": debate_id,
         "topic": topic,
@@ -343,30 +508,44 @@ async def run_debate_flow(
     }
     try:
         await flow.kickoff_async(inputs=inputs)
-        update_debate_status(debate_id, "completed")
-        finalize_debate_duration(debate_id)
+        writes.update_status("completed")
+        writes.finalize_duration()
+        await asyncio.to_thread(writes.flush)
         if DEBATE_CACHE_ENABLED and cache_key:
-            set_cached_debate_id(cache_key, debate_id, DEBATE_CACHE_TTL_SECONDS)
+            await set_cached_debate_id_async(cache_key, debate_id, DEBATE_CACHE_TTL_SECONDS)
             logger.info("cache_write", extra={"debate_id": debate_id, "cache_key": cache_key})
-        publish(
+        if SHARED_DEBATE_CACHE_ENABLED:
+            shared_key = build_shared_cache_key(topic, debater_1, debater_2)
+            evicted = await set_shared_debate_id_async(shared_key, debate_id)
+            logger.info(
+                "shared_cache_write",
+                extra={"debate_id": debate_id, "shared_key": shared_key, "evicted": evicted},
+            )
+        await publish_async(
             debate_id,
             "debate_completed",
             {"agent": "system", "output": "debate completed"},
         )
     except Exception as exc:
-        update_debate_status(debate_id, "failed", error_message=str(exc))
-        finalize_debate_duration(debate_id)
+        writes.update_status("failed", error_message=str(exc))
+        writes.finalize_duration()
+        await asyncio.to_thread(writes.flush)
         logger.exception("flow_failed", extra={"debate_id": debate_id})
-        publish(
+        await publish_async(
             debate_id,
             "debate_failed",
             {"agent": "system", "output": "debate failed"},
         )
         raise
     finally:
+        current_debate_id.reset(debate_context_token)
+        await asyncio.to_thread(close_turn_log, debate_id)
+        discard_warm_corpus(debate_id)
+        if EVENT_ARCHIVE_ENABLED:
+            await _archive_events(debate_id)
         if inflight_key:
-            delete_inflight_debate_id(inflight_key)
+            await delete_inflight_debate_id_async(inflight_key)
         if lock_key and lock_token:
-            release_generation_lock(lock_key, lock_token)
+            await release_generation_lock_async(lock_key, lock_token)
 
 
@@ -1,12 +1,24 @@
 ﻿
 from .schemas import DebateTurn
 import json
+import os
+import threading
+from collections import Counter
 from pathlib import Path
 
-from typing import Iterable
+from typing import IO, Iterable, Iterator
 
-OUTPUT_FILE = Path("debate_round.json")
+from app.core.config import settings
+from app.core.logger import logger
+
+from .history import NO_HISTORY, render_turn
+from .persona_registry import persona_registry
+
+OUTPUT_FILE = Path("debate_round.jsonl")
 OUTPUT_DIR = Path("data") / "debate_turns"
+TURN_LOG_SUFFIX = ".jsonl"
+LEGACY_TURN_LOG_SUFFIX = ".json"
+TURN_LOG_FSYNC_EVERY = settings.turn_log_fsync_every
 
 def history_as_text(turns: Iterable[object]) -> str:
     """
@@ -14,69 +26,225 @@ def history_as_text(turns: Iterable[object]) -> str:
     """
     turns_list = list(turns)
     if not turns_list:
-        return "No prior debate history."
+        return NO_HISTORY
+    return "\n\n".join(render_turn(i, turn) for i, turn in enumerate(turns_list, start=1))
 
-    lines: list[str] = []
-    for i, turn in enumerate(turns_list, start=1):
-        argument = getattr(turn, "argument", None)
-        argument_type = getattr(argument, "type", "unknown")
-        argument_confidence = getattr(argument, "confidence", "unknown")
-        argument_text = getattr(argument, "text", "")
-        debater = getattr(turn, "debater", "unknown")
-        lines.append(
-            "Round {i} -- {debater} ({arg_type}, confidence {confidence}/100):\n{arg_text}".format(
-                i=i,
-                debater=debater,
-                arg_type=argument_type,
-                confidence=argument_confidence,
-                arg_text=argument_text,
-            )
-        )
-
-    return "\n\n".join(lines)
 
+def topic_search_queries(topic: str, debater_1: str, debater_2: str, limit: int) -> list[str]:
+    """Web searches likely to ground any turn of a debate on ``topic``."""
+    topic = " ".join(topic.split())
+    queries = [
+        topic,
+        f"{topic} latest news",
+        f"{topic} statistics and data",
+        f"{topic} arguments for and against",
+        f"{topic} {debater_1.replace('_', ' ')}",
+        f"{topic} {debater_2.replace('_', ' ')}",
+    ]
+    return list(dict.fromkeys(queries))[:limit]
 
-def append_turn(turn: DebateTurn, debate_id: str | None = None) -> None:
-    data = []
-    output_path = OUTPUT_FILE
-    if debate_id:
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        output_path = OUTPUT_DIR / f"{debate_id}.json"
 
-    if output_path.exists():
-        try:
-            content = output_path.read_text(encoding="utf-8").strip()
-            if content:
-                data = json.loads(content)
-                if not isinstance(data, list):
-                    raise ValueError("JSON root is not a list")
-        except (json.JSONDecodeError, ValueError):
-            data = []
-
-    # Check for duplicate turn_id to prevent same turn being added multiple times
-    turn_dict = turn.model_dump()
-    for existing_turn in data:
-        if existing_turn.get("turn_id") == turn_dict["turn_id"]:
-            print(f"Duplicate turn_id detected, skipping: {turn_dict['turn_id']}")
+def majority_winner(verdicts: Iterable[object]) -> str:
+    """Winner named by most judges, or "" when there is no majority."""
+    votes = Counter(
+        winner.strip()
+        for winner in (getattr(verdict, "winner", "") for verdict in verdicts)
+        if winner and winner.strip()
+    )
+    if not votes:
+        return ""
+    ranked = votes.most_common(2)
+    if len(ranked) > 1 and ranked[0][1] == ranked[1][1]:
+        return ""
+    return ranked[0][0]
+
+
+def turn_log_path(debate_id: str) -> Path:
+    return OUTPUT_DIR / f"{debate_id}{TURN_LOG_SUFFIX}"
+
+
+def legacy_turn_log_path(debate_id: str) -> Path:
+    return OUTPUT_DIR / f"{debate_id}{LEGACY_TURN_LOG_SUFFIX}"
+
+
+class TurnLog:
+    """Append-only JSON Lines log of one debate's turns.
+
+    Each turn is one line, so appending never rereads or rewrites earlier
+    turns. Turn ids already in the file are indexed once when the log is
+    opened and duplicates are skipped. Lines are flushed on every append but
+    only fsynced every ``fsync_every`` appends and on close.
+    """
+
+    def __init__(self, path: Path, fsync_every: int = TURN_LOG_FSYNC_EVERY):
+        self.path = path
+        self._fsync_every = fsync_every
+        self._turn_ids = {turn.turn_id for turn in _read_turn_lines(path)}
+        self._handle: IO[str] | None = None
+        self._unsynced = 0
+
+    def __contains__(self, turn_id: str) -> bool:
+        return turn_id in self._turn_ids
+
+    def append(self, turn: DebateTurn) -> bool:
+        if turn.turn_id in self._turn_ids:
+            return False
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("a", encoding="utf-8")
+        self._handle.write(turn.model_dump_json() + "\n")
+        self._handle.flush()
+        self._turn_ids.add(turn.turn_id)
+        self._unsynced += 1
+        if self._unsynced >= self._fsync_every:
+            self.sync()
+        return True
+
+    def sync(self) -> None:
+        if self._handle is None or not self._unsynced:
             return
+        os.fsync(self._handle.fileno())
+        self._unsynced = 0
 
-    data.append(turn_dict)
+    def close(self) -> None:
+        if self._handle is None:
+            return
+        self.sync()
+        self._handle.close()
+        self._handle = None
 
-    temp_file = output_path.with_suffix(".tmp")
-    temp_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    temp_file.replace(output_path)
 
+_open_turn_logs: dict[Path, TurnLog] = {}
+_open_turn_logs_lock = threading.Lock()
 
-def load_persona(debater_name: str) -> str:
-    """Load persona YAML from the knowledge folder."""
-    # Convert name to file format: "Elon Musk" -> "elon_musk"
-    filename = debater_name.lower().replace(" ", "_")
 
-    # Try common extensions
-    for ext in [".yaml", ".yml", ".txt"]:
-        path = Path("knowledge") / f"{filename}{ext}"
+def _turn_log(path: Path) -> TurnLog:
+    with _open_turn_logs_lock:
+        turn_log = _open_turn_logs.get(path)
+        if turn_log is None:
+            turn_log = TurnLog(path)
+            _open_turn_logs[path] = turn_log
+        return turn_log
+
+
+def close_turn_log(debate_id: str) -> None:
+    with _open_turn_logs_lock:
+        turn_log = _open_turn_logs.pop(turn_log_path(debate_id), None)
+    if turn_log is not None:
+        turn_log.close()
+
+
+def _read_turn_lines(path: Path) -> Iterator[DebateTurn]:
+    try:
+        handle = path.open(encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield DebateTurn.model_validate_json(line)
+            except ValueError:
+                # A crash can leave a torn last line; everything before it is intact.
+                continue
+
+
+def _read_legacy_turn_log(path: Path) -> list[DebateTurn]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8") or "[]")
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+    if not isinstance(data, list):
+        return []
+    return [DebateTurn.model_validate(item) for item in data]
+
+
+def iter_turns(debate_id: str) -> Iterator[DebateTurn]:
+    """Lazily yield a debate's turns in the order they were appended."""
+    path = turn_log_path(debate_id)
+    if path.exists():
+        yield from _read_turn_lines(path)
+        return
+    yield from _read_legacy_turn_log(legacy_turn_log_path(debate_id))
+
+
+def migrate_legacy_turn_log(debate_id: str) -> bool:
+    """Rewrite an old ``{id}.json`` turn array as ``{id}.jsonl``."""
+    legacy_path = legacy_turn_log_path(debate_id)
+    if not legacy_path.exists():
+        return False
+    path = turn_log_path(debate_id)
+    seen = {turn.turn_id for turn in _read_turn_lines(path)}
+    lines: list[str] = []
+    for turn in _read_legacy_turn_log(legacy_path):
+        if turn.turn_id in seen:
+            continue
+        seen.add(turn.turn_id)
+        lines.append(turn.model_dump_json() + "\n")
+
+    temp_file = path.with_suffix(".tmp")
+    with temp_file.open("w", encoding="utf-8") as handle:
         if path.exists():
-            return path.read_text(encoding="utf-8")
+            handle.write(path.read_text(encoding="utf-8"))
+        handle.writelines(lines)
+        handle.flush()
+        os.fsync(handle.fileno())
+    temp_file.replace(path)
+    legacy_path.unlink()
+    return True
+
+
+def migrate_legacy_turn_logs() -> int:
+    if not OUTPUT_DIR.exists():
+        return 0
+    return sum(
+        1
+        for legacy_path in OUTPUT_DIR.glob(f"*{LEGACY_TURN_LOG_SUFFIX}")
+        if migrate_legacy_turn_log(legacy_path.stem)
+    )
 
-    # Fallback if not found
-    return f"Persona profile for {debater_name}"
+
+def delete_turn_log(debate_id: str) -> bool:
+    close_turn_log(debate_id)
+    deleted = False
+    for path in (turn_log_path(debate_id), legacy_turn_log_path(debate_id)):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        deleted = True
+    return deleted
+
+
+def purge_stale_turn_logs(older_than: float) -> int:
+    """Delete turn logs last written before ``older_than`` (epoch seconds)."""
+    if not OUTPUT_DIR.exists():
+        return 0
+    removed = 0
+    for suffix in (TURN_LOG_SUFFIX, LEGACY_TURN_LOG_SUFFIX):
+        for path in OUTPUT_DIR.glob(f"*{suffix}"):
+            try:
+                if path.stat().st_mtime < older_than:
+                    close_turn_log(path.stem)
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+    return removed
+
+
+def append_turn(turn: DebateTurn, debate_id: str | None = None) -> None:
+    output_path = turn_log_path(debate_id) if debate_id else OUTPUT_FILE
+    if not _turn_log(output_path).append(turn):
+        print(f"Duplicate turn_id detected, skipping: {turn.turn_id}")
+
+
+def load_persona(debater_name: str) -> str:
+    """Compact persona prompt for ``debater_name`` from the persona registry."""
+    persona = persona_registry.get(debater_name)
+    if persona is None:
+        logger.warning("persona_not_found debater=%r", debater_name)
+        return f"Persona profile for {debater_name}"
+    return persona.prompt_fragment
@@ -0,0 +1,125 @@
+"""Incremental, token-budgeted debate history for prompts.
+
+Each turn is rendered once, when it is appended, in two forms: the verbatim
+block used for recent turns and a one-line condensed form used once the
+history outgrows its token budget. The condensed form is not a summary, just
+the argument's first sentence, truncated.
+
+Turns are condensed, and the oldest condensed lines dropped, in whole steps of
+``recent_turns`` turns, and neither boundary ever moves back. Between those
+steps every prompt starts with the same bytes as the one before it, so
+providers with prefix caching keep reusing it; when a step is taken the
+condensed section only grows at its end.
+"""
+
+import re
+
+from pydantic import BaseModel, Field
+
+from .tokens import estimate_tokens
+
+NO_HISTORY = "No prior debate history."
+CONDENSED_HEADER = "Earlier rounds (condensed):"
+CONDENSED_MAX_CHARS = 240
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def render_turn(index: int, turn: object) -> str:
+    argument = getattr(turn, "argument", None)
+    return "Round {i} -- {debater} ({arg_type}, confidence {confidence}/100):\n{arg_text}".format(
+        i=index,
+        debater=getattr(turn, "debater", "unknown"),
+        arg_type=getattr(argument, "type", "unknown"),
+        confidence=getattr(argument, "confidence", "unknown"),
+        arg_text=getattr(argument, "text", ""),
+    )
+
+
+def condense_turn(index: int, turn: object) -> str:
+    argument = getattr(turn, "argument", None)
+    text = " ".join(getattr(argument, "text", "").split())
+    first_sentence = _SENTENCE_END_RE.split(text, maxsplit=1)[0]
+    if len(first_sentence) > CONDENSED_MAX_CHARS:
+        first_sentence = first_sentence[: CONDENSED_MAX_CHARS - 3].rstrip() + "..."
+    return "- Round {i} -- {debater} ({arg_type}): {text}".format(
+        i=index,
+        debater=getattr(turn, "debater", "unknown"),
+        arg_type=getattr(argument, "type", "unknown"),
+        text=first_sentence,
+    )
+
+
+class DebateHistory(BaseModel):
+    verbatim: list[str] = Field(default_factory=list, description="Verbatim rendering of each turn.")
+    verbatim_tokens: list[int] = Field(default_factory=list, description="Token estimate of each verbatim turn.")
+    condensed: list[str] = Field(default_factory=list, description="One-line rendering of each turn.")
+    condensed_tokens: list[int] = Field(default_factory=list, description="Token estimate of each condensed turn.")
+    condensed_until: int = Field(default=0, description="Turns before this index are condensed.")
+    omitted_until: int = Field(default=0, description="Turns before this index are left out entirely.")
+    condensed_prefix: str = Field(default="", description="Cached condensed section for the turns before condensed_until.")
+    tokens_saved: int = Field(
+        default=0,
+        description="Prompt tokens the condensed section saves over the verbatim turns it replaces.",
+    )
+
+    def append(self, turn: object) -> None:
+        index = len(self.verbatim) + 1
+        verbatim = render_turn(index, turn)
+        condensed = condense_turn(index, turn)
+        self.verbatim.append(verbatim)
+        self.verbatim_tokens.append(estimate_tokens(verbatim))
+        self.condensed.append(condensed)
+        self.condensed_tokens.append(estimate_tokens(condensed))
+
+    def full_text(self) -> str:
+        return "\n\n".join(self.verbatim) if self.verbatim else NO_HISTORY
+
+    def render(self, token_budget: int | None = None, recent_turns: int = 2) -> str:
+        """History for one prompt, within ``token_budget`` where possible.
+
+        The ``recent_turns`` most recent turns are always kept verbatim, so
+        the budget is a target rather than a hard cap. A debate should use the
+        same budget and ``recent_turns`` for every prompt.
+        """
+        if not self.verbatim or not token_budget:
+            return self.full_text()
+        if not self.condensed_until and sum(self.verbatim_tokens) <= token_budget:
+            return self.full_text()
+
+        step = max(recent_turns, 1)
+        condensed_until, omitted_until = self.condensed_until, self.omitted_until
+        while (
+            self._estimated_tokens(condensed_until, omitted_until) > token_budget
+            and condensed_until + step <= len(self.verbatim) - recent_turns
+        ):
+            condensed_until += step
+        while (
+            self._estimated_tokens(condensed_until, omitted_until) > token_budget
+            and omitted_until + step <= condensed_until
+        ):
+            omitted_until += step
+        if not condensed_until:
+            return self.full_text()
+        if (condensed_until, omitted_until) != (self.condensed_until, self.omitted_until):
+            self._condense(condensed_until, omitted_until)
+
+        return "\n\n".join([self.condensed_prefix, *self.verbatim[self.condensed_until :]])
+
+    def _estimated_tokens(self, condensed_until: int, omitted_until: int) -> int:
+        return (
+            estimate_tokens(CONDENSED_HEADER)
+            + sum(self.condensed_tokens[omitted_until:condensed_until])
+            + sum(self.verbatim_tokens[condensed_until:])
+        )
+
+    def _condense(self, condensed_until: int, omitted_until: int) -> None:
+        lines = [CONDENSED_HEADER]
+        if omitted_until:
+            lines.append(f"- ({omitted_until} earlier turns omitted)")
+        lines.extend(self.condensed[omitted_until:condensed_until])
+        self.condensed_until = condensed_until
+        self.omitted_until = omitted_until
+        self.condensed_prefix = "\n".join(lines)
+        replaced_tokens = sum(self.verbatim_tokens[:condensed_until])
+        self.tokens_saved = max(replaced_tokens - estimate_tokens(self.condensed_prefix), 0)
@@ -0,0 +1,19 @@
+"""One-shot conversion of legacy ``{id}.json`` turn logs to JSON Lines.
+
+Usage (from the backend directory):
+
+    python -m src.migrate_turn_logs
+"""
+
+from app.core.logger import logger
+
+from .helpers import OUTPUT_DIR, migrate_legacy_turn_logs
+
+
+def main() -> None:
+    migrated = migrate_legacy_turn_logs()
+    logger.info("turn_logs_migrated count=%s dir=%s", migrated, OUTPUT_DIR)
+
+
+if __name__ == "__main__":
+    main()
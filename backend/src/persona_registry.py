@@ -0,0 +1,177 @@
+"""Debater personas loaded from ``personas/*.yaml``.
+
+Every file is parsed and validated once, and the compact prompt fragment
+injected into a debater's backstory is rendered up front along with its
+token estimate. Personas are indexed by their file stem, ``meta.name`` and
+any ``meta.aliases``, all normalized, so "Elon Musk", "elon_musk" and
+"elon-musk" resolve to the same persona. The directory is re-scanned at most
+every ``reload_interval_seconds`` and files whose mtime changed are reloaded
+without restarting the worker.
+"""
+
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from app.core.config import settings
+from app.core.logger import logger
+
+from .tokens import estimate_tokens
+
+PERSONAS_DIR = Path(settings.personas_dir)
+PERSONA_RELOAD_INTERVAL_SECONDS = settings.persona_reload_interval_seconds
+PERSONA_SUFFIXES = (".yaml", ".yml")
+REQUIRED_SECTIONS = ("meta", "identity", "worldview", "rhetoric")
+
+_NAME_SEPARATORS_RE = re.compile(r"[\s_\-.]+")
+
+
+class PersonaError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Persona:
+    key: str
+    name: str
+    description: str
+    aliases: tuple[str, ...]
+    prompt_fragment: str
+    prompt_tokens: int
+    path: Path
+    mtime: float
+
+
+def normalize_persona_name(name: str) -> str:
+    return _NAME_SEPARATORS_RE.sub(" ", name.casefold()).strip()
+
+
+def _compact(value) -> str:
+    """Collapse a YAML value into one line of prompt text."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, list):
+        return "; ".join(filter(None, (_compact(item) for item in value)))
+    if isinstance(value, dict):
+        return "; ".join(filter(None, (_compact(item) for item in value.values())))
+    return "" if value is None else str(value)
+
+
+def render_prompt_fragment(data: dict) -> str:
+    meta = data["meta"]
+    worldview = data["worldview"]
+    rhetoric = data["rhetoric"]
+    interaction = data.get("interaction") or {}
+    lines = [
+        (meta["name"].strip(), _compact(meta["description"])),
+        ("Role", _compact(data["identity"].get("public_role"))),
+        ("Worldview", _compact(worldview.get("ideological_tags"))),
+        ("Non-negotiables", _compact(worldview.get("non_negotiables"))),
+        ("Moral framing", _compact(worldview.get("moral_framing"))),
+        ("Evidence", _compact((data.get("epistemology") or {}).get("evidence_preference"))),
+        ("Tone", _compact(rhetoric.get("tone"))),
+        ("Favored words", _compact((rhetoric.get("lexicon") or {}).get("favored_words"))),
+        ("Common phrases", _compact(rhetoric.get("common_phrases"))),
+        ("Argument structure", _compact(rhetoric.get("argument_structure"))),
+        ("Signature moves", _compact(rhetoric.get("signature_moves"))),
+        ("Against opposition", _compact(interaction.get("response_to_opposition"))),
+        ("Blind spots", _compact((data.get("cognitive_tendencies") or {}).get("blind_spots"))),
+    ]
+    return "\n".join(f"{label}: {text}" for label, text in lines if text)
+
+
+def load_persona_file(path: Path) -> Persona:
+    try:
+        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    except yaml.YAMLError as exc:
+        raise PersonaError(f"{path.name}: invalid YAML: {exc}") from exc
+    if not isinstance(data, dict):
+        raise PersonaError(f"{path.name}: expected a mapping at the top level")
+    for section in REQUIRED_SECTIONS:
+        if not isinstance(data.get(section), dict):
+            raise PersonaError(f"{path.name}: missing section {section!r}")
+    meta = data["meta"]
+    for field in ("name", "description"):
+        if not isinstance(meta.get(field), str) or not meta[field].strip():
+            raise PersonaError(f"{path.name}: meta.{field} must be a non-empty string")
+    aliases = meta.get("aliases") or []
+    if not isinstance(aliases, list) or not all(isinstance(alias, str) for alias in aliases):
+        raise PersonaError(f"{path.name}: meta.aliases must be a list of strings")
+
+    fragment = render_prompt_fragment(data)
+    return Persona(
+        key=path.stem,
+        name=meta["name"].strip(),
+        description=_compact(meta["description"]),
+        aliases=tuple(aliases),
+        prompt_fragment=fragment,
+        prompt_tokens=estimate_tokens(fragment),
+        path=path,
+        mtime=path.stat().st_mtime,
+    )
+
+
+class PersonaRegistry:
+    def __init__(
+        self,
+        directory: Path = PERSONAS_DIR,
+        reload_interval_seconds: float = PERSONA_RELOAD_INTERVAL_SECONDS,
+    ):
+        self._directory = Path(directory)
+        self._reload_interval_seconds = reload_interval_seconds
+        self._personas: dict[Path, Persona] = {}
+        self._index: dict[str, Persona] = {}
+        self._checked_at: float | None = None
+        self._lock = threading.Lock()
+
+    def _scan(self) -> None:
+        paths = (
+            sorted(p for p in self._directory.iterdir() if p.suffix in PERSONA_SUFFIXES)
+            if self._directory.is_dir()
+            else []
+        )
+        personas: dict[Path, Persona] = {}
+        for path in paths:
+            current = self._personas.get(path)
+            try:
+                if current is not None and current.mtime == path.stat().st_mtime:
+                    personas[path] = current
+                    continue
+                personas[path] = load_persona_file(path)
+                logger.info("persona_loaded path=%s tokens=%s", path, personas[path].prompt_tokens)
+            except (OSError, PersonaError) as exc:
+                logger.error("persona_invalid path=%s error=%s", path, exc)
+
+        index: dict[str, Persona] = {}
+        for persona in personas.values():
+            for name in (persona.key, persona.name, *persona.aliases):
+                index.setdefault(normalize_persona_name(name), persona)
+        self._personas = personas
+        self._index = index
+
+    def refresh(self, force: bool = False) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._checked_at is not None
+                and now - self._checked_at < self._reload_interval_seconds
+            ):
+                return
+            self._scan()
+            self._checked_at = now
+
+    def get(self, name: str) -> Persona | None:
+        self.refresh()
+        return self._index.get(normalize_persona_name(name))
+
+    def all(self) -> list[Persona]:
+        self.refresh()
+        return sorted(self._personas.values(), key=lambda persona: persona.name)
+
+
+persona_registry = PersonaRegistry()
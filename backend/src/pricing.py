@@ -3,6 +3,8 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
+from app.services.debate_service import DebateWriteBuffer
+
 from .storage import record_llm_call
 
 
@@ -121,22 +123,34 @@ def record_call_usage(
     debate_token_usage: dict[str, int],
     cost_by_model: dict[str, float],
     debate_id: str,
+    write_buffer: DebateWriteBuffer | None = None,
+    usage_by_model: dict[str, dict[str, int]] | None = None,
 ) -> dict[str, int]:
     parsed = accumulate_usage(usage, debate_token_usage)
     if not parsed:
         return {}
+    if usage_by_model is not None:
+        accumulate_usage(parsed, usage_by_model.setdefault(model, {}))
     input_tokens = parsed["prompt_tokens"]
     output_tokens = parsed["completion_tokens"]
     cost_usd = compute_cost_usd(model, input_tokens, output_tokens)
     cost_by_model[model] = cost_by_model.get(model, 0.0) + cost_usd
-    record_llm_call(
-        debate_id=debate_id,
-        model=model,
-        input_tokens=input_tokens,
-        output_tokens=output_tokens,
-        cost_usd=cost_usd,
-    )
-    return parsed
+    if write_buffer is not None:
+        write_buffer.record_llm_call(
+            model=model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=cost_usd,
+        )
+    else:
+        record_llm_call(
+            debate_id=debate_id,
+            model=model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=cost_usd,
+        )
+    return {**parsed, "cost_usd": cost_usd}
 
 
 def record_usage_from_response(
@@ -145,14 +159,18 @@ def record_usage_from_response(
     debate_token_usage: dict[str, int],
     cost_by_model: dict[str, float],
     debate_id: str,
-) -> None:
+    write_buffer: DebateWriteBuffer | None = None,
+    usage_by_model: dict[str, dict[str, int]] | None = None,
+) -> dict[str, int]:
     usage = getattr(response, "token_usage", None)
-    record_call_usage(
+    return record_call_usage(
         model=model,
         usage=usage,
         debate_token_usage=debate_token_usage,
         cost_by_model=cost_by_model,
         debate_id=debate_id,
+        write_buffer=write_buffer,
+        usage_by_model=usage_by_model,
     )
 
 
@@ -162,6 +180,8 @@ def record_usage_from_llm(
     debate_token_usage: dict[str, int],
     cost_by_model: dict[str, float],
     debate_id: str,
+    write_buffer: DebateWriteBuffer | None = None,
+    usage_by_model: dict[str, dict[str, int]] | None = None,
 ) -> None:
     try:
         usage = llm.get_token_usage_summary()
@@ -174,6 +194,8 @@ def record_usage_from_llm(
         debate_token_usage=debate_token_usage,
         cost_by_model=cost_by_model,
         debate_id=debate_id,
+        write_buffer=write_buffer,
+        usage_by_model=usage_by_model,
     )
 
 
@@ -184,5 +206,21 @@ def debate_usage_as_text(debate_token_usage: dict[str, int]) -> str:
         f"prompt_tokens={usage.get('prompt_tokens', 0)} "
         f"cached_prompt_tokens={usage.get('cached_prompt_tokens', 0)} "
         f"completion_tokens={usage.get('completion_tokens', 0)} "
-        f"successful_requests={usage.get('successful_requests', 0)}"
+        f"successful_requests={usage.get('successful_requests', 0)} "
+        f"history_tokens_saved={usage.get('history_tokens_saved', 0)}"
     )
+
+
+def prompt_cache_report(usage_by_model: dict[str, dict[str, int]]) -> dict[str, dict]:
+    """Per-model share of prompt tokens the provider served from its prompt cache."""
+    report = {}
+    for model, usage in sorted(usage_by_model.items()):
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        cached_prompt_tokens = usage.get("cached_prompt_tokens", 0)
+        report[model] = {
+            "requests": usage.get("successful_requests", 0),
+            "prompt_tokens": prompt_tokens,
+            "cached_prompt_tokens": cached_prompt_tokens,
+            "cache_hit_rate": round(cached_prompt_tokens / prompt_tokens, 4) if prompt_tokens else 0.0,
+        }
+    return report
@@ -6,7 +6,7 @@ def presenter_introduction_prompt(topic: str, debater_1: str, debater_2: str) ->
     ).format(topic=topic, debater_1=debater_1, debater_2=debater_2)
 
 
-def presenter_conclusion_prompt(topic: str, debater_1: str, debater_2: str, turns: object) -> str:
+def presenter_conclusion_prompt(topic: str, debater_1: str, debater_2: str, turns: str) -> str:
     return (
         "You are Piers Morgan. Conclude the debate on the topic: {topic} "
         "between {debater_1} and {debater_2}. "
@@ -18,7 +18,7 @@ def presenter_conclusion_prompt(topic: str, debater_1: str, debater_2: str, turn
     ).format(topic=topic, debater_1=debater_1, debater_2=debater_2, turns=turns)
 
 
-def debate_summary_prompt(turns: object, judge_verdicts: str, winner: str) -> str:
+def debate_summary_prompt(turns: str, judge_verdicts: str, winner: str) -> str:
     return (
         "You are a debate analyst.\n"
         "Review the following debate turns:\n"
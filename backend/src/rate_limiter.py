@@ -0,0 +1,246 @@
+"""Per-model token buckets shared by every worker through Redis.
+
+Each model gets a requests/min and a tokens/min bucket. Every LLM call made by
+crewai (agent iterations and direct ``LLM.call``) passes through a global
+before-call hook that takes one request and the estimated prompt plus
+completion tokens, sleeping only when a bucket is actually empty. A provider
+rate-limit error closes the model's buckets for a cooldown and drains them, so
+all workers back off together instead of each retrying into the same wall.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+
+import redis
+from crewai.events import LLMCallFailedEvent
+from crewai.events.event_bus import crewai_event_bus
+from crewai.hooks import register_before_llm_call_hook
+
+from app.cache import redis_client
+from app.core.config import settings
+from app.core.logger import logger
+
+from .retry_utils import is_rate_limit_message
+from .tokens import estimate_tokens
+
+RATE_LIMIT_ENABLED = settings.rate_limit_enabled
+RATE_LIMIT_OUTPUT_TOKEN_ESTIMATE = settings.rate_limit_output_token_estimate
+RATE_LIMIT_COOLDOWN_SECONDS = settings.rate_limit_cooldown_seconds
+RATE_LIMIT_DEFAULT_REQUESTS_PER_MINUTE = settings.rate_limit_default_requests_per_minute
+RATE_LIMIT_DEFAULT_TOKENS_PER_MINUTE = settings.rate_limit_default_tokens_per_minute
+
+BUCKET_TTL_MS = 120_000
+
+
+@dataclass(frozen=True)
+class ModelLimits:
+    requests_per_minute: int
+    tokens_per_minute: int
+
+
+DEFAULT_LIMITS: dict[str, ModelLimits] = {
+    # RATE_LIMITS_JSON overrides these or adds models.
+    "groq/llama-3.1-8b-instant": ModelLimits(30, 6000),
+    "groq/qwen/qwen3-32b": ModelLimits(60, 6000),
+    "groq/llama-3.3-70b-versatile": ModelLimits(30, 12000),
+    "groq/openai/gpt-oss-120b": ModelLimits(30, 8000),
+}
+
+
+def _parse_limits(raw: str | None) -> dict[str, ModelLimits]:
+    if not raw or not raw.strip():
+        return {}
+    try:
+        payload = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        logger.warning("rate_limits_json_invalid error=%s", exc)
+        return {}
+    limits: dict[str, ModelLimits] = {}
+    for model, value in payload.items():
+        if not isinstance(value, dict):
+            continue
+        limits[str(model)] = ModelLimits(
+            int(value.get("requests_per_minute", RATE_LIMIT_DEFAULT_REQUESTS_PER_MINUTE)),
+            int(value.get("tokens_per_minute", RATE_LIMIT_DEFAULT_TOKENS_PER_MINUTE)),
+        )
+    return limits
+
+
+MODEL_LIMITS: dict[str, ModelLimits] = {**DEFAULT_LIMITS, **_parse_limits(settings.rate_limits_json)}
+FALLBACK_LIMITS = ModelLimits(RATE_LIMIT_DEFAULT_REQUESTS_PER_MINUTE, RATE_LIMIT_DEFAULT_TOKENS_PER_MINUTE)
+
+
+def get_model_limits(model: str) -> ModelLimits:
+    return MODEL_LIMITS.get(model, FALLBACK_LIMITS)
+
+
+# Returns 0 when one request and ARGV[5] tokens were taken, otherwise the
+# milliseconds until both buckets could cover the call (nothing is taken).
+_ACQUIRE_SCRIPT = """
+local cooldown = redis.call('PTTL', KEYS[3])
+if cooldown > 0 then
+    return cooldown
+end
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+
+local function level(key, capacity, rate)
+    local state = redis.call('HMGET', key, 'level', 'ts')
+    local value = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    return math.min(capacity, value + math.max(0, now - ts) * rate)
+end
+
+local request_capacity = tonumber(ARGV[1])
+local request_rate = tonumber(ARGV[2])
+local token_capacity = tonumber(ARGV[3])
+local token_rate = tonumber(ARGV[4])
+local cost = tonumber(ARGV[5])
+local ttl = tonumber(ARGV[6])
+
+local requests = level(KEYS[1], request_capacity, request_rate)
+local tokens = level(KEYS[2], token_capacity, token_rate)
+
+local wait = 0
+if requests < 1 then
+    wait = math.max(wait, math.ceil((1 - requests) / request_rate))
+end
+if tokens < cost then
+    wait = math.max(wait, math.ceil((cost - tokens) / token_rate))
+end
+if wait > 0 then
+    return wait
+end
+
+redis.call('HSET', KEYS[1], 'level', tostring(requests - 1), 'ts', now)
+redis.call('HSET', KEYS[2], 'level', tostring(tokens - cost), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], ttl)
+redis.call('PEXPIRE', KEYS[2], ttl)
+return 0
+"""
+
+_PENALIZE_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local cooldown = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+if cooldown > 0 then
+    redis.call('SET', KEYS[3], '1', 'PX', cooldown)
+end
+redis.call('HSET', KEYS[1], 'level', '0', 'ts', now)
+redis.call('HSET', KEYS[2], 'level', '0', 'ts', now)
+redis.call('PEXPIRE', KEYS[1], ttl)
+redis.call('PEXPIRE', KEYS[2], ttl)
+return 1
+"""
+
+
+def _bucket_keys(model: str) -> list[str]:
+    prefix = f"ratelimit:{model}"
+    return [f"{prefix}:requests", f"{prefix}:tokens", f"{prefix}:cooldown"]
+
+
+def estimate_call_tokens(messages: object) -> int:
+    # Providers count real tokens; the rough prompt estimate plus a completion
+    # reserve only needs to keep us under the per-minute quota.
+    if isinstance(messages, str):
+        prompt = messages
+    else:
+        prompt = "".join(str(message.get("content") or "") for message in messages or [])
+    return estimate_tokens(prompt) + RATE_LIMIT_OUTPUT_TOKEN_ESTIMATE
+
+
+class TokenBucketRateLimiter:
+    def __init__(self, client: redis.Redis | None = None, limits_for=get_model_limits):
+        self._client = client if client is not None else redis_client
+        self._limits_for = limits_for
+        self._acquire = self._client.register_script(_ACQUIRE_SCRIPT)
+        self._penalize = self._client.register_script(_PENALIZE_SCRIPT)
+
+    def try_acquire(self, model: str, tokens: int) -> int:
+        """Take one request and ``tokens`` from the model's buckets.
+
+        Returns 0 on success, otherwise the milliseconds to wait before retrying.
+        """
+        limits = self._limits_for(model)
+        # A call larger than the whole bucket would wait forever; let it drain
+        # the bucket instead.
+        cost = min(tokens, limits.tokens_per_minute)
+        return int(
+            self._acquire(
+                keys=_bucket_keys(model),
+                args=[
+                    limits.requests_per_minute,
+                    limits.requests_per_minute / 60_000,
+                    limits.tokens_per_minute,
+                    limits.tokens_per_minute / 60_000,
+                    cost,
+                    BUCKET_TTL_MS,
+                ],
+            )
+        )
+
+    def acquire(self, model: str, tokens: int) -> float:
+        """Block until the call fits the model's buckets; returns seconds waited."""
+        waited = 0.0
+        while True:
+            wait_ms = self.try_acquire(model, tokens)
+            if wait_ms <= 0:
+                return waited
+            time.sleep(wait_ms / 1000)
+            waited += wait_ms / 1000
+
+    def penalize(self, model: str, cooldown_seconds: float = RATE_LIMIT_COOLDOWN_SECONDS) -> None:
+        """Close and drain the model's buckets after a provider rate-limit error."""
+        self._penalize(
+            keys=_bucket_keys(model),
+            args=[int(cooldown_seconds * 1000), BUCKET_TTL_MS],
+        )
+
+
+_rate_limiter: TokenBucketRateLimiter | None = None
+
+
+def _model_name(llm: object) -> str | None:
+    model = getattr(llm, "model", llm)
+    return model if isinstance(model, str) and model else None
+
+
+def _before_llm_call(context) -> None:
+    model = _model_name(context.llm)
+    if model is None or _rate_limiter is None:
+        return None
+    try:
+        waited = _rate_limiter.acquire(model, estimate_call_tokens(context.messages))
+    except redis.RedisError as exc:
+        # Never block debates on the limiter itself; the retry wrapper still
+        # backs off if the provider pushes back.
+        logger.warning("rate_limiter_unavailable model=%s error=%s", model, exc)
+        return None
+    if waited > 0:
+        logger.info("rate_limited model=%s waited_seconds=%.2f", model, waited)
+    return None
+
+
+def _on_llm_call_failed(source, event) -> None:
+    model = _model_name(source)
+    if model is None or _rate_limiter is None or not is_rate_limit_message(event.error):
+        return
+    try:
+        _rate_limiter.penalize(model)
+    except redis.RedisError as exc:
+        logger.warning("rate_limiter_unavailable model=%s error=%s", model, exc)
+        return
+    logger.warning("rate_limit_cooldown model=%s seconds=%s", model, RATE_LIMIT_COOLDOWN_SECONDS)
+
+
+def install_rate_limiter() -> None:
+    """Register the limiter with crewai once per process."""
+    global _rate_limiter
+    if _rate_limiter is not None or not RATE_LIMIT_ENABLED:
+        return
+    _rate_limiter = TokenBucketRateLimiter()
+    register_before_llm_call_hook(_before_llm_call)
+    crewai_event_bus.on(LLMCallFailedEvent)(_on_llm_call_failed)
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
-from tenacity import Retrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from app.core.logger import logger
+from app.metrics import record_retry
 
 T = TypeVar("T")
 
@@ -58,12 +66,16 @@ def _status_code(exception: BaseException) -> int | None:
     return None
 
 
+def is_rate_limit_message(message: str) -> bool:
+    message = message.strip().lower()
+    return any(marker in message for marker in RATE_LIMIT_MARKERS)
+
+
 def is_rate_limit_error(exception: BaseException) -> bool:
     status_code = _status_code(exception)
     if status_code == 429:
         return True
-    message = _message(exception)
-    return any(marker in message for marker in RATE_LIMIT_MARKERS)
+    return is_rate_limit_message(str(exception))
 
 
 def is_retriable_error(exception: BaseException) -> bool:
@@ -85,6 +97,40 @@ def is_retriable_error(exception: BaseException) -> bool:
     return any(marker in message for marker in TRANSIENT_ERROR_MARKERS)
 
 
+def _retry_policy(
+    operation_name: str,
+    max_attempts: int,
+    initial_wait_seconds: float,
+    max_wait_seconds: float,
+) -> dict[str, Any]:
+    def before_sleep(retry_state: RetryCallState) -> None:
+        exc = retry_state.outcome.exception()
+        reason = "rate_limit" if exc is not None and is_rate_limit_error(exc) else "transient"
+        record_retry(operation_name, reason, retry_state.next_action.sleep)
+
+    return {
+        "before_sleep": before_sleep,
+        "stop": stop_after_attempt(max_attempts),
+        "wait": wait_exponential_jitter(
+            initial=initial_wait_seconds,
+            max=max_wait_seconds,
+        ),
+        "retry": retry_if_exception(is_retriable_error),
+        "reraise": True,
+    }
+
+
+def _log_retry(operation_name: str, attempt_number: int, max_attempts: int, exc: Exception) -> None:
+    if attempt_number < max_attempts:
+        logger.warning(
+            "retrying_operation name=%s attempt=%s/%s error=%s",
+            operation_name,
+            attempt_number,
+            max_attempts,
+            exc,
+        )
+
+
 def call_with_retry(
     operation: Callable[[], T],
     operation_name: str,
@@ -95,15 +141,7 @@ def call_with_retry(
     if max_attempts <= 1:
         return operation()
 
-    retryer = Retrying(
-        stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential_jitter(
-            initial=initial_wait_seconds,
-            max=max_wait_seconds,
-        ),
-        retry=retry_if_exception(is_retriable_error),
-        reraise=True,
-    )
+    retryer = Retrying(**_retry_policy(operation_name, max_attempts, initial_wait_seconds, max_wait_seconds))
 
     for attempt in retryer:
         with attempt:
@@ -112,16 +150,34 @@ def call_with_retry(
             except Exception as exc:
                 if not is_retriable_error(exc):
                     raise
-                attempt_number = attempt.retry_state.attempt_number
-                if attempt_number < max_attempts:
-                    logger.warning(
-                        "retrying_operation name=%s attempt=%s/%s error=%s",
-                        operation_name,
-                        attempt_number,
-                        max_attempts,
-                        exc,
-                    )
+                _log_retry(operation_name, attempt.retry_state.attempt_number, max_attempts, exc)
                 raise
 
     # StopIteration should never happen because tenacity either returns or raises.
     raise RuntimeError(f"Retry loop exhausted unexpectedly for {operation_name}")
+
+
+async def call_with_retry_async(
+    operation: Callable[[], Awaitable[T]],
+    operation_name: str,
+    max_attempts: int,
+    initial_wait_seconds: float,
+    max_wait_seconds: float,
+) -> T:
+    """Like call_with_retry, but awaits the operation and backs off with asyncio.sleep."""
+    if max_attempts <= 1:
+        return await operation()
+
+    retryer = AsyncRetrying(**_retry_policy(operation_name, max_attempts, initial_wait_seconds, max_wait_seconds))
+
+    async for attempt in retryer:
+        with attempt:
+            try:
+                return await operation()
+            except Exception as exc:
+                if not is_retriable_error(exc):
+                    raise
+                _log_retry(operation_name, attempt.retry_state.attempt_number, max_attempts, exc)
+                raise
+
+    raise RuntimeError(f"Retry loop exhausted unexpectedly for {operation_name}")
@@ -1,6 +1,8 @@
 from pydantic import BaseModel, Field, conint, conlist
 from typing import Any, Literal
 
+from .history import DebateHistory
+
 
 # ---------- Shared constrained types ----------
 Score0to10 = conint(ge=0, le=10)
@@ -66,6 +68,14 @@ class DebateState(BaseModel):
         default_factory=list,
         description="Chronological log of all debate turns, used as conversational memory and grounding context."
     )
+    history: DebateHistory = Field(
+        default_factory=DebateHistory,
+        description="Rendered turns cached for building token-budgeted history prompts."
+    )
+    search_snippets: dict[str, str] = Field(
+        default_factory=dict,
+        description="Web search results prefetched for topic-derived queries at debate start, keyed by query."
+    )
     winner: str = Field(default="", description="Name of the winning debater")
 
     judge_verdicts: str = Field(
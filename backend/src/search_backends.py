@@ -0,0 +1,145 @@
+"""Web search backends used by ``WebSearchTool``.
+
+``duckduckgo`` is the live backend. ``fixture`` answers from a local JSON
+corpus (``{"query": "result text", ...}``) so tests and benchmarks run without
+network access; ``fake`` answers any query with a generated snippet after
+``FAKE_SEARCH_LATENCY_SECONDS``, for load tests that need no corpus.
+"""
+
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Protocol
+
+from app.core.config import settings
+
+WEB_SEARCH_BACKEND = settings.web_search_backend
+WEB_SEARCH_FIXTURE_PATH = settings.web_search_fixture_path
+WEB_SEARCH_TIMEOUT_SECONDS = settings.web_search_timeout_seconds
+FAKE_SEARCH_LATENCY_SECONDS = settings.fake_search_latency_seconds
+
+# Same text DuckDuckGoSearchRun returns when nothing matches.
+NO_RESULTS = "No good DuckDuckGo Search Result was found"
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class SearchBackend(Protocol):
+    def search(self, query: str) -> str: ...
+
+
+class DuckDuckGoBackend:
+    """DuckDuckGoSearchRun with a hard timeout.
+
+    The DuckDuckGo client has no timeout of its own, so each search runs on a
+    small dedicated pool and the caller stops waiting after
+    ``timeout_seconds``; a stuck request only occupies a pool thread.
+    """
+
+    _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="web-search")
+
+    def __init__(self, timeout_seconds: float = WEB_SEARCH_TIMEOUT_SECONDS):
+        from langchain_community.tools import DuckDuckGoSearchRun
+
+        self._search = DuckDuckGoSearchRun()
+        self._timeout_seconds = timeout_seconds
+
+    def search(self, query: str) -> str:
+        future = self._executor.submit(self._search.run, query)
+        try:
+            return future.result(timeout=self._timeout_seconds)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError(f"web search timed out after {self._timeout_seconds}s") from None
+
+
+class FixtureSearchBackend:
+    """Answers from an in-memory corpus: exact query first, then the entry
+    sharing the most words with the query."""
+
+    def __init__(self, corpus: dict[str, str]):
+        self._corpus = {_words_key(query): result for query, result in corpus.items()}
+        self._entries = [(set(key.split()), result) for key, result in self._corpus.items()]
+        self.calls = 0
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "FixtureSearchBackend":
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def search(self, query: str) -> str:
+        self.calls += 1
+        key = _words_key(query)
+        if key in self._corpus:
+            return self._corpus[key]
+        words = set(key.split())
+        best_overlap, best_result = 0, NO_RESULTS
+        for entry_words, result in self._entries:
+            overlap = len(words & entry_words)
+            if overlap > best_overlap:
+                best_overlap, best_result = overlap, result
+        return best_result
+
+
+class FakeSearchBackend:
+    """Generated, deterministic result for every query."""
+
+    def __init__(self, latency_seconds: float = FAKE_SEARCH_LATENCY_SECONDS):
+        self._latency_seconds = latency_seconds
+        self.calls = 0
+
+    def search(self, query: str) -> str:
+        self.calls += 1
+        if self._latency_seconds > 0:
+            time.sleep(self._latency_seconds)
+        subject = _words_key(query) or "the query"
+        return (
+            f"Recent coverage of {subject} reports sharp disagreement among experts. "
+            f"Surveys on {subject} show public opinion roughly evenly split."
+        )
+
+
+class WarmSearchCorpus:
+    """Results prefetched for one debate's topic-derived queries.
+
+    A query is answered from the entry it overlaps best, scored as the
+    shared words over the larger of the two word sets, as long as the score
+    reaches ``min_overlap``; otherwise ``lookup`` returns ``None`` and the
+    caller searches live. Scoring against the larger set keeps a specific
+    query that merely mentions the topic from matching the bare topic entry.
+    """
+
+    def __init__(self, snippets: dict[str, str], min_overlap: float):
+        self._entries = [
+            (set(_words_key(query).split()), result) for query, result in snippets.items()
+        ]
+        self._min_overlap = min_overlap
+
+    def lookup(self, query: str) -> str | None:
+        words = set(_words_key(query).split())
+        best_score, best_result = 0.0, None
+        for entry_words, result in self._entries:
+            if not entry_words:
+                continue
+            score = len(words & entry_words) / max(len(words), len(entry_words))
+            if score >= self._min_overlap and score > best_score:
+                best_score, best_result = score, result
+        return best_result
+
+
+def _words_key(text: str) -> str:
+    return " ".join(_WORD_RE.findall(text.casefold()))
+
+
+def build_search_backend(name: str = WEB_SEARCH_BACKEND) -> SearchBackend:
+    if name == "fixture":
+        if not WEB_SEARCH_FIXTURE_PATH:
+            raise ValueError("WEB_SEARCH_FIXTURE_PATH is required for the fixture search backend")
+        return FixtureSearchBackend.from_file(WEB_SEARCH_FIXTURE_PATH)
+    if name == "fake":
+        return FakeSearchBackend()
+    if name == "duckduckgo":
+        return DuckDuckGoBackend()
+    raise ValueError(f"unknown web search backend: {name}")
@@ -0,0 +1,298 @@
+"""Two-level cache in front of the web search backend.
+
+Results are keyed on the normalized query. A per-process LRU answers repeated
+searches within a worker without a network hop, and a Redis tier shares
+results between workers. Failed searches are cached too, for a much shorter
+TTL, so an outage does not turn every debater turn into a slow timeout.
+Lookup outcomes are counted per process and added to a Redis hash for
+``/health/search-cache`` along with the next Redis read or write, or after
+``WEB_SEARCH_CACHE_STATS_FLUSH_SECONDS`` at the latest, so hits answered
+locally never wait on Redis.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+
+import redis
+
+from app.cache import redis_client
+from app.core.config import settings
+from app.core.logger import logger
+from app.metrics import WEB_SEARCH_LOOKUPS, WEB_SEARCH_SECONDS
+
+from .search_backends import NO_RESULTS, SearchBackend, WarmSearchCorpus, build_search_backend
+
+WEB_SEARCH_CACHE_ENABLED = settings.web_search_cache_enabled
+WEB_SEARCH_CACHE_TTL_SECONDS = settings.web_search_cache_ttl_seconds
+WEB_SEARCH_CACHE_ERROR_TTL_SECONDS = settings.web_search_cache_error_ttl_seconds
+WEB_SEARCH_CACHE_LOCAL_MAX_ENTRIES = settings.web_search_cache_local_max_entries
+WEB_SEARCH_CACHE_STATS_FLUSH_SECONDS = settings.web_search_cache_stats_flush_seconds
+SEARCH_PREFETCH_MATCH_THRESHOLD = settings.search_prefetch_match_threshold
+
+SEARCH_CACHE_KEY_PREFIX = "search:cache:"
+SEARCH_CACHE_STATS_KEY = "search:stats"
+
+OUTCOME_LOCAL_HIT = "local_hits"
+OUTCOME_SHARED_HIT = "shared_hits"
+OUTCOME_MISS = "misses"
+OUTCOME_ERROR = "errors"
+OUTCOME_WARM_HIT = "warm_hits"
+
+
+def normalize_query(query: str) -> str:
+    collapsed = " ".join((query or "").split()).casefold()
+    return collapsed.strip(" \"'`.,;:!?")
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    text: str
+    error: bool = False
+
+
+class SearchCache:
+    def __init__(
+        self,
+        client: redis.Redis | None = None,
+        ttl_seconds: int = WEB_SEARCH_CACHE_TTL_SECONDS,
+        error_ttl_seconds: int = WEB_SEARCH_CACHE_ERROR_TTL_SECONDS,
+        local_max_entries: int = WEB_SEARCH_CACHE_LOCAL_MAX_ENTRIES,
+        stats_flush_seconds: float = WEB_SEARCH_CACHE_STATS_FLUSH_SECONDS,
+    ):
+        self._client = client if client is not None else redis_client
+        self._ttl_seconds = ttl_seconds
+        self._error_ttl_seconds = error_ttl_seconds
+        self._local_max_entries = local_max_entries
+        self._stats_flush_seconds = stats_flush_seconds
+        self._local: OrderedDict[str, tuple[float, SearchResult]] = OrderedDict()
+        self._pending_counts: Counter[str] = Counter()
+        self._counts_flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _redis_key(normalized: str) -> str:
+        return SEARCH_CACHE_KEY_PREFIX + hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def _get_local(self, normalized: str) -> SearchResult | None:
+        with self._lock:
+            entry = self._local.get(normalized)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._local[normalized]
+                return None
+            self._local.move_to_end(normalized)
+            return result
+
+    def _set_local(self, normalized: str, result: SearchResult, ttl_seconds: int) -> None:
+        with self._lock:
+            self._local[normalized] = (time.monotonic() + ttl_seconds, result)
+            self._local.move_to_end(normalized)
+            while len(self._local) > self._local_max_entries:
+                self._local.popitem(last=False)
+
+    def _count(self, outcome: str) -> None:
+        WEB_SEARCH_LOOKUPS.labels(outcome=outcome).inc()
+        with self._lock:
+            self._pending_counts[outcome] += 1
+            due = time.monotonic() - self._counts_flushed_at >= self._stats_flush_seconds
+        if due:
+            self.flush_stats()
+
+    def _take_pending_counts(self) -> Counter[str]:
+        with self._lock:
+            pending, self._pending_counts = self._pending_counts, Counter()
+            self._counts_flushed_at = time.monotonic()
+        return pending
+
+    def _restore_pending_counts(self, pending: Counter[str]) -> None:
+        with self._lock:
+            self._pending_counts.update(pending)
+
+    @staticmethod
+    def _queue_counts(pipe, pending: Counter[str]) -> None:
+        for outcome, count in pending.items():
+            pipe.hincrby(SEARCH_CACHE_STATS_KEY, outcome, count)
+
+    def flush_stats(self) -> None:
+        """Add this process's unflushed lookup counts to the shared stats."""
+        pending = self._take_pending_counts()
+        if not pending:
+            return
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            self._queue_counts(pipe, pending)
+            pipe.execute()
+        except redis.RedisError:
+            self._restore_pending_counts(pending)
+
+    def get(self, query: str) -> SearchResult | None:
+        normalized = normalize_query(query)
+        result = self._get_local(normalized)
+        if result is not None:
+            self._count(OUTCOME_LOCAL_HIT)
+            return result
+
+        key = self._redis_key(normalized)
+        # Pending counts ride along with Redis reads and writes instead of
+        # taking their own round trip.
+        pending = self._take_pending_counts()
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.ttl(key)
+            self._queue_counts(pipe, pending)
+            raw, remaining = pipe.execute()[:2]
+        except redis.RedisError as exc:
+            logger.warning("search_cache_unavailable error=%s", exc)
+            self._restore_pending_counts(pending)
+            raw, remaining = None, -1
+        if raw is None:
+            self._count(OUTCOME_MISS)
+            return None
+
+        payload = json.loads(raw)
+        result = SearchResult(payload["text"], payload.get("error", False))
+        # Keep the local copy no longer than the shared entry has left.
+        self._set_local(normalized, result, remaining if remaining > 0 else self._error_ttl_seconds)
+        self._count(OUTCOME_SHARED_HIT)
+        return result
+
+    def set(self, query: str, result: SearchResult) -> None:
+        normalized = normalize_query(query)
+        ttl_seconds = self._error_ttl_seconds if result.error else self._ttl_seconds
+        if result.error:
+            self._count(OUTCOME_ERROR)
+        self._set_local(normalized, result, ttl_seconds)
+        pending = self._take_pending_counts()
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pipe.setex(
+                self._redis_key(normalized),
+                ttl_seconds,
+                json.dumps({"text": result.text, "error": result.error}),
+            )
+            self._queue_counts(pipe, pending)
+            pipe.execute()
+        except redis.RedisError as exc:
+            logger.warning("search_cache_unavailable error=%s", exc)
+            self._restore_pending_counts(pending)
+
+
+def run_search(backend: SearchBackend, query: str) -> SearchResult:
+    started = time.perf_counter()
+    try:
+        result = SearchResult(backend.search(query))
+    except Exception as exc:
+        result = SearchResult(f"Error searching the web: {exc}", error=True)
+    WEB_SEARCH_SECONDS.labels(outcome="error" if result.error else "ok").observe(
+        time.perf_counter() - started
+    )
+    return result
+
+
+_search_cache: SearchCache | None = None
+_search_backend: SearchBackend | None = None
+
+
+def _default_cache() -> SearchCache:
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = SearchCache()
+    return _search_cache
+
+
+def _default_backend() -> SearchBackend:
+    global _search_backend
+    if _search_backend is None:
+        _search_backend = build_search_backend()
+    return _search_backend
+
+
+def search_web_result(
+    query: str,
+    backend: SearchBackend | None = None,
+    cache: SearchCache | None = None,
+) -> SearchResult:
+    backend = backend if backend is not None else _default_backend()
+    if not WEB_SEARCH_CACHE_ENABLED:
+        return run_search(backend, query)
+
+    cache = cache if cache is not None else _default_cache()
+    cached = cache.get(query)
+    if cached is not None:
+        return cached
+
+    result = run_search(backend, query)
+    if result.error:
+        logger.warning("web_search_failed query=%r error=%s", query, result.text)
+    cache.set(query, result)
+    return result
+
+
+def search_web(
+    query: str,
+    backend: SearchBackend | None = None,
+    cache: SearchCache | None = None,
+) -> str:
+    return search_web_result(query, backend=backend, cache=cache).text
+
+
+def is_useful_result(result: SearchResult) -> bool:
+    return not result.error and result.text.strip() not in ("", NO_RESULTS)
+
+
+# Warm corpora prefetched by running debates in this process, keyed by
+# debate id; the web_search tool consults them before searching live.
+_warm_corpora: dict[str, WarmSearchCorpus] = {}
+
+
+def register_warm_corpus(
+    debate_id: str,
+    snippets: dict[str, str],
+    min_overlap: float = SEARCH_PREFETCH_MATCH_THRESHOLD,
+) -> None:
+    _warm_corpora[debate_id] = WarmSearchCorpus(snippets, min_overlap)
+
+
+def discard_warm_corpus(debate_id: str) -> None:
+    _warm_corpora.pop(debate_id, None)
+
+
+def warm_search_result(debate_id: str | None, query: str) -> str | None:
+    corpus = _warm_corpora.get(debate_id) if debate_id else None
+    if corpus is None:
+        return None
+    result = corpus.lookup(query)
+    if result is not None:
+        _default_cache()._count(OUTCOME_WARM_HIT)
+    return result
+
+
+def get_search_cache_stats(client: redis.Redis | None = None) -> dict:
+    client = client if client is not None else redis_client
+    if _search_cache is not None:
+        _search_cache.flush_stats()
+    stats = client.hgetall(SEARCH_CACHE_STATS_KEY)
+    counts = {
+        outcome: int(stats.get(outcome, 0))
+        for outcome in (
+            OUTCOME_WARM_HIT,
+            OUTCOME_LOCAL_HIT,
+            OUTCOME_SHARED_HIT,
+            OUTCOME_MISS,
+            OUTCOME_ERROR,
+        )
+    }
+    lookups = counts[OUTCOME_LOCAL_HIT] + counts[OUTCOME_SHARED_HIT] + counts[OUTCOME_MISS]
+    hits = counts[OUTCOME_LOCAL_HIT] + counts[OUTCOME_SHARED_HIT]
+    return {
+        "enabled": WEB_SEARCH_CACHE_ENABLED,
+        **counts,
+        "hit_rate": hits / lookups if lookups else 0.0,
+    }
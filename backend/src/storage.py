@@ -4,7 +4,7 @@ from pathlib import Path
 
 from app.core.config import settings
 from app.helpers import debate_helpers
-from app.db.session import get_sqlite_database_path, reconfigure_database
+from app.db.session import get_sqlite_database_path, reconfigure_database, sqlite_pragmas
 from app.services import debate_service
 
 DB_PATH = get_sqlite_database_path() or (Path.cwd() / "data" / "debate.db")
@@ -30,10 +30,8 @@ def _connect() -> sqlite3.Connection:
         check_same_thread=False,
     )
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL;")
-    conn.execute("PRAGMA synchronous=NORMAL;")
-    conn.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS};")
-    conn.execute("PRAGMA foreign_keys=ON;")
+    for name, value in sqlite_pragmas():
+        conn.execute(f"PRAGMA {name}={value};")
     return conn
 
 
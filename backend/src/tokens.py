@@ -0,0 +1,14 @@
+"""Cheap prompt-size estimates.
+
+Exact tokenizers need model-specific vocabularies (tiktoken downloads its
+files on first use), so budgets here use the usual ~4 characters per token
+approximation. It is only used to size prompt pieces, never for billing.
+"""
+
+import math
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
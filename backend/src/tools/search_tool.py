@@ -1,8 +1,10 @@
-from typing import Type
+from typing import Any, Type
 
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
-from langchain_community.tools import DuckDuckGoSearchRun
+
+from src.events import current_debate_id
+from src.search_cache import search_web, warm_search_result
 
 
 class WebSearchInput(BaseModel):
@@ -15,10 +17,12 @@ class WebSearchTool(BaseTool):
     name: str = "web_search"
     description: str = "Search the web using DuckDuckGo for recent or factual context."
     args_schema: Type[BaseModel] = WebSearchInput
-    search: DuckDuckGoSearchRun = Field(default_factory=DuckDuckGoSearchRun)
+    # A SearchBackend; None uses the configured backend behind the shared cache.
+    backend: Any = Field(default=None, exclude=True)
 
     def _run(self, query: str) -> str:
-        try:
-            return self.search.run(query)
-        except Exception as exc:
-            return f"Error searching the web: {exc}"
+        # Topic searches prefetched at debate start answer most queries.
+        warm = warm_search_result(current_debate_id.get(), query)
+        if warm is not None:
+            return warm
+        return search_web(query, backend=self.backend)
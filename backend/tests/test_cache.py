@@ -1,8 +1,11 @@
+import asyncio
 import time
 import uuid
 from pathlib import Path
 import pytest
 import redis as redis_lib
+import redis.asyncio as redis_async
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 import api as api_module
@@ -33,7 +36,17 @@ def redis_client(monkeypatch):
     except Exception:
         pytest.skip("redis not available")
     client.flushdb()
+
+    def _async_client():
+        return redis_async.Redis(
+            host=cache.REDIS_HOST,
+            port=cache.REDIS_PORT,
+            db=15,
+            decode_responses=True,
+        )
+
     monkeypatch.setattr(cache, "redis_client", client)
+    monkeypatch.setattr(cache, "get_async_redis_client", _async_client)
     monkeypatch.setattr(api_module, "redis_client", client)
     return client
 
@@ -137,6 +150,34 @@ def test_lock_busy_with_inflight_returns_inflight(client, redis_client):
     assert _count_debates() == base_count
 
 
+@pytest.mark.usefixtures("no_flow")
+def test_failed_debate_creation_releases_the_claim(client, redis_client, monkeypatch):
+    from app.services import debate_service
+
+    create_debate = debate_service.create_debate
+    failures = [RuntimeError("database is locked")]
+
+    def _fail_once(**kwargs):
+        if failures:
+            raise failures.pop()
+        create_debate(**kwargs)
+
+    monkeypatch.setattr(debate_service, "create_debate", _fail_once)
+    base_count = _count_debates()
+    cache_key = cache.build_cache_key("Topic", "A", "B", "u1", "s1")
+
+    with pytest.raises(RuntimeError):
+        _post_debate(client, "Topic", "A", "B", "s1", "u1")
+
+    assert redis_client.get(cache.build_lock_key(cache_key)) is None
+    assert redis_client.get(cache.build_inflight_key(cache_key)) is None
+    assert _count_debates() == base_count
+
+    resp = _post_debate(client, "Topic", "A", "B", "s1", "u1")
+    assert resp.status_code == 200
+    assert resp.json()["cached"] is False
+
+
 @pytest.mark.usefixtures("no_flow")
 def test_lock_busy_without_inflight_returns_409(client, redis_client):
     base_count = _count_debates()
@@ -223,3 +264,85 @@ def test_cache_ttl_expires(client):
     resp2 = _post_debate(client, "Topic", "A", "B", "s1", "u1")
     assert resp2.status_code == 200
     assert resp2.json()["debate_id"] != "debate-777"
+
+
+def test_concurrent_claims_elect_one_generator(redis_client):
+    cache_key = cache.build_cache_key("Topic", "A", "B", "u1", "s1")
+    lock_key = cache.build_lock_key(cache_key)
+    inflight_key = cache.build_inflight_key(cache_key)
+
+    claims = [
+        cache.claim_or_join_generation(cache_key, lock_key, inflight_key, f"debate-{i}", 30)
+        for i in range(5)
+    ]
+
+    assert [claim.outcome for claim in claims] == [cache.CLAIM_ACQUIRED] + [cache.CLAIM_BUSY] * 4
+    assert claims[0].lock_token == redis_client.get(lock_key)
+    assert claims[0].debate_id == "debate-0"
+    # The claimant publishes its id only after the debate row exists.
+    assert redis_client.get(inflight_key) is None
+
+    cache.set_inflight_debate_id(inflight_key, "debate-0", 30)
+    joined = cache.claim_or_join_generation(cache_key, lock_key, inflight_key, "debate-5", 30)
+    assert (joined.outcome, joined.debate_id) == (cache.CLAIM_INFLIGHT, "debate-0")
+
+
+def test_claim_prefers_cached_debate(redis_client):
+    cache_key = cache.build_cache_key("Topic", "A", "B", "u1", "s1")
+    cache.set_cached_debate_id(cache_key, "debate-888", ttl_seconds=60)
+
+    claim = cache.claim_or_join_generation(
+        cache_key,
+        cache.build_lock_key(cache_key),
+        cache.build_inflight_key(cache_key),
+        "debate-new",
+        30,
+    )
+
+    assert claim.outcome == cache.CLAIM_CACHED
+    assert claim.debate_id == "debate-888"
+    assert claim.lock_token is None
+
+
+@pytest.mark.usefixtures("no_flow")
+def test_shared_cache_hit_gives_owner_a_copy_of_the_source(client, monkeypatch):
+    from app import debate_orchestration
+    from app.services import debate_service
+
+    monkeypatch.setattr(debate_orchestration, "SHARED_DEBATE_CACHE_ENABLED", True)
+    debate_service.create_debate("debate-src", "s1", "u1", "Topic", "A", "B")
+    debate_service.update_debate_summary("debate-src", "shared summary")
+    debate_service.update_debate_status("debate-src", "completed")
+    asyncio.run(cache.set_shared_debate_id_async(cache.build_shared_cache_key("Topic", "A", "B"), "debate-src"))
+
+    resp = _post_debate(client, " topic ", "a", "b", "s2", "u2")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["cached"] is True and data["shared"] is True
+    assert data["debate_id"] != "debate-src"
+
+    assert debate_orchestration.validate_stream_access(data["debate_id"], "s2", "u2") == "debate-src"
+    with pytest.raises(HTTPException):
+        debate_orchestration.validate_stream_access(data["debate_id"], "s1", "u1")
+    repeat = _post_debate(client, "Topic", "A", "B", "s2", "u2").json()
+    assert repeat == {"debate_id": data["debate_id"], "cached": True}
+    assert cache.get_shared_cache_stats()["hits"] == 1
+
+
+def test_shared_cache_evicts_least_recently_used(redis_client):
+    keys = [cache.build_shared_cache_key(f"Topic {i}", "A", "B") for i in range(3)]
+
+    async def scenario():
+        await cache.set_shared_debate_id_async(keys[0], "debate-0", 60, max_entries=2)
+        await asyncio.sleep(0.01)
+        await cache.set_shared_debate_id_async(keys[1], "debate-1", 60, max_entries=2)
+        await asyncio.sleep(0.01)
+        assert await cache.get_shared_debate_id_async(keys[0]) == "debate-0"
+        await asyncio.sleep(0.01)
+        return await cache.set_shared_debate_id_async(keys[2], "debate-2", 60, max_entries=2)
+
+    assert asyncio.run(scenario()) == 1
+    assert redis_client.get(keys[1]) is None
+    assert redis_client.get(keys[0]) == "debate-0"
+    stats = cache.get_shared_cache_stats()
+    assert (stats["entries"], stats["stores"], stats["evictions"]) == (2, 3, 1)
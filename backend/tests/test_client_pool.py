@@ -0,0 +1,70 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.client_pool import ClientPool, reset_crew_state, reset_llm_usage
+
+
+class FakeLLM:
+    def __init__(self):
+        self._token_usage = {"prompt_tokens": 0, "total_tokens": 0}
+
+
+def test_pool_reuses_instances_and_resets_usage():
+    pool = ClientPool(reset_llm_usage, max_idle=1)
+
+    with pool.lease("model", FakeLLM) as first:
+        first._token_usage["prompt_tokens"] = 120
+    with pool.lease("model", FakeLLM) as second, pool.lease("model", FakeLLM) as third:
+        assert second is first
+        assert second._token_usage["prompt_tokens"] == 0
+        assert third is not first
+    with pool.lease("other-model", FakeLLM) as other:
+        assert other is not first
+
+    assert (pool.created, pool.reused) == (3, 1)
+
+
+def test_failed_lease_is_not_returned_to_the_pool():
+    pool = ClientPool(reset_llm_usage)
+
+    with pytest.raises(RuntimeError):
+        with pool.lease("model", FakeLLM) as broken:
+            raise RuntimeError("provider error")
+    with pool.lease("model", FakeLLM) as fresh:
+        assert fresh is not broken
+
+
+def test_crew_reset_clears_the_agent_executor_conversation():
+    executor = SimpleNamespace(messages=[{"role": "user", "content": "previous turn"}], iterations=3)
+    crew = SimpleNamespace(agents=[SimpleNamespace(llm=FakeLLM(), agent_executor=executor)])
+
+    reset_crew_state(crew)
+
+    assert (executor.messages, executor.iterations) == ([], 0)
+
+
+def test_crew_retry_leases_a_fresh_crew(monkeypatch):
+    from src import flow
+
+    pool = ClientPool(lambda crew: None)
+    monkeypatch.setattr(flow, "lease_crew", lambda name: pool.lease(name, SimpleNamespace))
+    monkeypatch.setattr(flow, "DEBATE_RETRY_INITIAL_WAIT_SECONDS", 0.01)
+    monkeypatch.setattr(flow, "record_usage_from_response", lambda **kwargs: {})
+    leased = []
+
+    def kickoff(crew):
+        leased.append(crew)
+        if len(leased) == 1:
+            raise RuntimeError("503 service unavailable")
+        return "turn"
+
+    debate_flow = flow.DebateFlow(write_buffer=None)
+    response, _ = asyncio.run(
+        debate_flow._kickoff_crew("debater_1_crew", "model", kickoff, operation_name="pool_test_turn")
+    )
+
+    assert response == "turn"
+    assert leased[0] is not leased[1]
+    assert pool.created == 2
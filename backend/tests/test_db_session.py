@@ -0,0 +1,49 @@
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+import app.db.session as db_session
+import src.storage as storage
+
+
+@pytest.fixture()
+def test_db(monkeypatch):
+    db_root = Path("data") / "test-dbs"
+    db_root.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(storage, "DB_PATH", db_root / f"debate-{uuid.uuid4().hex}.db")
+    storage.init_db()
+
+
+@pytest.mark.usefixtures("test_db")
+def test_sqlite_engine_applies_pragmas():
+    with db_session.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+        assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2
+        assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+
+
+@pytest.mark.usefixtures("test_db")
+def test_read_engine_is_separate_and_read_only():
+    assert db_session.read_engine is not db_session.engine
+    with db_session.read_session_scope() as db:
+        assert db.execute(text("SELECT count(*) FROM debates")).scalar() == 0
+        with pytest.raises(OperationalError):
+            db.execute(text("DELETE FROM debates"))
+
+
+@pytest.mark.usefixtures("test_db")
+def test_init_drops_superseded_debate_indexes():
+    with db_session.engine.begin() as conn:
+        conn.exec_driver_sql("CREATE INDEX idx_debates_session_id ON debates (session_id)")
+        conn.exec_driver_sql("CREATE INDEX idx_debates_user_id ON debates (user_id)")
+
+    storage.init_db()
+
+    with db_session.engine.connect() as conn:
+        names = {row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert not names & {"idx_debates_session_id", "idx_debates_user_id"}
+    assert "idx_debates_session_user_created" in names
@@ -0,0 +1,84 @@
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+
+import src.storage as storage
+from app import debate_queries
+from app.db.models import DebateRecord
+from app.db.session import read_session_scope, session_scope
+from app.services import debate_service
+from app.services.debate_service import DebateWriteBuffer
+
+
+@pytest.fixture()
+def test_db(monkeypatch):
+    db_root = Path("data") / "test-dbs"
+    db_root.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(storage, "DB_PATH", db_root / f"debate-{uuid.uuid4().hex}.db")
+    storage.init_db()
+
+
+def _seed(session_id: str, count: int) -> None:
+    for index in range(count):
+        debate_id = f"debate-{index:02d}"
+        debate_service.create_debate(debate_id, session_id, None, "Topic", "A", "B")
+        writes = DebateWriteBuffer(debate_id, flush_interval_seconds=0)
+        writes.record_llm_call("test/model", input_tokens=10, output_tokens=5, cost_usd=0.001)
+        writes.update_summary("a long summary")
+        writes.flush()
+    with session_scope() as db:
+        # Pairs share a timestamp so the debate_id tie-break is exercised.
+        for index in range(count):
+            db.query(DebateRecord).filter(DebateRecord.debate_id == f"debate-{index:02d}").update(
+                {DebateRecord.created_at: 1_000 + index // 2}
+            )
+
+
+def test_keyset_pages_cover_every_debate_once_in_order(test_db) -> None:
+    _seed("session-pages", 7)
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page = debate_queries.get_debates("session-pages", None, limit=3, cursor=cursor)
+        assert len(page["debates"]) <= 3
+        seen.extend(item["debate_id"] for item in page["debates"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [f"debate-{index:02d}" for index in reversed(range(7))]
+
+
+def test_fields_projection_omits_summary_and_cost_breakdown(test_db, monkeypatch) -> None:
+    _seed("session-fields", 2)
+    monkeypatch.setattr(
+        debate_service,
+        "get_cost_breakdown_for_debates",
+        lambda _ids: pytest.fail("cost breakdown should not be queried"),
+    )
+
+    page = debate_queries.get_debates("session-fields", None, fields="debate_id,topic,status")
+
+    assert [set(item) for item in page["debates"]] == [{"debate_id", "topic", "status"}] * 2
+    with pytest.raises(HTTPException):
+        debate_queries.get_debates("session-fields", None, fields="debate_id,secret")
+    with pytest.raises(HTTPException):
+        debate_queries.get_debates("session-fields", None, cursor="not-a-cursor")
+
+
+def test_owner_page_query_uses_composite_index(test_db) -> None:
+    with read_session_scope() as db:
+        plan = db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT debate_id FROM debates "
+                "WHERE session_id = :session_id AND user_id IS NULL "
+                "ORDER BY created_at DESC, debate_id DESC LIMIT 10"
+            ),
+            {"session_id": "session-plan"},
+        ).all()
+
+    assert any("idx_debates_session_user_created" in row[-1] for row in plan)
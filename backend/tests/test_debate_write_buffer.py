@@ -0,0 +1,113 @@
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+import app.db.session as db_session
+import src.storage as storage
+from app.db.models import DebateMetric, DebateRecord, DebateUsageCall
+from app.db.session import session_scope
+from app.services import debate_service
+from app.services.debate_service import DebateWriteBuffer
+
+
+@pytest.fixture()
+def test_db(monkeypatch):
+    db_root = Path("data") / "test-dbs"
+    db_root.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(storage, "DB_PATH", db_root / f"debate-{uuid.uuid4().hex}.db")
+    storage.init_db()
+
+
+def _commit_counter() -> list[int]:
+    commits = [0]
+
+    def _on_commit(_conn):
+        commits[0] += 1
+
+    event.listen(db_session.engine, "commit", _on_commit)
+    return commits
+
+
+@pytest.mark.usefixtures("test_db")
+def test_write_buffer_flushes_step_in_one_transaction():
+    debate_service.create_debate("d1", "s1", None, "Topic", "A", "B")
+    writes = DebateWriteBuffer("d1", flush_interval_seconds=3600)
+
+    writes.record_llm_call("m1", input_tokens=10, output_tokens=5, cost_usd=0.1)
+    writes.record_llm_call("m2", input_tokens=20, output_tokens=5, cost_usd=0.2)
+    writes.update_metrics(tokens_delta=40, cost_delta=0.3)
+    writes.update_summary("summary")
+    writes.flush_if_due()
+
+    with session_scope() as db:
+        assert db.query(DebateUsageCall).count() == 0
+
+    writes.update_status("completed")
+    writes.finalize_duration()
+    commits = _commit_counter()
+    writes.flush()
+    writes.flush()
+
+    assert commits[0] == 1
+    with session_scope() as db:
+        assert db.query(DebateUsageCall).filter_by(debate_id="d1").count() == 2
+        metric = db.get(DebateMetric, "d1")
+        assert metric.total_tokens == 40
+        assert metric.total_cost_usd == pytest.approx(0.3)
+        assert metric.duration_seconds is not None
+        debate = db.get(DebateRecord, "d1")
+        assert debate.status == "completed"
+        assert debate.summary == "summary"
+        assert debate.completed_at is not None
+
+
+@pytest.mark.usefixtures("test_db")
+def test_write_buffer_records_failure():
+    debate_service.create_debate("d2", "s1", None, "Topic", "A", "B")
+    writes = DebateWriteBuffer("d2", flush_interval_seconds=0)
+
+    writes.update_status("failed", error_message="boom")
+    writes.finalize_duration()
+    writes.flush_if_due()
+
+    with session_scope() as db:
+        debate = db.get(DebateRecord, "d2")
+        assert debate.status == "failed"
+        assert debate.error_message == "boom"
+        assert db.get(DebateMetric, "d2").duration_seconds is not None
+
+
+@pytest.mark.usefixtures("test_db")
+def test_write_buffer_keeps_rows_when_commit_fails(monkeypatch):
+    debate_service.create_debate("d3", "s1", None, "Topic", "A", "B")
+    writes = DebateWriteBuffer("d3", flush_interval_seconds=3600)
+    writes.record_llm_call("m1", input_tokens=10, output_tokens=5, cost_usd=0.1)
+    writes.update_metrics(tokens_delta=15, cost_delta=0.1)
+    writes.update_status("completed")
+
+    apply_status = debate_service._apply_debate_status
+
+    def _fail(*args, **kwargs):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(debate_service, "_apply_debate_status", _fail)
+    with pytest.raises(RuntimeError):
+        writes.flush()
+    assert writes.pending
+
+    writes.record_llm_call("m2", input_tokens=20, output_tokens=5, cost_usd=0.2)
+    writes.update_metrics(tokens_delta=25, cost_delta=0.2)
+    monkeypatch.setattr(debate_service, "_apply_debate_status", apply_status)
+    writes.flush()
+
+    assert not writes.pending
+    with session_scope() as db:
+        calls = db.query(DebateUsageCall).filter_by(debate_id="d3").order_by(DebateUsageCall.id)
+        models = [call.model for call in calls]
+        assert models == ["m1", "m2"]
+        metric = db.get(DebateMetric, "d3")
+        assert metric.total_tokens == 40
+        assert metric.total_cost_usd == pytest.approx(0.3)
+        assert db.get(DebateRecord, "d3").status == "completed"
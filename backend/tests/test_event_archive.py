@@ -0,0 +1,73 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+import redis as redis_lib
+
+import app.cache as cache
+import src.event_archive as event_archive
+from app import debate_orchestration
+
+
+@pytest.fixture()
+def redis_client(monkeypatch, tmp_path):
+    client = redis_lib.Redis(
+        host=cache.EVENTS_REDIS_HOST,
+        port=cache.EVENTS_REDIS_PORT,
+        db=15,
+        decode_responses=True,
+    )
+    try:
+        client.ping()
+    except Exception:
+        pytest.skip("redis not available")
+    client.flushdb()
+    monkeypatch.setattr(event_archive, "events_redis_client", client)
+    monkeypatch.setattr(event_archive, "ARCHIVE_DIR", tmp_path / "debate_events")
+    return client
+
+
+def _publish(client, debate_id: str, event: str, output: str) -> str:
+    return client.xadd(
+        f"debate:{debate_id}",
+        {"event": event, "data": json.dumps({"agent": "system", "output": output})},
+    )
+
+
+def test_archive_round_trip_expires_stream(redis_client):
+    debate_id = uuid.uuid4().hex
+    ids = [
+        _publish(redis_client, debate_id, "intro_done", '{"text": "hello"}'),
+        _publish(redis_client, debate_id, "debate_completed", "debate completed"),
+    ]
+
+    assert event_archive.archive_debate_events(debate_id, ttl_seconds=60) == 2
+
+    assert 0 < redis_client.ttl(f"debate:{debate_id}") <= 60
+    archived = event_archive.load_archived_events(debate_id)
+    assert [entry["id"] for entry in archived] == ids
+    assert [entry["event"] for entry in archived] == ["intro_done", "debate_completed"]
+    assert event_archive.load_archived_events("missing") is None
+
+
+def test_archived_debates_replay_without_redis(redis_client, monkeypatch):
+    debate_id = uuid.uuid4().hex
+    _publish(redis_client, debate_id, "intro_done", '{"text": "hello"}')
+    _publish(redis_client, debate_id, "debate_completed", "debate completed")
+    event_archive.archive_debate_events(debate_id)
+    redis_client.delete(f"debate:{debate_id}")
+
+    def _no_hub(_debate_id):
+        raise AssertionError("archived debates must not subscribe to Redis")
+
+    monkeypatch.setattr(debate_orchestration, "EVENT_ARCHIVE_ENABLED", True)
+    monkeypatch.setattr(debate_orchestration.event_hub, "subscribe", _no_hub)
+
+    async def collect():
+        return [event async for event in debate_orchestration.stream_debate_events(debate_id)]
+
+    events = asyncio.run(collect())
+
+    assert [event["event"] for event in events] == ["intro_done", "debate_completed"]
+    assert json.loads(events[0]["data"]) == {"agent": "system", "text": "hello"}
@@ -0,0 +1,307 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+import redis as redis_lib
+import redis.asyncio as redis_async
+
+import app.cache as cache
+from app.event_hub import (
+    STREAM_ENTRY_FORMAT,
+    DebateEventHub,
+    SubscriptionClosed,
+    format_stream_event,
+    normalize_event_data,
+    turn_delta_stream,
+)
+
+
+@pytest.fixture()
+def redis_client():
+    client = redis_lib.Redis(
+        host=cache.EVENTS_REDIS_HOST,
+        port=cache.EVENTS_REDIS_PORT,
+        db=15,
+        decode_responses=True,
+    )
+    try:
+        client.ping()
+    except Exception:
+        pytest.skip("redis not available")
+    client.flushdb()
+    return client
+
+
+def _client_factory():
+    return redis_async.Redis(
+        host=cache.EVENTS_REDIS_HOST,
+        port=cache.EVENTS_REDIS_PORT,
+        db=15,
+        decode_responses=True,
+    )
+
+
+def _publish(client, debate_id: str, index: int) -> None:
+    client.xadd(
+        f"debate:{debate_id}",
+        {
+            "event": "agent_done",
+            "data": json.dumps({"agent": " debater ", "output": json.dumps({"n": index})}),
+        },
+    )
+
+
+async def _collect(subscription, count: int) -> list[dict]:
+    events = list(subscription.backlog)
+    while len(events) < count:
+        event = await subscription.next_event(timeout_seconds=2)
+        assert event is not None
+        events.append(event)
+    return events
+
+
+def test_subscribers_share_one_reader(redis_client):
+    debate_id = uuid.uuid4().hex
+
+    async def scenario():
+        hub = DebateEventHub(client_factory=_client_factory, block_ms=50)
+        first = hub.subscribe(debate_id)
+        second = hub.subscribe(debate_id)
+        assert hub.metrics()["streams"] == 1
+        assert hub.metrics()["subscribers"] == 2
+
+        for index in range(3):
+            _publish(redis_client, debate_id, index)
+
+        first_events, second_events = await asyncio.gather(
+            _collect(first, 3),
+            _collect(second, 3),
+        )
+        await hub.close()
+        return first_events, second_events
+
+    first_events, second_events = asyncio.run(scenario())
+    assert first_events == second_events
+    assert [json.loads(event["data"]) for event in first_events] == [
+        {"agent": "debater", "n": index} for index in range(3)
+    ]
+
+
+def test_late_subscriber_receives_backlog(redis_client):
+    debate_id = uuid.uuid4().hex
+
+    async def scenario():
+        hub = DebateEventHub(client_factory=_client_factory, block_ms=50)
+        early = hub.subscribe(debate_id)
+        for index in range(2):
+            _publish(redis_client, debate_id, index)
+        await _collect(early, 2)
+
+        late = hub.subscribe(debate_id)
+        backlog = list(late.backlog)
+        hub.unsubscribe(early)
+        hub.unsubscribe(late)
+        remaining = hub.metrics()["streams"]
+        await hub.close()
+        return backlog, remaining
+
+    backlog, remaining = asyncio.run(scenario())
+    assert len(backlog) == 2
+    assert remaining == 0
+
+
+def test_malformed_entry_is_skipped(redis_client):
+    debate_id = uuid.uuid4().hex
+
+    async def scenario():
+        hub = DebateEventHub(client_factory=_client_factory, block_ms=50)
+        subscription = hub.subscribe(debate_id)
+        _publish(redis_client, debate_id, 0)
+        redis_client.xadd(f"debate:{debate_id}", {"event": "agent_done", "data": "{not json"})
+        _publish(redis_client, debate_id, 1)
+        events = await _collect(subscription, 2)
+        await hub.close()
+        return events
+
+    events = asyncio.run(scenario())
+    assert [json.loads(event["data"])["n"] for event in events] == [0, 1]
+
+
+def test_turn_deltas_are_read_from_their_own_stream(redis_client):
+    debate_id = uuid.uuid4().hex
+
+    def _publish_delta(delta: str) -> None:
+        redis_client.xadd(
+            turn_delta_stream(debate_id),
+            {
+                "event": "turn_delta",
+                "data": json.dumps({"agent": "A", "turn_id": "t1", "seq": 0, "delta": delta}),
+                "format": STREAM_ENTRY_FORMAT,
+            },
+        )
+
+    async def scenario():
+        hub = DebateEventHub(client_factory=_client_factory, block_ms=50)
+        early = hub.subscribe(debate_id)
+        _publish_delta("Hel")
+        live = await _collect(early, 1)
+        late_backlog = list(hub.subscribe(debate_id).backlog)
+
+        redis_client.xadd(
+            f"debate:{debate_id}",
+            {
+                "event": "turn_done",
+                "data": json.dumps({"agent": "A", "turn_id": "t1"}),
+                "format": STREAM_ENTRY_FORMAT,
+            },
+        )
+        await _collect(early, 1)
+        after_turn_backlog = list(hub.subscribe(debate_id).backlog)
+        await hub.close()
+        return live, late_backlog, after_turn_backlog
+
+    live, late_backlog, after_turn_backlog = asyncio.run(scenario())
+    assert live[0]["event"] == "turn_delta"
+    assert "id" not in live[0]
+    assert late_backlog == live
+    assert [event["event"] for event in after_turn_backlog] == ["turn_done"]
+    assert redis_client.xlen(f"debate:{debate_id}") == 1
+
+
+def test_slow_consumer_drop_policy_keeps_newest(redis_client):
+    debate_id = uuid.uuid4().hex
+
+    async def scenario():
+        hub = DebateEventHub(
+            client_factory=_client_factory,
+            queue_size=2,
+            slow_consumer_policy="drop",
+            read_count=10,
+            block_ms=50,
+        )
+        subscription = hub.subscribe(debate_id)
+        for index in range(5):
+            _publish(redis_client, debate_id, index)
+        while hub.metrics()["dropped_events_total"] < 3:
+            await asyncio.sleep(0.01)
+        events = await _collect(subscription, 2)
+        await hub.close()
+        return subscription, events
+
+    subscription, events = asyncio.run(scenario())
+    assert subscription.dropped_events == 3
+    assert [json.loads(event["data"])["n"] for event in events] == [3, 4]
+
+
+def test_slow_consumer_disconnect_policy_closes_subscription(redis_client):
+    debate_id = uuid.uuid4().hex
+
+    async def scenario():
+        hub = DebateEventHub(
+            client_factory=_client_factory,
+            queue_size=1,
+            slow_consumer_policy="disconnect",
+            read_count=10,
+            block_ms=50,
+        )
+        subscription = hub.subscribe(debate_id)
+        for index in range(3):
+            _publish(redis_client, debate_id, index)
+        while hub.metrics()["disconnected_subscribers_total"] < 1:
+            await asyncio.sleep(0.01)
+        with pytest.raises(SubscriptionClosed):
+            await subscription.next_event(timeout_seconds=1)
+        metrics = hub.metrics()
+        await hub.close()
+        return metrics
+
+    metrics = asyncio.run(scenario())
+    assert metrics["subscribers"] == 0
+
+
+def test_normalized_entries_pass_through_and_match_legacy_format():
+    verdict = 'Verdict:\n```json\n{"winner": "A", "score": 7}\n```'
+    normalized = normalize_event_data({"agent": " judge ", "output": verdict})
+    legacy_fields = {
+        "event": "judge_verdict_done",
+        "data": json.dumps({"agent": " judge ", "output": verdict}),
+    }
+    current_fields = {
+        "event": "judge_verdict_done",
+        "data": normalized,
+        "format": STREAM_ENTRY_FORMAT,
+    }
+
+    assert json.loads(normalized) == {"agent": "judge", "winner": "A", "score": 7}
+    assert format_stream_event(current_fields) == format_stream_event(legacy_fields)
+    assert format_stream_event(current_fields)["data"] is normalized
+    assert json.loads(normalize_event_data({"agent": "system", "output": "done {"})) == {
+        "agent": "system",
+        "text": "done {",
+    }
+
+
+def test_reader_grows_batches_while_behind(redis_client):
+    debate_id = uuid.uuid4().hex
+    for index in range(60):
+        _publish(redis_client, debate_id, index)
+    reads = {"count": 0}
+
+    def counting_factory():
+        client = _client_factory()
+        xread = client.xread
+
+        async def counted_xread(*args, **kwargs):
+            reads["count"] += 1
+            return await xread(*args, **kwargs)
+
+        client.xread = counted_xread
+        return client
+
+    async def scenario():
+        hub = DebateEventHub(
+            client_factory=counting_factory,
+            read_count=1,
+            max_read_count=64,
+            block_ms=50,
+        )
+        events = await _collect(hub.subscribe(debate_id), 60)
+        await hub.close()
+        return events
+
+    events = asyncio.run(scenario())
+    assert [json.loads(event["data"])["n"] for event in events] == list(range(60))
+    assert reads["count"] <= 8
+
+
+def test_stream_resumes_after_last_event_id_and_closes_on_completion(redis_client, monkeypatch):
+    from app import debate_orchestration
+
+    debate_id = uuid.uuid4().hex
+    for index in range(3):
+        _publish(redis_client, debate_id, index)
+    redis_client.xadd(
+        f"debate:{debate_id}",
+        {"event": "debate_completed", "data": json.dumps({"agent": "system", "output": "done"})},
+    )
+    ids = [entry_id for entry_id, _ in redis_client.xrange(f"debate:{debate_id}")]
+    monkeypatch.setattr(debate_orchestration, "EVENT_ARCHIVE_ENABLED", False)
+    monkeypatch.setattr(debate_orchestration, "get_async_events_redis_client", _client_factory)
+
+    async def scenario():
+        hub = DebateEventHub(client_factory=_client_factory, block_ms=50)
+        monkeypatch.setattr(debate_orchestration, "event_hub", hub)
+        resumed = [
+            event
+            async for event in debate_orchestration.stream_debate_events(debate_id, last_event_id=ids[0])
+        ]
+        finished = await debate_orchestration.has_unsent_events(debate_id, ids[-1])
+        pending = await debate_orchestration.has_unsent_events(debate_id, ids[1])
+        await hub.close()
+        return resumed, finished, pending
+
+    resumed, finished, pending = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    assert [event["id"] for event in resumed] == ids[1:]
+    assert resumed[-1]["event"] == "debate_completed"
+    assert (finished, pending) == (False, True)
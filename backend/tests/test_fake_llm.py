@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from src.fake_llm import FakeLLM
+from src.retry_utils import is_rate_limit_error, is_retriable_error
+from src.schemas import DebateStrategistVerdict, DebateTurn, LogicalAnalystVerdict, PersuasionVerdict
+from src.search_backends import build_search_backend
+
+TURN_PROMPT = [
+    {"role": "system", "content": "Tool Name: web_search\nTool Arguments: {'query': str}"},
+    {"role": "user", "content": 'You are participating in a live debate on "Ban cars downtown" against Greta.'},
+]
+JUDGE_PROMPT = [
+    {"role": "system", "content": "The topic is Ban cars downtown. The debaters are Elon Musk and Greta Thunberg."},
+    {"role": "user", "content": "Judge the transcript."},
+]
+
+
+def _final_answer(response: str) -> str:
+    return response.split("Final Answer:", 1)[1]
+
+
+def test_debater_searches_once_then_returns_a_valid_turn():
+    llm = FakeLLM(model="fake/debater", latency_seconds=0)
+
+    first = llm.call(TURN_PROMPT, response_model=DebateTurn)
+    assert "Action: web_search" in first
+    assert json.loads(first.split("Action Input:", 1)[1]) == {"query": "Ban cars downtown"}
+
+    answered = TURN_PROMPT + [{"role": "assistant", "content": first + "\nObservation: some facts"}]
+    turn = DebateTurn.model_validate_json(_final_answer(llm.call(answered, response_model=DebateTurn)))
+    assert "Ban cars downtown" in turn.argument.text
+    assert llm.get_token_usage_summary().successful_requests == 2
+
+
+@pytest.mark.parametrize("verdict", [LogicalAnalystVerdict, DebateStrategistVerdict, PersuasionVerdict])
+def test_judge_verdicts_match_their_schema(verdict):
+    llm = FakeLLM(model="fake/judge", latency_seconds=0, prompt_tokens=900, completion_tokens=120)
+
+    parsed = verdict.model_validate_json(_final_answer(llm.call(JUDGE_PROMPT, response_model=verdict)))
+
+    assert parsed.winner in ("Elon Musk", "Greta Thunberg")
+    usage = llm.get_token_usage_summary()
+    assert (usage.prompt_tokens, usage.completion_tokens) == (900, 120)
+
+
+def test_output_is_deterministic_per_seed():
+    responses = [
+        FakeLLM(model="fake/judge", latency_seconds=0, seed=seed).call(JUDGE_PROMPT, response_model=PersuasionVerdict)
+        for seed in (1, 1, 2)
+    ]
+    assert responses[0] == responses[1] != responses[2]
+
+
+def test_injected_failures_are_classified_for_retries():
+    with pytest.raises(Exception) as rate_limited:
+        FakeLLM(model="fake/presenter", latency_seconds=0, rate_limit_rate=1).call("Introduce the debate.")
+    with pytest.raises(Exception) as unavailable:
+        FakeLLM(model="fake/presenter", latency_seconds=0, failure_rate=1).call("Introduce the debate.")
+
+    assert is_rate_limit_error(rate_limited.value)
+    assert not is_rate_limit_error(unavailable.value)
+    assert is_retriable_error(unavailable.value)
+
+
+def test_fake_search_backend_answers_every_query():
+    backend = build_search_backend("fake")
+
+    assert "ban cars downtown" in backend.search("Ban cars downtown?")
+    assert backend.calls == 1
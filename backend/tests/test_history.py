@@ -0,0 +1,73 @@
+from src.helpers import history_as_text
+from src.history import CONDENSED_HEADER, DebateHistory
+from src.tokens import estimate_tokens
+from src.schemas import DebateTurn, TurnArgument
+
+
+def _turn(index: int) -> DebateTurn:
+    return DebateTurn(
+        turn_id=f"turn-{index}",
+        debater="A" if index % 2 else "B",
+        argument=TurnArgument(
+            type="attack",
+            text=f"Claim number {index} stands. " + "Supporting detail goes on at length. " * 20,
+            confidence=60,
+        ),
+    )
+
+
+def test_history_within_budget_is_the_full_transcript():
+    turns = [_turn(i) for i in range(1, 4)]
+    history = DebateHistory()
+    for turn in turns:
+        history.append(turn)
+
+    assert history.render(token_budget=None) == history_as_text(turns)
+    assert history.render(token_budget=100_000) == history_as_text(turns)
+    assert history.tokens_saved == 0
+    assert DebateHistory().render(token_budget=10) == history_as_text([])
+
+
+def test_history_over_budget_condenses_older_turns():
+    turns = [_turn(i) for i in range(1, 7)]
+    history = DebateHistory()
+    for turn in turns:
+        history.append(turn)
+    full = history_as_text(turns)
+
+    rendered = history.render(token_budget=500, recent_turns=2)
+
+    assert rendered.startswith(CONDENSED_HEADER)
+    assert "- Round 1 -- A (attack): Claim number 1 stands." in rendered
+    assert rendered.endswith(full.split("\n\n", 4)[-1])
+    assert "Supporting detail" not in rendered.split("\n\n")[0]
+    condensed_section = rendered.split("\n\n")[0]
+    saved = sum(history.verbatim_tokens[:4]) - estimate_tokens(condensed_section)
+    assert saved > 0
+    assert history.tokens_saved == saved
+    # Saved tokens describe the cached condensed section, not each render.
+    assert history.render(token_budget=500, recent_turns=2) == rendered
+    assert history.tokens_saved == saved
+
+    tight = history.render(token_budget=1, recent_turns=1)
+    assert "(5 earlier turns omitted)" in tight
+    assert tight.endswith(full.split("\n\n")[-1])
+
+
+def test_condensed_history_prefix_stays_byte_stable():
+    history = DebateHistory()
+    prompts = []
+    for index in range(1, 11):
+        history.append(_turn(index))
+        prompts.append(history.render(token_budget=700, recent_turns=2))
+
+    # Turns are condensed a whole round at a time, and the condensed section
+    # only ever grows at its end, so it stays a prefix of later prompts.
+    boundaries = {prompt.count("\n- Round ") for prompt in prompts}
+    assert boundaries <= {0, 2, 4, 6, 8}
+    for earlier, later in zip(prompts, prompts[1:]):
+        earlier_condensed = earlier.split("\n\n")[0]
+        if earlier_condensed.startswith(CONDENSED_HEADER):
+            assert later.startswith(earlier_condensed)
+        if earlier_condensed == later.split("\n\n")[0]:
+            assert later.startswith(earlier)
@@ -0,0 +1,92 @@
+import asyncio
+import random
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src import flow
+from src.fake_llm import fake_verdict
+from src.helpers import majority_winner
+from src.schemas import DebateStrategistVerdict, LogicalAnalystVerdict, PersuasionVerdict
+
+JUDGE_CREWS = {
+    "logical_analyst_crew": (LogicalAnalystVerdict, "A", 11),
+    "debate_strategist_crew": (DebateStrategistVerdict, "B", 22),
+    "persuasion_crew": (PersuasionVerdict, "A", 33),
+}
+
+
+@pytest.fixture()
+def judge_flow(monkeypatch):
+    """A DebateFlow whose judge crews are stubs that only finish once all
+    three are running at the same time."""
+    started = threading.Barrier(len(JUDGE_CREWS), timeout=5)
+    published = []
+
+    @contextmanager
+    def lease_crew(name):
+        verdict_model, winner, tokens = JUDGE_CREWS[name]
+
+        def kickoff(inputs):
+            started.wait()
+            verdict = verdict_model.model_validate(
+                {**fake_verdict(verdict_model, ("A", "B"), random.Random(0)), "winner": winner}
+            )
+            return SimpleNamespace(pydantic=verdict, usage={"total_tokens": tokens})
+
+        yield SimpleNamespace(kickoff=kickoff)
+
+    async def publish_async(debate_id, event, data):
+        published.append((event, data))
+
+    monkeypatch.setattr(flow, "JUDGE_PARALLEL_ENABLED", True)
+    monkeypatch.setattr(flow, "JUDGE_DELAY_SECONDS", 0)
+    monkeypatch.setattr(flow, "lease_crew", lease_crew)
+    monkeypatch.setattr(flow, "publish_async", publish_async)
+    monkeypatch.setattr(flow, "record_usage_from_response", lambda **kwargs: kwargs["response"].usage)
+
+    debate_flow = flow.DebateFlow(write_buffer=SimpleNamespace(flush_if_due=lambda: None))
+    debate_flow.state.debater_1 = "A"
+    debate_flow.state.debater_2 = "B"
+    return debate_flow, published
+
+
+def test_judges_run_concurrently_and_report_separately(judge_flow):
+    debate_flow, published = judge_flow
+
+    asyncio.run(debate_flow.judge_debate())
+
+    assert debate_flow._usage_by_judge == {
+        "logical_analyst": {"total_tokens": 11},
+        "debate_strategist": {"total_tokens": 22},
+        "persuasion": {"total_tokens": 33},
+    }
+    verdict_events = {data["agent"]: data["output"] for event, data in published if event == "judge_verdict_done"}
+    assert set(verdict_events) == {"logical_analyst", "debate_strategist", "persuasion"}
+    assert verdict_events["persuasion"]["judge"] == "Elena Marquez"
+    assert verdict_events["persuasion"]["usage"] == {"total_tokens": 33}
+    assert debate_flow.state.winner == "A"
+    assert len(debate_flow.state.judge_verdicts.splitlines()) == 3
+
+
+@pytest.mark.parametrize(
+    ("winners", "expected"),
+    [
+        (["A", "B", "A"], "A"),
+        ([" B ", "B", "A"], "B"),
+        (["A", "B"], ""),
+        (["A", "B", ""], ""),
+        (["A", "  ", None], "A"),
+        ([], ""),
+    ],
+)
+def test_majority_winner(winners, expected):
+    verdicts = [SimpleNamespace(winner=winner) for winner in winners]
+    assert majority_winner(verdicts) == expected
+
+
+def test_majority_winner_ignores_malformed_verdicts():
+    verdicts = [None, SimpleNamespace(), "B", SimpleNamespace(winner="A")]
+    assert majority_winner(verdicts) == "A"
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from app.metrics import instrument_engine, observe_flow_step, statement_kind
+from src.retry_utils import call_with_retry_async
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_statement_kind():
+    assert statement_kind("  select 1") == "select"
+    assert statement_kind("INSERT INTO t VALUES (1)") == "insert"
+    assert statement_kind("CREATE TABLE t (x)") == "other"
+
+
+def test_instrumented_engine_times_statements_by_kind():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test")
+    before = _sample("debate_sql_statement_seconds_count", engine="test", statement="select")
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 2"))
+
+    assert _sample("debate_sql_statement_seconds_count", engine="test", statement="select") == before + 2
+
+
+def test_flow_step_outcomes_are_labelled():
+    @observe_flow_step
+    async def metrics_test_step():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(metrics_test_step())
+
+    assert _sample("debate_flow_step_seconds_count", step="metrics_test_step", outcome="error") == 1
+
+
+def test_retries_and_backoff_are_counted():
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("429 Too Many Requests")
+        if len(attempts) == 2:
+            raise RuntimeError("503 service unavailable")
+        return "ok"
+
+    result = asyncio.run(
+        call_with_retry_async(
+            operation=flaky,
+            operation_name="metrics_test_call",
+            max_attempts=3,
+            initial_wait_seconds=0.01,
+            max_wait_seconds=0.02,
+        )
+    )
+
+    assert result == "ok"
+    assert _sample("debate_model_call_retries_total", operation="metrics_test_call", reason="rate_limit") == 1
+    assert _sample("debate_model_call_retries_total", operation="metrics_test_call", reason="transient") == 1
+    assert _sample("debate_model_call_backoff_seconds_total", operation="metrics_test_call") > 0
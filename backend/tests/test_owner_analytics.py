@@ -0,0 +1,77 @@
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+import src.helpers as helpers
+import src.storage as storage
+from app.db.models import DebateRecord, OwnerAnalytics
+from app.db.owner_analytics import rebuild_owner_analytics
+from app.db.session import session_scope
+from app.helpers import debate_helpers
+from app.services import debate_service
+
+
+@pytest.fixture()
+def test_db(monkeypatch, tmp_path):
+    db_root = Path("data") / "test-dbs"
+    db_root.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(storage, "DB_PATH", db_root / f"debate-{uuid.uuid4().hex}.db")
+    storage.init_db()
+    monkeypatch.setattr(helpers, "OUTPUT_DIR", tmp_path / "debate_turns")
+
+
+def _run_debate(debate_id: str, session_id: str, user_id: str | None, tokens: int) -> None:
+    debate_service.create_debate(debate_id, session_id, user_id, "Topic", "A", "B")
+    debate_service.update_debate_metrics(debate_id, tokens_delta=tokens, cost_delta=tokens / 1000)
+    debate_service.update_debate_status(debate_id, "completed")
+    debate_service.finalize_debate_duration(debate_id)
+
+
+def _snapshot() -> dict[str, tuple]:
+    with session_scope() as db:
+        return {
+            row.owner_key: (
+                row.debate_count,
+                row.total_tokens,
+                round(row.total_cost_usd, 6),
+                row.total_duration_seconds,
+            )
+            for row in db.query(OwnerAnalytics)
+        }
+
+
+@pytest.mark.usefixtures("test_db")
+def test_rollup_tracks_writes_and_matches_rebuild():
+    _run_debate("u1", "s1", "user-1", 100)
+    _run_debate("u2", "s2", "user-1", 50)
+    _run_debate("a1", "s1", None, 10)
+    debate_service.create_debate("running", "s1", None, "Topic", "A", "B")
+
+    assert debate_service.get_debate_analytics_totals("s9", "user-1") == {
+        "debate_count": 2,
+        "total_tokens": 150,
+        "total_cost_usd": pytest.approx(0.15),
+        "total_duration_seconds": 0,
+    }
+    assert debate_service.get_debate_analytics_totals("s1", None)["debate_count"] == 2
+    assert debate_service.get_debate_analytics_totals("unknown", None) is None
+
+    incremental = _snapshot()
+    assert rebuild_owner_analytics() == 2
+    assert _snapshot() == incremental
+
+
+@pytest.mark.usefixtures("test_db")
+def test_retention_purge_subtracts_from_rollup():
+    _run_debate("old", "s1", "user-1", 100)
+    _run_debate("fresh", "s1", "user-1", 40)
+    with session_scope() as db:
+        db.get(DebateRecord, "old").created_at = int(time.time()) - 30 * 24 * 60 * 60
+
+    debate_helpers.purge_old_debates()
+
+    totals = debate_service.get_debate_analytics_totals("s1", "user-1")
+    assert totals["debate_count"] == 1
+    assert totals["total_tokens"] == 40
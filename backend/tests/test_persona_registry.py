@@ -0,0 +1,68 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.persona_registry import PersonaRegistry
+
+PERSONAS_DIR = Path(__file__).resolve().parents[1] / "personas"
+
+PERSONA_YAML = """
+meta:
+  name: "Ada Lovelace"
+  aliases: ["Countess of Lovelace"]
+  description: >
+    Analytical and {tone}.
+identity:
+  public_role: "Mathematician"
+worldview:
+  ideological_tags: ["poetical science"]
+rhetoric:
+  tone: ["{tone}"]
+"""
+
+
+def _write_persona(directory: Path, tone: str, mtime: float) -> Path:
+    path = directory / "ada_lovelace.yaml"
+    path.write_text(PERSONA_YAML.format(tone=tone), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_personas_resolve_by_name_stem_and_alias(tmp_path):
+    _write_persona(tmp_path, "precise", mtime=1_000)
+    (tmp_path / "broken.yaml").write_text("meta: {name: Nobody}\n", encoding="utf-8")
+    registry = PersonaRegistry(tmp_path, reload_interval_seconds=0)
+
+    persona = registry.get("Ada Lovelace")
+    assert persona is not None
+    assert registry.get("ada-lovelace") is persona
+    assert registry.get("countess_of_lovelace") is persona
+    assert persona.prompt_fragment.startswith("Ada Lovelace: Analytical and precise.")
+    assert "Tone: precise" in persona.prompt_fragment
+    assert persona.prompt_tokens > 0
+    assert [p.key for p in registry.all()] == ["ada_lovelace"]
+
+
+def test_changed_persona_files_are_reloaded(tmp_path):
+    path = _write_persona(tmp_path, "precise", mtime=1_000)
+    registry = PersonaRegistry(tmp_path, reload_interval_seconds=3600)
+    assert "precise" in registry.get("Ada Lovelace").prompt_fragment
+
+    _write_persona(tmp_path, "visionary", mtime=2_000)
+    assert "precise" in registry.get("Ada Lovelace").prompt_fragment
+
+    registry.refresh(force=True)
+    assert "visionary" in registry.get("Ada Lovelace").prompt_fragment
+
+    path.unlink()
+    registry.refresh(force=True)
+    assert registry.get("Ada Lovelace") is None
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["Donald Trump", "Elon Musk", "Greta Thunberg", "Jordan Peterson", "Bassem Youssef", "Jordan Peele"],
+)
+def test_shipped_personas_cover_frontend_names(name):
+    assert PersonaRegistry(PERSONAS_DIR).get(name) is not None
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import yaml
+
+from src.pricing import prompt_cache_report, record_call_usage
+
+TASKS_CONFIG = Path(__file__).resolve().parents[1] / "src" / "config" / "tasks.yaml"
+
+
+class RecordingWriteBuffer:
+    def __init__(self):
+        self.calls = []
+
+    def record_llm_call(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+def test_prompt_cache_report_is_per_model():
+    debate_usage: dict[str, int] = {}
+    usage_by_model: dict[str, dict[str, int]] = {}
+    writes = RecordingWriteBuffer()
+    for model, prompt, cached in (("debater", 1000, 0), ("debater", 1200, 900), ("judge", 800, 0)):
+        record_call_usage(
+            model=model,
+            usage={"prompt_tokens": prompt, "cached_prompt_tokens": cached, "completion_tokens": 50},
+            debate_token_usage=debate_usage,
+            cost_by_model={},
+            debate_id="debate",
+            write_buffer=writes,
+            usage_by_model=usage_by_model,
+        )
+
+    report = prompt_cache_report(usage_by_model)
+
+    assert report["debater"] == {
+        "requests": 2,
+        "prompt_tokens": 2200,
+        "cached_prompt_tokens": 900,
+        "cache_hit_rate": round(900 / 2200, 4),
+    }
+    assert report["judge"]["cache_hit_rate"] == 0.0
+    assert debate_usage["cached_prompt_tokens"] == 900
+    assert len(writes.calls) == 3
+
+
+def test_task_prompts_end_with_the_debate_history():
+    tasks = yaml.safe_load(TASKS_CONFIG.read_text(encoding="utf-8"))
+
+    for name, task in tasks.items():
+        description = task["description"]
+        assert description.count("{history}") == 1, name
+        assert description.rstrip().endswith("{history}"), name
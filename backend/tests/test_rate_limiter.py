@@ -0,0 +1,81 @@
+import uuid
+
+import pytest
+import redis as redis_lib
+
+import app.cache as cache
+from src.rate_limiter import (
+    RATE_LIMIT_DEFAULT_TOKENS_PER_MINUTE,
+    ModelLimits,
+    TokenBucketRateLimiter,
+    _parse_limits,
+    estimate_call_tokens,
+)
+
+
+@pytest.fixture()
+def redis_client():
+    client = redis_lib.Redis(
+        host=cache.REDIS_HOST,
+        port=cache.REDIS_PORT,
+        db=15,
+        decode_responses=True,
+    )
+    try:
+        client.ping()
+    except Exception:
+        pytest.skip("redis not available")
+    client.flushdb()
+    return client
+
+
+def _limiter(client, requests_per_minute: int, tokens_per_minute: int) -> TokenBucketRateLimiter:
+    return TokenBucketRateLimiter(
+        client,
+        limits_for=lambda _model: ModelLimits(requests_per_minute, tokens_per_minute),
+    )
+
+
+def test_buckets_only_delay_when_empty(redis_client):
+    limiter = _limiter(redis_client, requests_per_minute=2, tokens_per_minute=1000)
+    model = f"test/{uuid.uuid4().hex}"
+
+    assert limiter.try_acquire(model, 100) == 0
+    assert limiter.try_acquire(model, 100) == 0
+    # Third request in the same minute: the request bucket refills at 2/min.
+    assert 0 < limiter.try_acquire(model, 100) <= 30_000
+
+
+def test_token_bucket_limits_large_calls(redis_client):
+    limiter = _limiter(redis_client, requests_per_minute=100, tokens_per_minute=600)
+    model = f"test/{uuid.uuid4().hex}"
+
+    assert limiter.try_acquire(model, 500) == 0
+    wait_ms = limiter.try_acquire(model, 300)
+    # 200 missing tokens at 10 tokens/s.
+    assert 19_000 <= wait_ms <= 20_000
+    # Calls bigger than the bucket drain it rather than waiting forever.
+    other_model = f"test/{uuid.uuid4().hex}"
+    assert limiter.try_acquire(other_model, 10_000) == 0
+
+
+def test_rate_limit_error_closes_buckets(redis_client):
+    limiter = _limiter(redis_client, requests_per_minute=100, tokens_per_minute=10_000)
+    model = f"test/{uuid.uuid4().hex}"
+
+    limiter.penalize(model, cooldown_seconds=5)
+
+    assert 4_000 < limiter.try_acquire(model, 10) <= 5_000
+
+
+def test_estimate_call_tokens_counts_prompt_and_completion_reserve():
+    messages = [{"role": "user", "content": "x" * 400}, {"role": "system", "content": None}]
+    assert estimate_call_tokens(messages) == 100 + estimate_call_tokens([])
+
+
+def test_configured_limits_are_parsed():
+    limits = _parse_limits('{"groq/custom": {"requests_per_minute": 5}, "ignored": 3}')
+
+    assert limits == {"groq/custom": ModelLimits(5, RATE_LIMIT_DEFAULT_TOKENS_PER_MINUTE)}
+    assert _parse_limits("not json") == {}
+    assert _parse_limits(None) == {}
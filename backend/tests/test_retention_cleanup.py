@@ -0,0 +1,152 @@
+import os
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+import src.helpers as helpers
+import src.storage as storage
+from app.db.models import DebateMetric, DebateRecord, DebateUsageCall, SessionRecord
+from app.db.session import session_scope
+from app.helpers import debate_helpers
+from src.schemas import DebateTurn, TurnArgument
+
+
+@pytest.fixture()
+def test_db(monkeypatch, tmp_path):
+    db_root = Path("data") / "test-dbs"
+    db_root.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(storage, "DB_PATH", db_root / f"debate-{uuid.uuid4().hex}.db")
+    storage.init_db()
+    monkeypatch.setattr(helpers, "OUTPUT_DIR", tmp_path / "debate_turns")
+
+
+def _add_debate(debate_id: str, created_at: int) -> None:
+    with session_scope() as db:
+        db.add(
+            DebateRecord(
+                debate_id=debate_id,
+                session_id="s1",
+                user_id=None,
+                topic="Topic",
+                debater_1="A",
+                debater_2="B",
+                created_at=created_at,
+                status="completed",
+            )
+        )
+        db.add(
+            DebateUsageCall(
+                debate_id=debate_id,
+                model="m",
+                input_tokens=1,
+                output_tokens=1,
+                cost_usd=0.0,
+                created_at=created_at,
+            )
+        )
+        db.add(
+            DebateMetric(
+                debate_id=debate_id,
+                total_tokens=2,
+                total_cost_usd=0.0,
+                duration_seconds=1,
+                updated_at=created_at,
+            )
+        )
+    turn = DebateTurn(
+        turn_id=f"{debate_id}-turn",
+        debater="A",
+        argument=TurnArgument(type="attack", text="text", confidence=50),
+    )
+    helpers.append_turn(turn, debate_id)
+
+
+def _count(model) -> int:
+    with session_scope() as db:
+        return db.query(model).count()
+
+
+@pytest.mark.usefixtures("test_db")
+def test_purge_old_debates_cascades_in_batches():
+    old = int(time.time()) - 30 * 24 * 60 * 60
+    for index in range(5):
+        _add_debate(f"old-{index}", old)
+    _add_debate("fresh", int(time.time()))
+
+    reclaimed = debate_helpers.purge_old_debates(batch_size=2)
+
+    assert reclaimed == {
+        "debates": 5,
+        "usage_calls": 5,
+        "metrics": 5,
+        "turn_files": 5,
+        "event_archives": 0,
+    }
+    assert _count(DebateRecord) == 1
+    assert _count(DebateUsageCall) == 1
+    assert _count(DebateMetric) == 1
+    assert helpers.turn_log_path("fresh").exists()
+    assert not helpers.turn_log_path("old-0").exists()
+
+
+@pytest.mark.usefixtures("test_db")
+def test_purge_keeps_debates_still_served_by_shared_copies():
+    old = int(time.time()) - 30 * 24 * 60 * 60
+    _add_debate("shared-source", old)
+    _add_debate("unshared", old)
+    with session_scope() as db:
+        db.add(
+            DebateRecord(
+                debate_id="copy",
+                session_id="s2",
+                user_id=None,
+                topic="Topic",
+                debater_1="A",
+                debater_2="B",
+                created_at=int(time.time()),
+                status="completed",
+                shared_from_debate_id="shared-source",
+            )
+        )
+
+    reclaimed = debate_helpers.purge_old_debates()
+
+    assert reclaimed["debates"] == 1
+    with session_scope() as db:
+        assert db.get(DebateRecord, "shared-source") is not None
+        assert db.get(DebateRecord, "unshared") is None
+    assert helpers.turn_log_path("shared-source").exists()
+
+
+@pytest.mark.usefixtures("test_db")
+def test_run_retention_cleanup_reports_orphans_and_sessions():
+    now = int(time.time())
+    _add_debate("orphaned", now)
+    with session_scope() as db:
+        db.query(DebateRecord).filter(DebateRecord.debate_id == "orphaned").delete()
+        db.add(
+            SessionRecord(
+                session_id="expired",
+                user_id=None,
+                created_at=now - 100,
+                expires_at=now - 10,
+                last_seen_at=now - 100,
+            )
+        )
+    stale_path = helpers.turn_log_path("orphaned")
+    stale_time = now - 30 * 24 * 60 * 60
+    os.utime(stale_path, (stale_time, stale_time))
+
+    reclaimed = debate_helpers.run_retention_cleanup(batch_size=1)
+
+    assert reclaimed == {
+        "sessions": 1,
+        "debates": 0,
+        "usage_calls": 1,
+        "metrics": 1,
+        "turn_files": 1,
+        "event_archives": 0,
+    }
+    assert _count(SessionRecord) == 0
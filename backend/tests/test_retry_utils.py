@@ -1,6 +1,15 @@
+import asyncio
+import time
+
 import pytest
 
-from src.retry_utils import call_with_retry, is_rate_limit_error, is_retriable_error
+from src.executor import run_blocking
+from src.retry_utils import (
+    call_with_retry,
+    call_with_retry_async,
+    is_rate_limit_error,
+    is_retriable_error,
+)
 
 
 class HttpError(Exception):
@@ -72,3 +81,46 @@ def test_call_with_retry_stops_on_non_retriable_error() -> None:
         )
 
     assert attempts["count"] == 1
+
+
+def test_call_with_retry_async_retries_blocking_operation() -> None:
+    attempts = {"count": 0}
+
+    def flaky_operation(value: str) -> str:
+        attempts["count"] += 1
+        if attempts["count"] < 3:
+            raise TimeoutError("operation timed out")
+        return value
+
+    result = asyncio.run(
+        call_with_retry_async(
+            operation=lambda: run_blocking(flaky_operation, "ok"),
+            operation_name="flaky_operation",
+            max_attempts=4,
+            initial_wait_seconds=0,
+            max_wait_seconds=0,
+        )
+    )
+
+    assert result == "ok"
+    assert attempts["count"] == 3
+
+
+def test_blocking_operations_do_not_stall_the_event_loop() -> None:
+    async def scenario() -> float:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                call_with_retry_async(
+                    operation=lambda: run_blocking(time.sleep, 0.2),
+                    operation_name="slow_operation",
+                    max_attempts=2,
+                    initial_wait_seconds=0,
+                    max_wait_seconds=0,
+                )
+                for _ in range(3)
+            )
+        )
+        return time.perf_counter() - started
+
+    assert asyncio.run(scenario()) < 0.5
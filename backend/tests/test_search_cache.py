@@ -0,0 +1,139 @@
+import uuid
+
+import pytest
+import redis as redis_lib
+
+import app.cache as cache
+import src.search_cache as search_cache_module
+from src.events import current_debate_id
+from src.helpers import topic_search_queries
+from src.search_backends import NO_RESULTS, FixtureSearchBackend, WarmSearchCorpus
+from src.search_cache import (
+    SearchCache,
+    discard_warm_corpus,
+    get_search_cache_stats,
+    normalize_query,
+    register_warm_corpus,
+    search_web,
+)
+from src.tools.search_tool import WebSearchTool
+
+
+@pytest.fixture()
+def redis_client():
+    client = redis_lib.Redis(
+        host=cache.REDIS_HOST,
+        port=cache.REDIS_PORT,
+        db=15,
+        decode_responses=True,
+    )
+    try:
+        client.ping()
+    except Exception:
+        pytest.skip("redis not available")
+    client.flushdb()
+    return client
+
+
+class FailingBackend:
+    def __init__(self):
+        self.calls = 0
+
+    def search(self, query: str) -> str:
+        self.calls += 1
+        raise TimeoutError("web search timed out")
+
+
+def test_normalized_queries_share_both_cache_tiers(redis_client):
+    topic = uuid.uuid4().hex
+    backend = FixtureSearchBackend({f"{topic} regulation": "snippet"})
+    worker_a = SearchCache(client=redis_client)
+    worker_b = SearchCache(client=redis_client)
+
+    assert search_web(f"{topic} regulation", backend=backend, cache=worker_a) == "snippet"
+    assert search_web(f"  {topic.upper()}   Regulation? ", backend=backend, cache=worker_a) == "snippet"
+    assert search_web(f"{topic} regulation", backend=backend, cache=worker_b) == "snippet"
+
+    assert backend.calls == 1
+    worker_a.flush_stats()
+    worker_b.flush_stats()
+    stats = get_search_cache_stats(redis_client)
+    assert (stats["misses"], stats["local_hits"], stats["shared_hits"]) == (1, 1, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_search_errors_are_cached_with_short_ttl(redis_client):
+    backend = FailingBackend()
+    search_cache = SearchCache(client=redis_client, ttl_seconds=3600, error_ttl_seconds=5)
+
+    first = search_web("outage query", backend=backend, cache=search_cache)
+    second = search_web("outage query", backend=backend, cache=search_cache)
+
+    assert first == second
+    assert first.startswith("Error searching the web")
+    assert backend.calls == 1
+    assert 0 < redis_client.ttl(SearchCache._redis_key(normalize_query("outage query"))) <= 5
+    assert get_search_cache_stats(redis_client)["errors"] == 1
+
+
+def test_fixture_backend_falls_back_to_closest_entry():
+    backend = FixtureSearchBackend({"AI regulation Europe": "eu snippet", "climate policy": "climate"})
+
+    assert backend.search("ai  REGULATION europe") == "eu snippet"
+    assert backend.search("latest climate news") == "climate"
+    assert backend.search("unrelated") == NO_RESULTS
+
+
+def test_specific_query_mentioning_the_topic_is_not_served_the_topic_prefetch():
+    corpus = WarmSearchCorpus({"AI regulation": "topic snippet"}, min_overlap=0.6)
+
+    assert corpus.lookup("AI regulation") == "topic snippet"
+    assert corpus.lookup("EU AI regulation fines for open source models") is None
+
+
+def test_prefetched_topic_searches_answer_the_tool(redis_client, monkeypatch):
+    monkeypatch.setattr(search_cache_module, "redis_client", redis_client)
+    monkeypatch.setattr(search_cache_module, "_search_cache", SearchCache(client=redis_client))
+    debate_id = uuid.uuid4().hex
+    queries = topic_search_queries("AI regulation", "elon_musk", "sam_altman", limit=4)
+    assert queries[0] == "AI regulation"
+    assert len(queries) == 4
+    register_warm_corpus(
+        debate_id,
+        {"AI regulation": "topic snippet", "AI regulation statistics and data": "stats snippet"},
+    )
+    backend = FixtureSearchBackend(
+        {"quantum computing": "live snippet", "open source models fines": "fines snippet"}
+    )
+    tool = WebSearchTool(backend=backend)
+
+    token = current_debate_id.set(debate_id)
+    try:
+        assert tool._run("latest statistics on AI regulation and data") == "stats snippet"
+        assert tool._run("quantum computing") == "live snippet"
+        # A specific query that mentions the topic still searches live.
+        assert tool._run("EU AI regulation fines for open source models") == "fines snippet"
+    finally:
+        current_debate_id.reset(token)
+        discard_warm_corpus(debate_id)
+
+    assert backend.calls == 2
+    assert get_search_cache_stats(redis_client)["warm_hits"] == 1
+    # Other debates never see this debate's prefetch.
+    assert tool._run("AI regulation statistics and data") != "stats snippet"
+
+
+def test_local_hits_are_counted_without_a_redis_call(redis_client):
+    search_cache = SearchCache(client=redis_client, stats_flush_seconds=3600)
+    backend = FixtureSearchBackend({"local hits": "snippet"})
+    search_web("local hits", backend=backend, cache=search_cache)
+
+    commands = []
+    redis_client.execute_command = lambda *args, **options: commands.append(args)
+    for _ in range(3):
+        assert search_web("local hits", backend=backend, cache=search_cache) == "snippet"
+    del redis_client.execute_command
+
+    assert commands == []
+    search_cache.flush_stats()
+    assert get_search_cache_stats(redis_client)["local_hits"] == 3
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+import src.helpers as helpers
+from src.schemas import DebateTurn, TurnArgument
+
+
+@pytest.fixture(autouse=True)
+def turn_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(helpers, "OUTPUT_DIR", tmp_path / "debate_turns")
+    return tmp_path / "debate_turns"
+
+
+def _turn(turn_id: str) -> DebateTurn:
+    return DebateTurn(
+        turn_id=turn_id,
+        debater="A",
+        argument=TurnArgument(type="attack", text=f"text {turn_id}", confidence=50),
+    )
+
+
+def test_append_turn_appends_lines_and_skips_duplicates():
+    for turn_id in ["t1", "t2", "t1", "t3"]:
+        helpers.append_turn(_turn(turn_id), "debate")
+
+    lines = helpers.turn_log_path("debate").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["turn_id"] for line in lines] == ["t1", "t2", "t3"]
+
+    # A reopened log rebuilds its turn id index from the file.
+    helpers.close_turn_log("debate")
+    helpers.append_turn(_turn("t2"), "debate")
+    helpers.append_turn(_turn("t4"), "debate")
+    helpers.close_turn_log("debate")
+    assert [turn.turn_id for turn in helpers.iter_turns("debate")] == ["t1", "t2", "t3", "t4"]
+
+
+def test_iter_turns_skips_torn_last_line():
+    helpers.append_turn(_turn("t1"), "debate")
+    helpers.close_turn_log("debate")
+    with helpers.turn_log_path("debate").open("a", encoding="utf-8") as handle:
+        handle.write('{"turn_id": "t2", "debater"')
+
+    assert [turn.turn_id for turn in helpers.iter_turns("debate")] == ["t1"]
+
+
+def test_migrate_legacy_turn_logs(turn_dir):
+    turn_dir.mkdir(parents=True)
+    legacy = [_turn("t1").model_dump(), _turn("t2").model_dump(), _turn("t1").model_dump()]
+    helpers.legacy_turn_log_path("old").write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+
+    assert [turn.turn_id for turn in helpers.iter_turns("old")] == ["t1", "t2", "t1"]
+    assert helpers.migrate_legacy_turn_logs() == 1
+
+    assert not helpers.legacy_turn_log_path("old").exists()
+    assert [turn.turn_id for turn in helpers.iter_turns("old")] == ["t1", "t2"]
+    assert helpers.migrate_legacy_turn_logs() == 0
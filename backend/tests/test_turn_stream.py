@@ -0,0 +1,110 @@
+import json
+import uuid
+
+import pytest
+import redis as redis_lib
+from crewai.events import LLMStreamChunkEvent
+from crewai.events.event_bus import crewai_event_bus
+
+import app.cache as cache
+import src.events as events
+from app.event_hub import turn_delta_stream
+
+
+@pytest.fixture()
+def redis_client(monkeypatch):
+    client = redis_lib.Redis(
+        host=cache.EVENTS_REDIS_HOST,
+        port=cache.EVENTS_REDIS_PORT,
+        db=15,
+        decode_responses=True,
+    )
+    try:
+        client.ping()
+    except Exception:
+        pytest.skip("redis not available")
+    client.flushdb()
+    monkeypatch.setattr(events, "events_redis_client", client)
+    return client
+
+
+def _deltas(client, debate_id: str) -> list[dict]:
+    entries = client.xrange(turn_delta_stream(debate_id))
+    return [json.loads(fields["data"]) for _, fields in entries]
+
+
+def test_turn_deltas_are_coalesced(redis_client):
+    debate_id = uuid.uuid4().hex
+    publisher = events.TurnDeltaPublisher(
+        debate_id,
+        "Debater A",
+        "turn-1",
+        flush_interval_seconds=60,
+        flush_chars=10,
+    )
+
+    publisher.add('Thought: I now know the final answer\nFinal Answer: {"argument": {"text": "')
+    for chunk in ["First", " a", "b", "c", "d", "e", "f", "g", "h", "i", "j", " tail", '", "type": "attack"}}']:
+        publisher.add(chunk)
+    publisher.flush()
+
+    deltas = _deltas(redis_client, debate_id)
+    assert [delta["delta"] for delta in deltas] == ["First", " abcdefghi", "j tail"]
+    assert [delta["seq"] for delta in deltas] == [0, 1, 2]
+    assert {delta["turn_id"] for delta in deltas} == {"turn-1"}
+
+
+def test_stream_chunks_route_to_current_turn(redis_client):
+    debate_id = uuid.uuid4().hex
+    publisher = events.TurnDeltaPublisher(debate_id, "Debater A", "turn-1")
+
+    crewai_event_bus.emit(None, LLMStreamChunkEvent(chunk="ignored"))
+    token = events.current_turn_stream.set(publisher)
+    try:
+        crewai_event_bus.emit(None, LLMStreamChunkEvent(chunk='{"argument": {"text": "Hello'))
+    finally:
+        events.current_turn_stream.reset(token)
+
+    assert [delta["delta"] for delta in _deltas(redis_client, debate_id)] == ["Hello"]
+    assert redis_client.xlen(f"debate:{debate_id}") == 0
+
+
+def _feed(chunks: list[str]) -> str:
+    answer = events.FinalAnswerText()
+    return "".join(answer.feed(chunk) for chunk in chunks)
+
+
+def test_final_answer_text_skips_react_framing():
+    response = (
+        "Thought: I now know the final answer\n"
+        'Final Answer: ```json\n{"argument": {"type": "attack", "text": "Say \\"no\\"\\n\\u00e9\\ud83d\\ude00 end", '
+        '"confidence": 80}}\n```'
+    )
+    # Split everywhere, including inside escapes and the marker.
+    assert _feed(list(response)) == 'Say "no"\n\u00e9\U0001F600 end'
+    assert _feed([response]) == 'Say "no"\n\u00e9\U0001F600 end'
+
+
+def test_final_answer_text_drops_tool_calls_and_passes_plain_answers():
+    assert _feed(['Thought: I need a fact.\nAction: search\nAction Input: {"query": "x"}']) == ""
+    assert _feed(["Final Answer: ", "Plain ", "prose."]) == "Plain prose."
+
+
+def test_new_llm_call_restarts_the_turn_text(redis_client):
+    debate_id = uuid.uuid4().hex
+    publisher = events.TurnDeltaPublisher(debate_id, "Debater A", "turn-1")
+
+    token = events.current_turn_stream.set(publisher)
+    try:
+        events._on_llm_call_start(None)
+        publisher.add('Thought: search first\nAction: search\nAction Input: {"query": "x"}')
+        events._on_llm_call_start(None)
+        publisher.add('Final Answer: {"argument": {"text": "One')
+        events._on_llm_call_start(None)
+        publisher.add('Final Answer: {"argument": {"text": "Two')
+    finally:
+        events.current_turn_stream.reset(token)
+    publisher.flush()
+
+    deltas = _deltas(redis_client, debate_id)
+    assert [(delta["seq"], delta["delta"]) for delta in deltas] == [(0, "One"), (0, "Two")]
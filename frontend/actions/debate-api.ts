@@ -33,6 +33,7 @@ type DebateListResponse = {
         }>;
         duration_seconds: number;
     }>;
+    next_cursor: string | null;
 }
 
 type DebateAnalyticsResponse = {
@@ -42,9 +43,20 @@ type DebateAnalyticsResponse = {
     total_duration_seconds: number;
 }
 
+type DebaterListResponse = {
+    debaters: Array<{
+        id: string;
+        name: string;
+        description: string;
+        aliases: string[];
+        prompt_tokens: number;
+    }>;
+}
+
 type DebateOverviewResponse = {
     analytics: DebateAnalyticsResponse;
     debates: DebateListResponse["debates"];
+    next_cursor: string | null;
 }
 
 /**
@@ -113,9 +125,23 @@ export function buildDebateEventsUrlWithIdentity(
     return `${getApiBaseUrl()}/debate/${debateId}/events?${params.toString()}`;
 }
 
+export async function listDebaters(): Promise<DebaterListResponse> {
+    const response = await fetch(`${getApiBaseUrl()}/debaters`);
+    if (!response.ok) {
+        throw new Error(`Failed to list debaters: ${response.statusText}`);
+    }
+    return response.json();
+}
+
+/**
+ * Lists one page of the caller's debates, newest first.
+ *
+ * @param cursor - `next_cursor` from the previous page; omit for the first page
+ */
 export async function listDebates(
     sessionId: string,
-    userId?: string | null
+    userId?: string | null,
+    cursor?: string | null
 ): Promise<DebateListResponse> {
     if (!sessionId || sessionId.trim().length === 0) {
         throw new Error("sessionId is required to list debates");
@@ -124,6 +150,9 @@ export async function listDebates(
     if (userId) {
         params.set("user_id", userId);
     }
+    if (cursor) {
+        params.set("cursor", cursor);
+    }
     const response = await fetch(`${getApiBaseUrl()}/debates?${params.toString()}`);
     if (!response.ok) {
         throw new Error(`Failed to list debates: ${response.statusText}`);
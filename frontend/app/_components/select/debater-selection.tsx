@@ -3,7 +3,7 @@
 import { motion } from 'framer-motion';
 import { useMemo } from 'react';
 import DebaterCard from './debater-card';
-import { DEBATERS_AVAILABLE } from '@/constants/debater-constant';
+import { useAvailableDebaters } from '@/hooks/useAvailableDebaters';
 import { DebaterProfile } from '@/types/debate-selection';
 
 type Props = {
@@ -13,11 +13,12 @@ type Props = {
 };
 
 const DebaterSelection = ({ selectionStep, selectedDebater, onDebaterSelection }: Props) => {
+    const debaters = useAvailableDebaters();
     const available = useMemo(() => {
         return selectionStep === 'debater2'
-            ? DEBATERS_AVAILABLE.filter(debater => debater.id !== selectedDebater?.id)
-            : DEBATERS_AVAILABLE;
-    }, [selectionStep, selectedDebater]);
+            ? debaters.filter(debater => debater.id !== selectedDebater?.id)
+            : debaters;
+    }, [debaters, selectionStep, selectedDebater]);
 
     const isFirst = selectionStep === 'debater1';
 
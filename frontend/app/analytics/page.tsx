@@ -1,7 +1,7 @@
 "use client";
 
 import { useEffect, useMemo, useState } from "react";
-import { getDebateOverview } from "@/actions/debate-api";
+import { getDebateOverview, listDebates } from "@/actions/debate-api";
 import { useClientSessionId } from "@/hooks/useClientSessionId";
 import { useAuth } from "@/contexts/auth-context";
 import type { DebateListItem, DebateMetricsSummary } from "@/types/debate-analytics";
@@ -26,6 +26,8 @@ const AnalyticsPage = () => {
 
     const [summary, setSummary] = useState<DebateMetricsSummary | null>(null);
     const [debates, setDebates] = useState<DebateListItem[]>([]);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [error, setError] = useState<string | null>(null);
     const [loading, setLoading] = useState(true);
     const [activeSummaryDebate, setActiveSummaryDebate] = useState<DebateListItem | null>(null);
@@ -41,6 +43,7 @@ const AnalyticsPage = () => {
                 if (cancelled) return;
                 setSummary(overview.analytics);
                 setDebates(overview.debates ?? []);
+                setNextCursor(overview.next_cursor ?? null);
             })
             .catch((err) => {
                 if (cancelled) return;
@@ -56,6 +59,22 @@ const AnalyticsPage = () => {
         };
     }, [sessionId, userId]);
 
+    const loadMore = () => {
+        if (!sessionId || !nextCursor || loadingMore) return;
+        setLoadingMore(true);
+        listDebates(sessionId, userId, nextCursor)
+            .then((page) => {
+                setDebates((current) => [...current, ...page.debates]);
+                setNextCursor(page.next_cursor ?? null);
+            })
+            .catch((err) => {
+                setError(err?.message ?? "Failed to load more debates.");
+            })
+            .finally(() => {
+                setLoadingMore(false);
+            });
+    };
+
     const kpis = useMemo(() => {
         const base = summary ?? {
             debate_count: 0,
@@ -208,6 +227,18 @@ const AnalyticsPage = () => {
                             </tbody>
                         </table>
                     </div>
+                    {nextCursor && (
+                        <div className="mt-4 flex justify-center">
+                            <button
+                                type="button"
+                                onClick={loadMore}
+                                disabled={loadingMore}
+                                className="rounded-md border border-slate-700 px-4 py-2 text-xs text-slate-300 transition hover:border-slate-500 hover:text-slate-100 disabled:opacity-50"
+                            >
+                                {loadingMore ? "Loading..." : "Load more"}
+                            </button>
+                        </div>
+                    )}
                 </section>
             </div>
             {activeSummaryDebate && (
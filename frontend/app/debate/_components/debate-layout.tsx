@@ -4,16 +4,18 @@ import DebateRuntimeOverlays from "./debate_layout/debate-runtime-overlays";
 import DebatePresenter from "./debate-presenter";
 import type { DebateData } from "@/types/debate";
 import type { DebateEngine } from "@/hooks/useDebateEngine";
+import type { LiveTurn } from "@/types/debate-event";
 
 
 
 type DebateLayoutProps = {
     debate: DebateData;
     engine: DebateEngine;
+    liveTurn: LiveTurn | null;
 };
 
 
-const DebateLayout = ({ debate, engine }: DebateLayoutProps) => {
+const DebateLayout = ({ debate, engine, liveTurn }: DebateLayoutProps) => {
     const vm = useDebateViewModel(debate, engine);
 
     return (
@@ -48,6 +50,7 @@ const DebateLayout = ({ debate, engine }: DebateLayoutProps) => {
                 judges={vm.judges}
                 isJudging={vm.isJudging}
                 winner={vm.winner}
+                liveTurn={liveTurn}
             />
         </div>
     );
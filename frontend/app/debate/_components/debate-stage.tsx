@@ -22,7 +22,7 @@ const EMPTY_DEBATE: DebateData = {
 
 const DebateStage = () => {
     const { config, debateId, sessionId, userId } = useDebateSession();
-    const { messages, close } = useDebateStream(debateId, sessionId, userId);
+    const { messages, liveTurn, close } = useDebateStream(debateId, sessionId, userId);
     const [isDebateFinished, setIsDebateFinished] = useState(false);
 
     // Always provide stable config to hooks
@@ -62,6 +62,7 @@ const DebateStage = () => {
             <DebateLayout
                 debate={enrichedDebate}
                 engine={engine}
+                liveTurn={liveTurn}
             />
         </div>
     );
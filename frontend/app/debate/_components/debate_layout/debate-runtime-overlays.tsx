@@ -1,7 +1,10 @@
 import DebaterSpeechOverlay from "../debater_speech_overlay/debater-speech-overlay";
+import LiveTurnOverlay from "../debater_speech_overlay/live-turn-overlay";
 import JudgePanel from "../judge/judge-panel";
 import CardDetailModal from "../card-detail-modal";
 import type { DebateData, Judge } from "@/types/debate";
+import type { LiveTurn } from "@/types/debate-event";
+import { getDebaterSide } from "@/hooks/debateEngine/stream";
 import type { PlayedCard } from "@/hooks/debateEngine/types";
 import type { Side } from "@/types/type_d";
 import type { StateValue } from "xstate";
@@ -24,6 +27,7 @@ type DebateRuntimeOverlaysProps = {
     judges: Judge[];
     isJudging: boolean;
     winner: string | null;
+    liveTurn: LiveTurn | null;
 }
 
 const DebateRuntimeOverlays = ({
@@ -32,9 +36,17 @@ const DebateRuntimeOverlays = ({
     judges,
     isJudging,
     winner,
+    liveTurn,
 }: DebateRuntimeOverlaysProps) => {
     return (
         <>
+            {/* Turn still being generated */}
+            <LiveTurnOverlay
+                text={engine.phase === "speaking" ? null : liveTurn?.text ?? null}
+                debaterName={liveTurn?.agent ?? ""}
+                debaterSide={getDebaterSide(debate, liveTurn?.agent)}
+            />
+
             {/* Speech Overlay */}
             {engine.currentArgument && (
                 <DebaterSpeechOverlay
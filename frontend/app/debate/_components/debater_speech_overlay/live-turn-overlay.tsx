@@ -0,0 +1,37 @@
+import { AnimatePresence, motion } from "framer-motion";
+import SpeakerHeader from "./speaker-header";
+import SpeechBubble from "./speech-bubble";
+import type { SpeechSide } from "./debater-speech-overlay";
+
+type LiveTurnOverlayProps = {
+    text: string | null;
+    debaterName: string;
+    debaterSide: SpeechSide;
+}
+
+// Shows a turn while the debater's model is still writing it; the finished
+// turn is then played by DebaterSpeechOverlay.
+const LiveTurnOverlay = ({ text, debaterName, debaterSide }: LiveTurnOverlayProps) => {
+    return (
+        <AnimatePresence>
+            {text && (
+                <motion.div
+                    className="fixed inset-x-0 bottom-0 z-40 pointer-events-none"
+                    initial={{ y: 100, opacity: 0 }}
+                    animate={{ y: 0, opacity: 1 }}
+                    exit={{ y: 50, opacity: 0 }}
+                    transition={{ type: "spring", stiffness: 200, damping: 25 }}
+                >
+                    <div className="absolute inset-0 bg-linear-to-t from-slate-950 via-slate-950/95 to-transparent" />
+
+                    <div className="relative mx-auto max-w-4xl px-8 pb-8 pt-12">
+                        <SpeakerHeader name={debaterName} side={debaterSide} isTyping />
+                        <SpeechBubble text={text} side={debaterSide} isTyping />
+                    </div>
+                </motion.div>
+            )}
+        </AnimatePresence>
+    );
+}
+
+export default LiveTurnOverlay;
@@ -1,5 +1,8 @@
 import { DebaterProfile } from "@/types/debate-selection";
 
+// Presentation details for known personas. The list of debaters itself comes
+// from the backend (/debaters); these entries are used as fallbacks and to
+// style debaters the API returns.
 export const DEBATERS_AVAILABLE: DebaterProfile[] = [
     {
         id: 'donald-trump',
@@ -87,3 +90,31 @@ export const DEBATERS_AVAILABLE: DebaterProfile[] = [
     }
 
 ];
+
+const normalizeName = (name: string) =>
+    name.toLowerCase().replace(/[\s_.-]+/g, ' ').trim();
+
+export function toDebaterProfile(debater: { id: string; name: string; description: string; aliases: string[] }): DebaterProfile {
+    const names = [debater.id, debater.name, ...debater.aliases].map(normalizeName);
+    const preset = DEBATERS_AVAILABLE.find(
+        profile => names.includes(normalizeName(profile.name)) || names.includes(normalizeName(profile.id))
+    );
+    if (preset) {
+        return preset;
+    }
+    return {
+        id: debater.id,
+        name: debater.name,
+        title: 'Debater',
+        ideology: debater.description,
+        // New personas ship their portrait as /assets/<persona file stem>.png.
+        avatar: `/assets/${debater.id}.png`,
+        hairColor: 'bg-stone-500',
+        suitColor: 'bg-slate-800',
+        skinTone: 'bg-stone-200',
+        specialty: 'Debate',
+        catchphrase: '',
+        stats: { logic: 70, charisma: 70, aggression: 50, wit: 70 },
+        bio: debater.description,
+    };
+}
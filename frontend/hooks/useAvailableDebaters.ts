@@ -0,0 +1,28 @@
+"use client";
+
+import { useEffect, useState } from "react";
+import { listDebaters } from "@/actions/debate-api";
+import { DEBATERS_AVAILABLE, toDebaterProfile } from "@/constants/debater-constant";
+import { DebaterProfile } from "@/types/debate-selection";
+
+export const useAvailableDebaters = (): DebaterProfile[] => {
+    const [debaters, setDebaters] = useState<DebaterProfile[]>(DEBATERS_AVAILABLE);
+
+    useEffect(() => {
+        let cancelled = false;
+        listDebaters()
+            .then(({ debaters: available }) => {
+                if (!cancelled && available.length > 0) {
+                    setDebaters(available.map(toDebaterProfile));
+                }
+            })
+            .catch((error) => {
+                console.error("Failed to load debaters", error);
+            });
+        return () => {
+            cancelled = true;
+        };
+    }, []);
+
+    return debaters;
+};
@@ -1,5 +1,5 @@
 import { useEffect, useState, useCallback, useRef } from "react";
-import { DebateEvent } from "@/types/debate-event";
+import { DebateEvent, LiveTurn } from "@/types/debate-event";
 import { buildDebateEventsUrlWithIdentity } from "@/actions/debate-api";
 import {
     createEventSource,
@@ -11,6 +11,7 @@ import { parseDebateEvent, isValidDebateEvent } from "@/lib/sse/event-parser";
 
 interface UseDebateStreamReturn {
     messages: DebateEvent[];
+    liveTurn: LiveTurn | null;
     isConnected: boolean;
     error: Event | null;
     close: () => void;
@@ -22,16 +23,49 @@ const CUSTOM_EVENT_TYPES = [
     "agent_response",
     "data",
     "agent_done",
+    "turn_done",
+    "judge_verdict_done",
     "presenter_intro_done",
     "presenter_conclusion_done",
 ];
 
+type TurnDelta = {
+    agent?: string;
+    turn_id?: string;
+    seq?: number;
+    delta?: string;
+};
+
+// A debater's turn_done carries the same turn as its agent_done, with the
+// turn id set; once an agent has one, its agent_done events are dropped.
+const addTurnEvent = (prev: DebateEvent[], event: DebateEvent, turnDoneAgents: Set<string>) => {
+    const agent = event.agent ?? "";
+    if (event.event === "agent_done" && turnDoneAgents.has(agent)) return prev;
+    if (event.event !== "turn_done") return [...prev, event];
+
+    turnDoneAgents.add(agent);
+    let replaced = -1;
+    for (let i = prev.length - 1; i >= 0; i -= 1) {
+        if (prev[i].event === "agent_done" && prev[i].agent === agent) {
+            replaced = i;
+            break;
+        }
+    }
+    if (replaced < 0) return [...prev, event];
+    return [...prev.slice(0, replaced), event, ...prev.slice(replaced + 1)];
+};
+
+// The server ends the stream after these; closing here stops EventSource
+// from reconnecting to a finished debate.
+const TERMINAL_EVENT_TYPES = ["debate_completed", "debate_failed"];
+
 export const useDebateStream = (
     debateId: string | null,
     sessionId: string | null,
     userId?: string | null
 ): UseDebateStreamReturn => {
     const [messages, setMessages] = useState<DebateEvent[]>([]);
+    const [liveTurn, setLiveTurn] = useState<LiveTurn | null>(null);
     const [isConnected, setIsConnected] = useState(false);
     const [error, setError] = useState<Event | null>(null);
     const eventSourceRef = useRef<EventSource | null>(null);
@@ -47,7 +81,10 @@ export const useDebateStream = (
         if (!debateId || !sessionId) return;
 
         setMessages([]);
+        setLiveTurn(null);
         setError(null);
+        const turnDoneAgents = new Set<string>();
+        const doneTurnIds = new Set<string>();
 
         const url = buildDebateEventsUrlWithIdentity(debateId, sessionId, userId ?? null);
         const es = createEventSource(url);
@@ -59,11 +96,41 @@ export const useDebateStream = (
             console.log("[SSE] parsed", parsed);
             if (isValidDebateEvent(parsed)) {
                 console.log("[SSE] accepted", parsed);
-                setMessages((prev) => [...prev, parsed]);
+                if (parsed.event === "turn_done" && parsed.turn_id) {
+                    doneTurnIds.add(parsed.turn_id);
+                }
+                if (parsed.event === "turn_done" || parsed.event === "agent_done") {
+                    setLiveTurn((current) =>
+                        current && (current.turnId === parsed.turn_id || current.agent === parsed.agent)
+                            ? null
+                            : current
+                    );
+                }
+                setMessages((prev) => addTurnEvent(prev, parsed, turnDoneAgents));
+            }
+        };
+
+        // Deltas only feed the partial turn; seq 0 means the text starts over.
+        const handleTurnDelta = (event: MessageEvent) => {
+            let delta: TurnDelta;
+            try {
+                delta = JSON.parse(event.data);
+            } catch {
+                return;
             }
+            const turnId = delta.turn_id;
+            if (!turnId || doneTurnIds.has(turnId) || typeof delta.delta !== "string") return;
+            const text = delta.delta;
+            setLiveTurn((current) =>
+                current?.turnId === turnId && delta.seq !== 0
+                    ? { ...current, text: current.text + text }
+                    : { turnId, agent: delta.agent ?? "", text }
+            );
         };
 
         registerEventListeners(es, CUSTOM_EVENT_TYPES, handleMessage);
+        es.addEventListener("turn_delta", handleTurnDelta);
+        TERMINAL_EVENT_TYPES.forEach((eventType) => es.addEventListener(eventType, close));
 
         registerLifecycleHandlers(
             es,
@@ -74,5 +141,5 @@ export const useDebateStream = (
         return close;
     }, [debateId, sessionId, userId, close]);
 
-    return { messages, isConnected, error, close };
+    return { messages, liveTurn, isConnected, error, close };
 }
@@ -40,3 +40,10 @@ export interface DebateEvent {
     winner_weakness?: string;
     rubric_score?: Record<string, number[]>;
 }
+
+// Text of the debater turn being generated, built from turn_delta events.
+export interface LiveTurn {
+    turnId: string;
+    agent: string;
+    text: string;
+}